@@ -2,13 +2,31 @@ from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
-import tensorflow as tf
 
 from aegis_game.stub import *
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+# The agent's directory, agents run from the project directory
+AGENT_DIRECTORY = Path("agents/agent_prediction")
+# Model files to look for, in order of preference
+MODEL_FILES = ("trained_net.npz", "trained_net.keras")
+
+
+def find_model_file() -> str | None:
+    """
+    Find the model file to predict with.
+
+    Model files are named relative to the agent's directory, as the game expects
+    them. A model exported with `aegis export` runs without loading TensorFlow, so
+    it is preferred.
+    """
+    for name in MODEL_FILES:
+        if (AGENT_DIRECTORY / name).exists():
+            return name
+    return None
+
 
 def think() -> None:
     """Do not remove this function, it must always be defined."""
@@ -26,27 +44,20 @@ def think() -> None:
     cell: CellInfo = get_cell_info_at(get_location())
 
     # If there is a pending prediction from a save survivor for our team, predict!
-    prediction_info = read_pending_predictions()
-    if prediction_info:
+    model_file = find_model_file()
+    if model_file is None:
+        log("Model not found, skipping prediction")
+        model_predictions = []
+    else:
+        # The game runs the model over all of the team's pending images in one
+        # batch and shares the outputs with the rest of the team
+        model_predictions = read_model_predictions(model_file)
+
+    if model_predictions:
         # grab just the first pending prediction
-        surv_saved_id, image_to_predict, _ = prediction_info[0]
-
-        # Get the path to the model file in the agent's directory
-        model_path = Path("agents/agent_prediction/trained_net.keras")
-        if not model_path.exists():
-            log("Model not found, skipping prediction")
-            return
-
-        # Load the model and make prediction like in the example
-        model = tf.keras.models.load_model(str(model_path))
-        # Reshape the image for the model (similar to the example)
-        image = np.reshape(image_to_predict, (28, 28))
-        image = np.reshape(image, (1, 28, 28))
-
-        # Make prediction
-        predictions = model(image)
-        predicted_label = cast(np.int32, np.argmax(predictions[0]))
-        confidence = float(np.max(predictions[0]))
+        surv_saved_id, output = model_predictions[0]
+        predicted_label = cast(np.int32, np.argmax(output))
+        confidence = float(np.max(output))
 
         log(f"Predicted symbol: {predicted_label} with confidence: {confidence:.4f}")
 
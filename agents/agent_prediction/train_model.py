@@ -60,7 +60,8 @@ def train_model() -> None:
         validation_split=0.2,
     )
 
-    # Save model
+    # Save model, run `aegis export --model trained_net.keras` to use it without
+    # TensorFlow
     model.save("trained_net.keras")
 
 
@@ -46,23 +46,51 @@ export default class World {
       this.layerRemovals.push(loc)
     }
 
+    // Replays recorded before health updates were batched
     for (const survHealth of round.survivorHealthUpdates) {
-      const cell = this.cellAt(survHealth.location!.x, survHealth.location!.y)!
-      for (const layer of cell.layers) {
-        if (
-          layer.object.oneofKind === "survivor" &&
-          layer.object.survivor.id === survHealth.survivorId
-        ) {
-          layer.object.survivor.health = survHealth.newHealth
-          layer.object.survivor.state = survHealth.newState
-          break
-        }
+      this.setSurvivorHealth(
+        survHealth.location!.x,
+        survHealth.location!.y,
+        survHealth.survivorId,
+        survHealth.newHealth
+      )
+    }
+
+    const batch = round.survivorHealth
+    if (batch) {
+      for (let i = 0; i < batch.survivorIds.length; i++) {
+        this.setSurvivorHealth(
+          batch.xs[i],
+          batch.ys[i],
+          batch.survivorIds[i],
+          batch.newHealth[i]
+        )
       }
     }
 
     this.droneScans = round.droneScans
   }
 
+  /**
+   * Updates the health of a survivor, it is dead once its health reaches 0.
+   *
+   * @param {number} x - The x coordinate of the survivor's cell.
+   * @param {number} y - The y coordinate of the survivor's cell.
+   * @param {number} id - The id of the survivor.
+   * @param {number} health - The new health of the survivor.
+   */
+  private setSurvivorHealth(x: number, y: number, id: number, health: number): void {
+    const cell = this.cellAt(x, y)!
+    for (const layer of cell.layers) {
+      if (layer.object.oneofKind === "survivor" && layer.object.survivor.id === id) {
+        layer.object.survivor.health = health
+        layer.object.survivor.state =
+          health > 0 ? schema.SurvivorState.ALIVE : schema.SurvivorState.DEAD
+        break
+      }
+    }
+  }
+
   /**
    * Creates a new World instance from protobuf WorldState data.
    * @param worldState - Protobuf WorldState data.
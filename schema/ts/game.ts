@@ -64,6 +64,30 @@ export interface SurvivorHealthUpdate {
      */
     newState: SurvivorState;
 }
+/**
+ * A round's survivor health changes as parallel packed columns, entry i of every
+ * column belongs to the same survivor. A survivor is dead once its health is 0.
+ *
+ * @generated from protobuf message aegis.SurvivorHealthBatch
+ */
+export interface SurvivorHealthBatch {
+    /**
+     * @generated from protobuf field: repeated int32 survivor_ids = 1
+     */
+    survivorIds: number[];
+    /**
+     * @generated from protobuf field: repeated int32 xs = 2
+     */
+    xs: number[];
+    /**
+     * @generated from protobuf field: repeated int32 ys = 3
+     */
+    ys: number[];
+    /**
+     * @generated from protobuf field: repeated int32 new_health = 4
+     */
+    newHealth: number[];
+}
 /**
  * @generated from protobuf message aegis.GamesHeader
  */
@@ -115,9 +139,15 @@ export interface Round {
      */
     droneScans: DroneScan[];
     /**
+     * Replaced by survivor_health, only read from older replays
+     *
      * @generated from protobuf field: repeated aegis.SurvivorHealthUpdate survivor_health_updates = 7
      */
     survivorHealthUpdates: SurvivorHealthUpdate[];
+    /**
+     * @generated from protobuf field: aegis.SurvivorHealthBatch survivor_health = 8
+     */
+    survivorHealth?: SurvivorHealthBatch;
 }
 /**
  * @generated from protobuf message aegis.GameFooter
@@ -308,6 +338,108 @@ class SurvivorHealthUpdate$Type extends MessageType<SurvivorHealthUpdate> {
  * @generated MessageType for protobuf message aegis.SurvivorHealthUpdate
  */
 export const SurvivorHealthUpdate = new SurvivorHealthUpdate$Type();
+class SurvivorHealthBatch$Type extends MessageType<SurvivorHealthBatch> {
+    constructor() {
+        super("aegis.SurvivorHealthBatch", [
+            { no: 1, name: "survivor_ids", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 5 /*ScalarType.INT32*/ },
+            { no: 2, name: "xs", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 5 /*ScalarType.INT32*/ },
+            { no: 3, name: "ys", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 5 /*ScalarType.INT32*/ },
+            { no: 4, name: "new_health", kind: "scalar", repeat: 1 /*RepeatType.PACKED*/, T: 5 /*ScalarType.INT32*/ }
+        ]);
+    }
+    create(value?: PartialMessage<SurvivorHealthBatch>): SurvivorHealthBatch {
+        const message = globalThis.Object.create((this.messagePrototype!));
+        message.survivorIds = [];
+        message.xs = [];
+        message.ys = [];
+        message.newHealth = [];
+        if (value !== undefined)
+            reflectionMergePartial<SurvivorHealthBatch>(this, message, value);
+        return message;
+    }
+    internalBinaryRead(reader: IBinaryReader, length: number, options: BinaryReadOptions, target?: SurvivorHealthBatch): SurvivorHealthBatch {
+        let message = target ?? this.create(), end = reader.pos + length;
+        while (reader.pos < end) {
+            let [fieldNo, wireType] = reader.tag();
+            switch (fieldNo) {
+                case /* repeated int32 survivor_ids */ 1:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.survivorIds.push(reader.int32());
+                    else
+                        message.survivorIds.push(reader.int32());
+                    break;
+                case /* repeated int32 xs */ 2:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.xs.push(reader.int32());
+                    else
+                        message.xs.push(reader.int32());
+                    break;
+                case /* repeated int32 ys */ 3:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.ys.push(reader.int32());
+                    else
+                        message.ys.push(reader.int32());
+                    break;
+                case /* repeated int32 new_health */ 4:
+                    if (wireType === WireType.LengthDelimited)
+                        for (let e = reader.int32() + reader.pos; reader.pos < e;)
+                            message.newHealth.push(reader.int32());
+                    else
+                        message.newHealth.push(reader.int32());
+                    break;
+                default:
+                    let u = options.readUnknownField;
+                    if (u === "throw")
+                        throw new globalThis.Error(`Unknown field ${fieldNo} (wire type ${wireType}) for ${this.typeName}`);
+                    let d = reader.skip(wireType);
+                    if (u !== false)
+                        (u === true ? UnknownFieldHandler.onRead : u)(this.typeName, message, fieldNo, wireType, d);
+            }
+        }
+        return message;
+    }
+    internalBinaryWrite(message: SurvivorHealthBatch, writer: IBinaryWriter, options: BinaryWriteOptions): IBinaryWriter {
+        /* repeated int32 survivor_ids = 1; */
+        if (message.survivorIds.length) {
+            writer.tag(1, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.survivorIds.length; i++)
+                writer.int32(message.survivorIds[i]);
+            writer.join();
+        }
+        /* repeated int32 xs = 2; */
+        if (message.xs.length) {
+            writer.tag(2, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.xs.length; i++)
+                writer.int32(message.xs[i]);
+            writer.join();
+        }
+        /* repeated int32 ys = 3; */
+        if (message.ys.length) {
+            writer.tag(3, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.ys.length; i++)
+                writer.int32(message.ys[i]);
+            writer.join();
+        }
+        /* repeated int32 new_health = 4; */
+        if (message.newHealth.length) {
+            writer.tag(4, WireType.LengthDelimited).fork();
+            for (let i = 0; i < message.newHealth.length; i++)
+                writer.int32(message.newHealth[i]);
+            writer.join();
+        }
+        let u = options.writeUnknownFields;
+        if (u !== false)
+            (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
+        return writer;
+    }
+}
+/**
+ * @generated MessageType for protobuf message aegis.SurvivorHealthBatch
+ */
+export const SurvivorHealthBatch = new SurvivorHealthBatch$Type();
 // @generated message type with reflection information, may provide speed optimized methods
 class GamesHeader$Type extends MessageType<GamesHeader> {
     constructor() {
@@ -418,7 +550,8 @@ class Round$Type extends MessageType<Round> {
             { no: 4, name: "turns", kind: "message", repeat: 2 /*RepeatType.UNPACKED*/, T: () => Turn },
             { no: 5, name: "team_info", kind: "message", repeat: 2 /*RepeatType.UNPACKED*/, T: () => TeamInfo },
             { no: 6, name: "drone_scans", kind: "message", repeat: 2 /*RepeatType.UNPACKED*/, T: () => DroneScan },
-            { no: 7, name: "survivor_health_updates", kind: "message", repeat: 2 /*RepeatType.UNPACKED*/, T: () => SurvivorHealthUpdate }
+            { no: 7, name: "survivor_health_updates", kind: "message", repeat: 2 /*RepeatType.UNPACKED*/, T: () => SurvivorHealthUpdate },
+            { no: 8, name: "survivor_health", kind: "message", T: () => SurvivorHealthBatch }
         ]);
     }
     create(value?: PartialMessage<Round>): Round {
@@ -464,6 +597,9 @@ class Round$Type extends MessageType<Round> {
                 case /* repeated aegis.SurvivorHealthUpdate survivor_health_updates */ 7:
                     message.survivorHealthUpdates.push(SurvivorHealthUpdate.internalBinaryRead(reader, reader.uint32(), options));
                     break;
+                case /* aegis.SurvivorHealthBatch survivor_health */ 8:
+                    message.survivorHealth = SurvivorHealthBatch.internalBinaryRead(reader, reader.uint32(), options, message.survivorHealth);
+                    break;
                 default:
                     let u = options.readUnknownField;
                     if (u === "throw")
@@ -501,6 +637,9 @@ class Round$Type extends MessageType<Round> {
         /* repeated aegis.SurvivorHealthUpdate survivor_health_updates = 7; */
         for (let i = 0; i < message.survivorHealthUpdates.length; i++)
             SurvivorHealthUpdate.internalBinaryWrite(message.survivorHealthUpdates[i], writer.tag(7, WireType.LengthDelimited).fork(), options).join();
+        /* aegis.SurvivorHealthBatch survivor_health = 8; */
+        if (message.survivorHealth)
+            SurvivorHealthBatch.internalBinaryWrite(message.survivorHealth, writer.tag(8, WireType.LengthDelimited).fork(), options).join();
         let u = options.writeUnknownFields;
         if (u !== false)
             (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
@@ -40,6 +40,10 @@ export interface Turn {
      * @generated from protobuf field: repeated aegis.Spawn spawns = 6
      */
     spawns: Spawn[];
+    /**
+     * @generated from protobuf field: int32 instructions = 7
+     */
+    instructions: number;
 }
 // @generated message type with reflection information, may provide speed optimized methods
 class Turn$Type extends MessageType<Turn> {
@@ -50,7 +54,8 @@ class Turn$Type extends MessageType<Turn> {
             { no: 3, name: "steps_taken", kind: "scalar", T: 5 /*ScalarType.INT32*/ },
             { no: 4, name: "loc", kind: "message", T: () => Location },
             { no: 5, name: "commands", kind: "scalar", repeat: 2 /*RepeatType.UNPACKED*/, T: 9 /*ScalarType.STRING*/ },
-            { no: 6, name: "spawns", kind: "message", repeat: 2 /*RepeatType.UNPACKED*/, T: () => Spawn }
+            { no: 6, name: "spawns", kind: "message", repeat: 2 /*RepeatType.UNPACKED*/, T: () => Spawn },
+            { no: 7, name: "instructions", kind: "scalar", T: 5 /*ScalarType.INT32*/ }
         ]);
     }
     create(value?: PartialMessage<Turn>): Turn {
@@ -60,6 +65,7 @@ class Turn$Type extends MessageType<Turn> {
         message.stepsTaken = 0;
         message.commands = [];
         message.spawns = [];
+        message.instructions = 0;
         if (value !== undefined)
             reflectionMergePartial<Turn>(this, message, value);
         return message;
@@ -87,6 +93,9 @@ class Turn$Type extends MessageType<Turn> {
                 case /* repeated aegis.Spawn spawns */ 6:
                     message.spawns.push(Spawn.internalBinaryRead(reader, reader.uint32(), options));
                     break;
+                case /* int32 instructions */ 7:
+                    message.instructions = reader.int32();
+                    break;
                 default:
                     let u = options.readUnknownField;
                     if (u === "throw")
@@ -117,6 +126,9 @@ class Turn$Type extends MessageType<Turn> {
         /* repeated aegis.Spawn spawns = 6; */
         for (let i = 0; i < message.spawns.length; i++)
             Spawn.internalBinaryWrite(message.spawns[i], writer.tag(6, WireType.LengthDelimited).fork(), options).join();
+        /* int32 instructions = 7; */
+        if (message.instructions !== 0)
+            writer.tag(7, WireType.Varint).int32(message.instructions);
         let u = options.writeUnknownFields;
         if (u !== false)
             (u == true ? UnknownFieldHandler.onWrite : u)(this.typeName, message, writer);
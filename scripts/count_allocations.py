@@ -0,0 +1,108 @@
+"""
+Count how many core game objects are allocated per round.
+
+Runs a headless game and reports, for each of the core value types, how many new
+instances were created on average per round. Run it from an aegis project folder
+(one containing `config/`, `worlds/` and `agents/`):
+
+    python scripts/count_allocations.py --world ExampleWorld --agent agent_path
+"""
+
+import argparse
+import logging
+from collections import Counter
+from pathlib import Path
+
+from _aegis_game.args_parser import LaunchArgs
+from _aegis_game.common import Cell, CellInfo, Location
+from _aegis_game.common.objects import Rubble, Survivor
+from _aegis_game.game import Game
+from _aegis_game.game_pb import GamePb
+from _aegis_game.message import Message
+from _aegis_game.sandbox.sandbox import Sandbox
+from _aegis_game.world_pb import load_world
+
+TRACKED: list[type] = [Location, Cell, CellInfo, Survivor, Rubble, Message]
+
+
+class NullServer:
+    """Stands in for the websocket server and drops every event."""
+
+    def add_event(self, _event: bytes) -> None:
+        """Drop the event."""
+
+
+def track_allocations(counts: Counter[str]) -> None:
+    """
+    Count every new instance of the tracked types in `counts`.
+
+    Instances handed out more than once (for example interned locations) are only
+    counted the first time they are seen.
+    """
+    seen: set[int] = set()
+    # keeps objects alive so their ids can't be reused
+    keep: list[object] = []
+
+    for cls in TRACKED:
+        original = cls.__new__
+
+        def counting_new(
+            klass: type,
+            *args: object,
+            _original: object = original,
+            _name: str = cls.__name__,
+            **kwargs: object,
+        ) -> object:
+            if _original is object.__new__:
+                obj = object.__new__(klass)
+            else:
+                obj = _original(klass, *args, **kwargs)  # pyright: ignore[reportCallIssue]
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                keep.append(obj)
+                counts[_name] += 1
+            return obj
+
+        cls.__new__ = counting_new  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def main() -> None:
+    """Play the game and print the allocation counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    _ = parser.add_argument("--world", required=True, help="World name under worlds/")
+    _ = parser.add_argument("--agent", required=True, help="Agent folder under agents/")
+    _ = parser.add_argument("--amount", type=int, default=1, help="Number of agents")
+    _ = parser.add_argument("--rounds", type=int, default=100, help="Rounds to play")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    launch_args = LaunchArgs(
+        amount=args.amount,
+        world=[args.world],
+        rounds=args.rounds,
+        agent=args.agent,
+        agent2=None,
+        client=False,
+        debug=False,
+        log=False,
+    )
+    code = Sandbox.from_directory(Path.cwd() / "agents" / args.agent)
+    world = load_world(Path.cwd() / "worlds" / f"{args.world}.world")
+    world.rounds = args.rounds
+    game_pb = GamePb()
+    game_pb.ws_server = NullServer()  # pyright: ignore[reportAttributeAccessIssue]
+    game = Game([code, None], launch_args, world, game_pb)
+
+    counts: Counter[str] = Counter()
+    track_allocations(counts)
+    while game.running:
+        game.run_round()
+
+    print(f"{game.round} rounds, new instances per round:")
+    for cls in TRACKED:
+        print(f"  {cls.__name__:<10} {counts[cls.__name__] / game.round:>10.1f}")
+    print(f"  {'total':<10} {counts.total() / game.round:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import cast
@@ -7,6 +8,117 @@ import yaml
 from .types import AegisConfig, FeatureKey
 
 CONFIG_PATH = Path.cwd() / "config" / "config.yaml"
+PRESETS_PATH = Path.cwd() / "config" / "presets"
+
+
+@dataclass(frozen=True, slots=True)
+class Features:
+    """
+    The feature settings one game runs with.
+
+    Resolved once when the game is created so hot paths read a plain attribute
+    instead of looking the feature up in the config file contents.
+    """
+
+    allow_agent_predictions: bool = False
+    allow_agent_messages: bool = False
+    allow_drone_scan: bool = False
+    allow_agent_types: bool = False
+    hidden_move_costs: bool = False
+    share_visited_cells: bool = False
+    allow_custom_agent_count: bool = False
+    default_agent_amount: int | None = None
+    surv_health_decay_rate: int = 0
+    advanced_scoring_system: bool = False
+    allow_pathfinding: bool = False
+    allow_team_knowledge: bool = False
+    versus_mode: bool = False
+    # 0 means turns are timed instead of metered
+    turn_instruction_budget: int = 0
+    # 0 means agents' memory isn't accounted
+    agent_memory_quota_mb: int = 0
+
+    @classmethod
+    def from_config(cls, config: AegisConfig) -> "Features":
+        """
+        Resolve the features of a loaded config.
+
+        Args:
+            config: The contents of a config file.
+
+        Returns:
+            The resolved features.
+
+        """
+        default_agent_amount = _lookup(config, "DEFAULT_AGENT_AMOUNT")
+        return cls(
+            allow_agent_predictions=bool(_lookup(config, "ALLOW_AGENT_PREDICTIONS")),
+            allow_agent_messages=bool(_lookup(config, "ALLOW_AGENT_MESSAGES")),
+            allow_drone_scan=bool(_lookup(config, "ALLOW_DRONE_SCAN")),
+            allow_agent_types=bool(_lookup(config, "ALLOW_AGENT_TYPES")),
+            hidden_move_costs=bool(_lookup(config, "HIDDEN_MOVE_COSTS")),
+            share_visited_cells=bool(_lookup(config, "SHARE_VISITED_CELLS")),
+            allow_custom_agent_count=bool(_lookup(config, "ALLOW_CUSTOM_AGENT_COUNT")),
+            default_agent_amount=(
+                int(default_agent_amount) if default_agent_amount is not None else None
+            ),
+            surv_health_decay_rate=max(
+                int(_lookup(config, "SURV_HEALTH_DECAY_RATE") or 0), 0
+            ),
+            advanced_scoring_system=bool(_lookup(config, "ADVANCED_SCORING_SYSTEM")),
+            allow_pathfinding=bool(_lookup(config, "ALLOW_PATHFINDING")),
+            allow_team_knowledge=bool(_lookup(config, "ALLOW_TEAM_KNOWLEDGE")),
+            versus_mode=bool(
+                config.get("competition_specific", {}).get("VERSUS_MODE", False)
+            ),
+            turn_instruction_budget=max(
+                int(
+                    config.get("competition_specific", {}).get(
+                        "TURN_INSTRUCTION_BUDGET"
+                    )
+                    or 0
+                ),
+                0,
+            ),
+            agent_memory_quota_mb=max(
+                int(
+                    config.get("competition_specific", {}).get("AGENT_MEMORY_QUOTA_MB")
+                    or 0
+                ),
+                0,
+            ),
+        )
+
+    def agent_amount(self, requested: int | None) -> int:
+        """
+        Resolve the number of agents a game spawns.
+
+        Args:
+            requested: The amount asked for on the command line, if any.
+
+        Returns:
+            The requested amount if the config allows a custom agent count or
+            sets no default, otherwise `DEFAULT_AGENT_AMOUNT` (1 if unset).
+
+        """
+        if not self.default_agent_amount:
+            return requested if requested is not None else 1
+        if requested is None or not self.allow_custom_agent_count:
+            return self.default_agent_amount
+        return requested
+
+
+def _read_config(path: Path) -> AegisConfig:
+    with path.open() as f:
+        return cast("AegisConfig", yaml.safe_load(f))
+
+
+def _lookup(config: AegisConfig, feature: FeatureKey) -> bool | int | None:
+    # a feature set to false or 0 in `features` must not fall through
+    features = config.get("features") or {}
+    if feature in features:
+        return features[feature]
+    return (config.get("competition_specific") or {}).get(feature)
 
 
 @lru_cache
@@ -16,23 +128,41 @@ def load_config() -> AegisConfig:
         error = f"Main config file not found: {CONFIG_PATH}"
         raise FileNotFoundError(error)
 
-    with CONFIG_PATH.open() as f:
-        return cast("AegisConfig", yaml.safe_load(f))
+    return _read_config(CONFIG_PATH)
+
+
+@lru_cache
+def load_features(preset: str | None = None) -> Features:
+    """
+    Load the features a game should run with.
+
+    Args:
+        preset: Name of a preset in `config/presets` (without `.yaml`). If None,
+            the main `config/config.yaml` is used.
+
+    Returns:
+        The resolved features.
+
+    Raises:
+        FileNotFoundError: If the config or preset file does not exist.
+
+    """
+    if preset is None:
+        return Features.from_config(load_config())
+
+    path = PRESETS_PATH / f"{preset}.yaml"
+    if not path.exists():
+        error = f"Preset file not found: {path}"
+        raise FileNotFoundError(error)
+
+    return Features.from_config(_read_config(path))
 
 
 def has_feature(feature: FeatureKey) -> bool:
     """Check if a feature is enabled in the config."""
-    config = load_config()
-
-    return config.get("features", {}).get(feature, False) or config.get(
-        "competition_specific", {}
-    ).get(feature, False)
+    return bool(_lookup(load_config(), feature))
 
 
 def get_feature_value(feature: FeatureKey) -> bool | int | None:
     """Get a feature value from the config."""
-    config = load_config()
-
-    return config.get("features", {}).get(feature) or config.get(
-        "competition_specific", {}
-    ).get(feature)
+    return _lookup(load_config(), feature)
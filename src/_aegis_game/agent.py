@@ -1,5 +1,6 @@
 # pyright: reportImportCycles = false
 
+import traceback
 from typing import TYPE_CHECKING
 
 from .agent_type import AgentType
@@ -13,7 +14,12 @@ from .team import Team
 from .types import MethodDict
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from .agent_controller import AgentController
     from .game import Game
+    from .process_runner.controller import TurnResult
 
 
 class Agent:
@@ -27,26 +33,66 @@ class Agent:
         agent_type: AgentType,
     ) -> None:
         self.game: Game = game
-        self.has_visited: list[bool] = [False] * (game.current_world.height * game.current_world.width)
+        self.has_visited: NDArray[np.bool_] = game.get_visited_map(team)
         self.id: int = agent_id
         self.team: Team = team
-        self.location: Location = location
-        self.energy_level: int = energy_level
         self.type: AgentType = agent_type
-        self.action_cooldown: int = agent_type.action_cooldown
+        # energy, location, cooldown and steps live in the game's agent table
+        self.slot: int = game.agent_table.add(
+            agent_id, location, energy_level, agent_type.action_cooldown
+        )
+        self._location: Location = location
         self.core: LumenCore | None = None
         self.message_buffer: MessageBuffer = MessageBuffer()
-        self.steps_taken: int = 0
         self.debug: bool = False
         self.errors: list[str] = []
+        # instructions executed by the last turn, 0 if turns aren't metered
+        self.instructions: int = 0
+        # whether the last turn was stopped at the turn deadline
+        self.timed_out: bool = False
+        # most memory the agent's turns held, 0 if memory isn't accounted
+        self.memory_peak: int = 0
+
+    @property
+    def location(self) -> Location:
+        return self._location
+
+    @location.setter
+    def location(self, location: Location) -> None:
+        self._location = location
+        self.game.agent_table.x[self.slot] = location.x
+        self.game.agent_table.y[self.slot] = location.y
+
+    @property
+    def energy_level(self) -> int:
+        return int(self.game.agent_table.energy[self.slot])
+
+    @energy_level.setter
+    def energy_level(self, energy_level: int) -> None:
+        self.game.agent_table.energy[self.slot] = energy_level
+
+    @property
+    def action_cooldown(self) -> int:
+        return int(self.game.agent_table.cooldown[self.slot])
+
+    @action_cooldown.setter
+    def action_cooldown(self, action_cooldown: int) -> None:
+        self.game.agent_table.cooldown[self.slot] = action_cooldown
+
+    @property
+    def steps_taken(self) -> int:
+        return int(self.game.agent_table.steps[self.slot])
+
+    @steps_taken.setter
+    def steps_taken(self, steps_taken: int) -> None:
+        self.game.agent_table.steps[self.slot] = steps_taken
 
     def process_beginning_of_turn(self) -> None:
+        # cooldowns are ticked for every agent at once by the game
         if self.core is None:
             error = "Trying to run an agent that hasn't launched"
             raise RuntimeError(error)
 
-        self.action_cooldown = max(0, self.action_cooldown - Constants.COOLDOWN_TICK)
-
     def process_end_of_turn(self) -> None:
         self.game.game_pb.end_turn(self)
 
@@ -54,12 +100,38 @@ class Agent:
         self.process_beginning_of_turn()
         self.errors.clear()
         self.core.run()  # pyright: ignore[reportOptionalMemberAccess]
+        self.instructions = self.core.instructions  # pyright: ignore[reportOptionalMemberAccess]
+        self.timed_out = self.core.timed_out  # pyright: ignore[reportOptionalMemberAccess]
+        self.memory_peak = self.core.memory_peak  # pyright: ignore[reportOptionalMemberAccess]
+        self.log_errors()
+        self.penalize_for_errors()
+        self.process_end_of_turn()
+
+    def apply_remote_turn(
+        self, result: "TurnResult", controller: "AgentController"
+    ) -> None:
+        """Apply a turn played in a worker process through the agent's controller."""
+        from .agent_controller import AgentError  # noqa: PLC0415
+
+        self.errors.clear()
+        self.errors.extend(result.errors)
+        self.instructions = result.instructions
+        self.timed_out = result.timed_out
+        self.memory_peak = result.memory_peak
+        for name, args in result.intents:
+            try:
+                getattr(controller, name)(*args)
+            except AgentError:
+                # the world changed under the agent since it played its turn
+                self.error(traceback.format_exc(limit=5))
         self.log_errors()
         self.penalize_for_errors()
         self.process_end_of_turn()
 
     def kill(self) -> None:
-        self.core.kill()  # pyright: ignore[reportOptionalMemberAccess]
+        # agents playing in worker processes don't have a core here
+        if self.core is not None:
+            self.core.kill()
 
     def launch(
         self, code: Sandbox | None, methods: MethodDict, *, debug: bool = False
@@ -68,7 +140,15 @@ class Agent:
             error = "No code provided to launch."
             raise ValueError(error)
 
-        self.core = LumenCore(code, methods, self.error)
+        self.core = LumenCore(
+            code,
+            methods,
+            self.error,
+            self.game.turn_scheduler,
+            self.game.instruction_meter,
+            self.game.memory_meter,
+            main=self.game.main_templates[self.team.value],
+        )
         self.debug = debug
 
     def apply_movement_cost(self, direction: Direction) -> None:
@@ -80,8 +160,7 @@ class Agent:
         self.steps_taken += 1
 
     def add_energy(self, energy: int) -> None:
-        self.energy_level += energy
-        self.energy_level = min(Constants.MAX_ENERGY_LEVEL, self.energy_level)
+        self.energy_level = min(Constants.MAX_ENERGY_LEVEL, self.energy_level + energy)
 
     def add_cooldown(self, cooldown: int = -1) -> None:
         self.action_cooldown = self.type.action_cooldown if cooldown == -1 else cooldown
@@ -1,28 +1,65 @@
 # pyright: reportImportCycles = false
+from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 import numpy as np
 from numpy.typing import NDArray
 
-from .aegis_config import has_feature
-from .agent import Agent
+from .aegis_config import Features
+from .agent_predictions.batcher import shared_prediction_batcher
+from .agent_predictions.model_cache import resolve_agent_file, shared_model_cache
 from .agent_type import AgentType
-from .common import CellInfo, Direction, Location
+from .common import CellInfo, Direction, Location, RegionInfo, TeamKnowledge
 from .common.objects.rubble import Rubble
 from .common.objects.survivor import Survivor
 from .constants import Constants
 from .decorator import requires
 from .message import Message
+from .observation import neighborhood, observe_region
+from .pathfinding import known_move_costs
 from .team import Team
 
 if TYPE_CHECKING:
+    from .agent import Agent
     from .game import Game
 
 
-class AgentController:
-    def __init__(self, game: "Game", agent: "Agent") -> None:
-        self._game: Game = game
-        self._agent: Agent = agent
+class BaseAgentController(ABC):
+    """
+    The checks every agent controller makes before acting for its agent.
+
+    Agents whose sandbox runs in this process and agents whose sandbox runs in a
+    worker process must be refused for the same reasons with the same errors, so
+    the checks are shared and each controller only says how to read the agent's
+    state.
+    """
+
+    def __init__(self, features: Features) -> None:
+        self._features: Features = features
+
+    @abstractmethod
+    def _agent_type(self) -> AgentType:
+        pass
+
+    @abstractmethod
+    def _agent_location(self) -> Location:
+        pass
+
+    @abstractmethod
+    def _action_cooldown(self) -> int:
+        pass
+
+    @abstractmethod
+    def _on_map(self, loc: Location) -> bool:
+        pass
+
+    @abstractmethod
+    def _is_spawn_location(self, loc: Location) -> bool:
+        pass
+
+    @abstractmethod
+    def _team_is_full(self) -> bool:
+        pass
 
     def assert_not_none(self, value: object) -> None:
         if value is None:
@@ -30,47 +67,46 @@ class AgentController:
             raise AgentError(error)
 
     def assert_cooldown(self) -> None:
-        if self._agent.action_cooldown != 0:
+        if self._action_cooldown() != 0:
             error = "Agent is on cooldown"
             raise AgentError(error)
 
-    def assert_spawn(self, loc: Location, team: Team) -> None:
-        if loc not in self._game.get_spawns():
+    def assert_spawn(self, loc: Location) -> None:
+        if not self._is_spawn_location(loc):
             error = f"Invalid spawn: {loc}"
             raise AgentError(error)
 
-        units = self._game.team_info.get_units(team)
-        if units == self._game.args.amount:
+        if self._team_is_full():
             error = "Max agents reached."
             raise AgentError(error)
 
     def assert_loc(self, loc: Location) -> None:
         self.assert_not_none(loc)
-        if not self._game.on_map(loc):
+        if not self._on_map(loc):
             error = "Location is not on the map"
             raise AgentError(error)
 
     def assert_move(self, direction: Direction) -> None:
         self.assert_not_none(direction)
         self.assert_cooldown()
-        new_loc = self._agent.location.add(direction)
+        new_loc = self._agent_location().add(direction)
 
-        if not self._game.on_map(new_loc):
+        if not self._on_map(new_loc):
             error = "Agent moved off the map"
             raise AgentError(error)
 
-    def assert_dig(self, agent: Agent) -> None:
+    def assert_dig(self) -> None:
         self.assert_cooldown()
-        if has_feature("ALLOW_AGENT_TYPES") and agent.type not in (
+        if self._features.allow_agent_types and self._agent_type() not in (
             AgentType.ENGINEER,
             AgentType.COMMANDER,
         ):
             error = "Action not allowed. Only ENGINEER and COMMANDER can dig."
             raise AgentError(error)
 
-    def assert_save(self, agent: Agent) -> None:
+    def assert_save(self) -> None:
         self.assert_cooldown()
-        if has_feature("ALLOW_AGENT_TYPES") and agent.type not in (
+        if self._features.allow_agent_types and self._agent_type() not in (
             AgentType.MEDIC,
             AgentType.COMMANDER,
         ):
@@ -78,16 +114,62 @@ class AgentController:
             raise AgentError(error)
 
     def assert_predict(self) -> None:
-        if not has_feature("ALLOW_AGENT_PREDICTIONS"):
+        if not self._features.allow_agent_predictions:
             msg = "Predictions are not enabled, therefore this method is not available."
             raise AgentError(msg)
 
     def assert_scan(self) -> None:
         self.assert_cooldown()
-        if not has_feature("ALLOW_DRONE_SCAN"):
+        if not self._features.allow_drone_scan:
             msg = "Drone scan is not enabled, therefore this method is not available."
             raise AgentError(msg)
 
+    def assert_region(self, min_loc: Location, max_loc: Location) -> None:
+        self.assert_loc(min_loc)
+        self.assert_loc(max_loc)
+        if min_loc.x > max_loc.x or min_loc.y > max_loc.y:
+            error = "The region's first corner must have the lowest x and y"
+            raise AgentError(error)
+
+    def assert_team_knowledge(self) -> None:
+        if not self._features.allow_team_knowledge:
+            msg = (
+                "Team knowledge is not enabled, therefore this method is not available."
+            )
+            raise AgentError(msg)
+
+    def assert_pathfinding(self) -> None:
+        if not self._features.allow_pathfinding:
+            msg = "Pathfinding is not enabled, therefore this method is not available."
+            raise AgentError(msg)
+
+
+class AgentController(BaseAgentController):
+    def __init__(self, game: "Game", agent: "Agent", features: Features) -> None:
+        super().__init__(features)
+        self._game: Game = game
+        self._agent: Agent = agent
+
+    def _agent_type(self) -> AgentType:
+        return self._agent.type
+
+    def _agent_location(self) -> Location:
+        return self._agent.location
+
+    def _action_cooldown(self) -> int:
+        return self._agent.action_cooldown
+
+    def _on_map(self, loc: Location) -> bool:
+        return self._game.on_map(loc)
+
+    def _is_spawn_location(self, loc: Location) -> bool:
+        return self._game.current_world.is_spawn_location(loc)
+
+    def _team_is_full(self) -> bool:
+        return (
+            self._game.team_info.get_units(self._agent.team) == self._game.args.amount
+        )
+
     # Public Agent Methods
 
     def get_round_number(self) -> int:
@@ -107,7 +189,12 @@ class AgentController:
         return self._agent.team
 
     def get_location(self) -> Location:
-        """Return the current location of the agent."""
+        """
+        Return the current location of the agent.
+
+        Locations are immutable, use `loc.add(direction)` or `Location(x, y)`
+        instead of assigning to `loc.x` or `loc.y`.
+        """
         return self._agent.location
 
     def get_energy_level(self) -> int:
@@ -145,7 +232,7 @@ class AgentController:
             AgentError: If saving is invalid according to game rules.
 
         """
-        self.assert_save(self._agent)
+        self.assert_save()
         self._agent.add_cooldown()
         cell = self._game.get_cell_at_current(self._agent.location)
         top_layer = cell.get_top_layer()
@@ -184,7 +271,7 @@ class AgentController:
             AgentError: If digging is invalid according to game rules.
 
         """
-        self.assert_dig(self._agent)
+        self.assert_dig()
         self._agent.add_cooldown()
         cell = self._game.get_cell_at_current(self._agent.location)
         top_layer = cell.get_top_layer()
@@ -209,6 +296,68 @@ class AgentController:
         self.assert_predict()
         self._game.predict(surv_id, label, self._agent)
 
+    @requires("ALLOW_AGENT_PREDICTIONS")
+    def load_prediction_model(self, path: str) -> object:
+        """
+        Load a model file from the agent's directory.
+
+        The model is loaded once and shared by every agent until the file changes,
+        so calling this every turn is cheap. Don't modify the returned model.
+
+        Args:
+            path: Path of the model file, relative to the agent's directory.
+
+        Returns:
+            The loaded model.
+
+        Raises:
+            AgentError: If predictions are not enabled, or the file isn't in the
+                agent's directory or can't be read.
+
+        """
+        self.assert_predict()
+        directory = self._game.agent_directory(self._agent.team)
+        try:
+            return shared_model_cache().get(resolve_agent_file(directory, path))
+        except (OSError, ValueError) as e:
+            raise AgentError(str(e)) from e
+
+    @requires("ALLOW_AGENT_PREDICTIONS")
+    def read_model_predictions(
+        self, path: str
+    ) -> list[tuple[int, NDArray[np.float32]]]:
+        """
+        Run a model over every pending prediction of the agent's team.
+
+        The images are run through the model in one batch, and the outputs are
+        shared with the rest of the team, so only images that became pending since
+        a teammate last asked are run again.
+
+        Args:
+            path: Path of the model file, relative to the agent's directory.
+
+        Returns:
+            `(surv_id, output)` for each pending prediction, where `output` is what
+            the model returned for that prediction's image. Returns an empty list if
+            no pending predictions are available.
+
+        Raises:
+            AgentError: If predictions are not enabled, or the file isn't in the
+                agent's directory or can't be read.
+
+        """
+        self.assert_predict()
+        directory = self._game.agent_directory(self._agent.team)
+        pending = self._game.get_prediction_info_for_agent(self._agent.team)
+        if not pending:
+            return []
+        try:
+            return shared_prediction_batcher().run(
+                self._agent.team, resolve_agent_file(directory, path), pending
+            )
+        except (OSError, ValueError) as e:
+            raise AgentError(str(e)) from e
+
     @requires("ALLOW_AGENT_PREDICTIONS")
     def read_pending_predictions(
         self,
@@ -318,7 +467,6 @@ class AgentController:
         """
         self.assert_loc(loc)
 
-        idx = loc.x + loc.y * self._game.current_world.width
         cell_info = self._game.get_cell_info_at_current(loc)
 
         is_adjacent = self._agent.location.is_adjacent_to(loc)
@@ -329,11 +477,138 @@ class AgentController:
             top = cell_info.top_layer
             cell_info.layers = [top] if top is not None else []
 
-        if has_feature("HIDDEN_MOVE_COSTS") and not self._agent.has_visited[idx]:
+        if (
+            self._features.hidden_move_costs
+            and not self._agent.has_visited[loc.y, loc.x]
+        ):
             cell_info.move_cost = 1
 
         return cell_info
 
+    def get_region_info(
+        self, min_loc: Location | None = None, max_loc: Location | None = None
+    ) -> RegionInfo:
+        """
+        Return the cell info of a rectangle of cells at once, as arrays.
+
+        The same visibility rules as `get_cell_info_at` apply to every cell, so one
+        call tells what calling it on each cell would. Without corners, the region
+        is the agent's location and the cells around it.
+
+        Args:
+            min_loc: The corner of the region with the lowest x and y.
+            max_loc: The corner of the region with the highest x and y.
+
+        Returns:
+            A RegionInfo object following visibility rules.
+
+        Raises:
+            AgentError: If a corner isn't on the map, or `min_loc` has a higher x
+                or y than `max_loc`.
+
+        """
+        world = self._game.current_world
+        if min_loc is None and max_loc is None:
+            min_loc, max_loc = neighborhood(
+                self._agent.location, world.width, world.height
+            )
+        self.assert_region(min_loc, max_loc)  # pyright: ignore[reportArgumentType]
+
+        team = self._agent.team
+        scanned = np.zeros(world.width * world.height, dtype=np.bool_)
+        for loc, teams in self._game.drone_scans().items():
+            if team in teams:
+                scanned[loc.x + loc.y * world.width] = True
+        return observe_region(
+            min_loc,  # pyright: ignore[reportArgumentType]
+            max_loc,  # pyright: ignore[reportArgumentType]
+            world.width,
+            agent=self._agent.location,
+            move_costs=world.move_costs,
+            cell_types=world.cell_types,
+            top_layer_kinds=world.top_layer_kinds,
+            scanned=scanned,
+            visited=self._agent.has_visited
+            if self._features.hidden_move_costs
+            else None,
+            count_agents=lambda index: len(world.get_cell(index).agents),
+        )
+
+    @requires("ALLOW_TEAM_KNOWLEDGE")
+    def get_team_knowledge(self) -> TeamKnowledge:
+        """
+        Return what the agent's team has learned about the world so far.
+
+        The arrays are read-only and updated by the game at the start of every
+        round, so the same object can be kept instead of calling this every turn.
+
+        Returns:
+            A TeamKnowledge object shared by the agent's team.
+
+        Raises:
+            AgentError: If team knowledge is not enabled.
+
+        """
+        self.assert_team_knowledge()
+        return self._game.team_knowledge[self._agent.team].knowledge
+
+    @requires("ALLOW_PATHFINDING")
+    def get_path_to(self, loc: Location) -> list[Direction] | None:
+        """
+        Return a cheapest path from the agent's location to a given location.
+
+        The path costs the least energy according to the move costs the agent
+        knows of, the ones `get_cell_info_at` returns, and avoids killer cells.
+
+        Args:
+            loc: The location to go to.
+
+        Returns:
+            The directions to move in, in order, empty if the agent is already
+            at `loc`, or None if `loc` can't be reached.
+
+        Raises:
+            AgentError: If pathfinding is not enabled or the location is invalid.
+
+        """
+        self.assert_pathfinding()
+        self.assert_loc(loc)
+        game = self._game
+        agent = self._agent
+        world = game.current_world
+        hidden = self._features.hidden_move_costs
+        # without hidden costs every agent knows every cost, and they never change
+        return game.path_finder.path(
+            game.visited_owner(agent) if hidden else agent.team,
+            game.visited_revision(agent) if hidden else 0,
+            lambda: known_move_costs(
+                world.move_costs,
+                world.cell_types,
+                agent.has_visited if hidden else None,
+            ),
+            agent.location,
+            loc,
+        )
+
+    @requires("ALLOW_PATHFINDING")
+    def get_direction_to(self, loc: Location) -> Direction:
+        """
+        Return the first direction of a cheapest path to a given location.
+
+        Args:
+            loc: The location to go to.
+
+        Returns:
+            The direction to move in, `Direction.CENTER` if the agent is already
+            at `loc` or `loc` can't be reached.
+
+        Raises:
+            AgentError: If pathfinding is not enabled or the location is invalid.
+
+        """
+        path = self.get_path_to(loc)
+        return path[0] if path else Direction.CENTER
+
     @requires("ALLOW_AGENT_TYPES")
     def spawn_agent(self, loc: Location, agent_type: AgentType) -> None:
         """
@@ -347,7 +622,7 @@ class AgentController:
             AgentError: If spawn location is invalid or max amount reached.
 
         """
-        self.assert_spawn(loc, self._agent.team)
+        self.assert_spawn(loc)
         self._game.spawn_agent(loc, self._agent.team, agent_type)
 
     def log(self, *args: object) -> None:
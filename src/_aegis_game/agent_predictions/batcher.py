@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from functools import cache
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+
+from .model_cache import ModelCache, shared_model_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+    from _aegis_game.team import Team
+
+PendingPredictionInfo = tuple[int, "NDArray[np.uint8]", "NDArray[np.int32]"]
+
+
+class PredictionBatcher:
+    """
+    Runs a team's model over all of the team's pending predictions in one batch.
+
+    The first agent of a team that asks for the model's outputs pays for a single
+    batched forward pass over every pending image, later agents get the stored
+    outputs. Outputs are kept per team and model file until their prediction is no
+    longer pending, so only images that became pending since the last pass are run
+    through the model again.
+    """
+
+    def __init__(self, models: ModelCache) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            models: Cache the models are loaded through.
+
+        """
+        self._models: ModelCache = models
+        # (team, model file) -> surv id -> (image, model output)
+        self._outputs: dict[
+            tuple[Team, Path],
+            dict[int, tuple[NDArray[np.uint8], NDArray[np.float32]]],
+        ] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def run(
+        self, team: Team, path: Path, pending: list[PendingPredictionInfo]
+    ) -> list[tuple[int, NDArray[np.float32]]]:
+        """
+        Return the model's output for each of the team's pending predictions.
+
+        Args:
+            team: The team the predictions are pending for.
+            path: Path of the model file.
+            pending: The team's pending predictions.
+
+        Returns:
+            `(surv_id, output)` for each pending prediction, in the order of
+            `pending`.
+
+        Raises:
+            OSError: If the model file can't be read.
+
+        """
+        model = self._models.get(path)
+        with self._lock:
+            known = self._outputs.setdefault((team, path.resolve()), {})
+            missing = [
+                (surv_id, image)
+                for surv_id, image, _ in pending
+                if surv_id not in known or not np.array_equal(known[surv_id][0], image)
+            ]
+            if missing:
+                batch = np.stack([image for _, image in missing])
+                outputs = cast("NDArray[np.float32]", np.asarray(model(batch)))  # pyright: ignore[reportCallIssue]
+                for (surv_id, image), output in zip(missing, outputs, strict=True):
+                    known[surv_id] = (image, output)
+
+            pending_ids = {surv_id for surv_id, _, _ in pending}
+            for surv_id in [surv_id for surv_id in known if surv_id not in pending_ids]:
+                del known[surv_id]
+            return [(surv_id, known[surv_id][1]) for surv_id, _, _ in pending]
+
+
+@cache
+def shared_prediction_batcher() -> PredictionBatcher:
+    """Return the batcher shared by every game of this process."""
+    return PredictionBatcher(shared_model_cache())
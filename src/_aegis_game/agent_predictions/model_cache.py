@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from functools import cache
+from typing import TYPE_CHECKING
+
+from .numpy_model import NumpyModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+# Models kept loaded at once, a game has at most one model per team
+DEFAULT_MODEL_CAPACITY = 4
+
+
+def load_model(path: Path) -> object:
+    """Load an exported `.npz` model with NumPy, or any other file with Keras."""
+    if path.suffix == ".npz":
+        return NumpyModel.load(path)
+    return load_keras_model(path)
+
+
+def load_keras_model(path: Path) -> object:
+    """Load a Keras model file, for inference only."""
+    # tensorflow is only needed by games whose agents use a model
+    import tensorflow as tf  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+
+    return tf.keras.models.load_model(str(path), compile=False)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+
+class ModelCache:
+    """
+    Keeps the models agents load, so each model file is loaded once per process.
+
+    Models are keyed by their resolved path and modification time, so saving a new
+    version of a model file loads it again, and the least recently used model is
+    dropped once more than `capacity` models are loaded.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_MODEL_CAPACITY,
+        loader: Callable[[Path], object] = load_model,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity: Number of models kept loaded at once.
+            loader: Loads a model file.
+
+        """
+        self.capacity: int = capacity
+        self._loader: Callable[[Path], object] = loader
+        self._models: OrderedDict[tuple[Path, int], object] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, path: Path) -> object:
+        """
+        Return the model in a file, loading it if it isn't cached.
+
+        Args:
+            path: Path of the model file.
+
+        Returns:
+            The loaded model, the same object for every caller until the file
+            changes or the model is evicted.
+
+        Raises:
+            OSError: If the file can't be read.
+            ValueError: If the file isn't a model the loader can load.
+
+        """
+        path = path.resolve()
+        key = (path, path.stat().st_mtime_ns)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+
+            try:
+                model = self._loader(path)
+            except OSError:
+                raise
+            except Exception as e:
+                # NumPy and Keras raise their own errors for a corrupt or
+                # unsupported file, callers only have to handle one kind
+                error = f"Unable to load model {path.name}: {e}"
+                raise ValueError(error) from e
+            for stale in [cached for cached in self._models if cached[0] == path]:
+                del self._models[stale]
+            self._models[key] = model
+            while len(self._models) > self.capacity:
+                _ = self._models.popitem(last=False)
+            return model
+
+    def clear(self) -> None:
+        """Drop every loaded model."""
+        with self._lock:
+            self._models.clear()
+
+
+def resolve_agent_file(directory: Path, path: str) -> Path:
+    """
+    Resolve a path relative to an agent's directory.
+
+    Args:
+        directory: The agent's directory.
+        path: Path of a file in it.
+
+    Returns:
+        The resolved path.
+
+    Raises:
+        ValueError: If the path leads outside the agent's directory.
+
+    """
+    resolved = (directory / path).resolve()
+    if not resolved.is_relative_to(directory.resolve()):
+        error = f"{path} is outside the agent's directory"
+        raise ValueError(error)
+    return resolved
+
+
+@cache
+def shared_model_cache() -> ModelCache:
+    """Return the model cache shared by every game of this process."""
+    return ModelCache()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+# Version of the .npz layout, bumped when old files can no longer be read
+FORMAT_VERSION = 1
+
+
+def _softmax(x: NDArray[np.float32]) -> NDArray[np.float32]:
+    exp = np.exp(x - x.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+ACTIVATIONS: dict[str, Callable[[NDArray[np.float32]], NDArray[np.float32]]] = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0),
+    "sigmoid": lambda x: 1 / (1 + np.exp(-x)),
+    "tanh": np.tanh,
+    "softmax": _softmax,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Dense:
+    """A fully connected layer, `activation(x @ kernel + bias)`."""
+
+    kernel: NDArray[np.float32]
+    bias: NDArray[np.float32]
+    activation: str
+
+
+class NumpyModel:
+    """
+    Runs a `Flatten -> Dense -> ... -> Dense` network with NumPy only.
+
+    Symbol prediction models only need a few matrix products, so exporting one
+    from Keras to a `.npz` of weights lets agents use it without importing
+    TensorFlow, which takes seconds and hundreds of megabytes per process.
+    """
+
+    def __init__(self, layers: list[Dense]) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            layers: The dense layers, in order. The input is flattened first.
+
+        Raises:
+            ValueError: If a layer has an activation the runtime doesn't support.
+
+        """
+        for layer in layers:
+            if layer.activation not in ACTIVATIONS:
+                error = f"Unsupported activation: {layer.activation}"
+                raise ValueError(error)
+        self.layers: list[Dense] = layers
+
+    def __call__(self, x: NDArray[Any]) -> NDArray[np.float32]:  # pyright: ignore[reportExplicitAny]
+        """
+        Run a batch through the model, the same way calling a Keras model does.
+
+        Args:
+            x: A batch of inputs, the first axis is the batch.
+
+        Returns:
+            The output of the last layer for each input.
+
+        """
+        out = np.asarray(x, dtype=np.float32).reshape(len(x), -1)
+        for layer in self.layers:
+            out = ACTIVATIONS[layer.activation](out @ layer.kernel + layer.bias)
+        return out
+
+    def save(self, path: Path) -> None:
+        """Save the model's weights to a `.npz` file."""
+        arrays: dict[str, NDArray[Any]] = {  # pyright: ignore[reportExplicitAny]
+            "config": np.array(
+                json.dumps(
+                    {
+                        "version": FORMAT_VERSION,
+                        "activations": [layer.activation for layer in self.layers],
+                    }
+                )
+            ),
+        }
+        for index, layer in enumerate(self.layers):
+            arrays[f"kernel_{index}"] = layer.kernel
+            arrays[f"bias_{index}"] = layer.bias
+        with path.open("wb") as file:
+            np.savez_compressed(file, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> NumpyModel:
+        """
+        Load a model saved with `save`.
+
+        Args:
+            path: Path of the `.npz` file.
+
+        Returns:
+            The loaded model.
+
+        Raises:
+            ValueError: If the file isn't a model this runtime can read.
+
+        """
+        with np.load(path, allow_pickle=False) as data:
+            try:
+                config = cast("dict[str, Any]", json.loads(str(data["config"])))  # pyright: ignore[reportExplicitAny]
+            except (KeyError, json.JSONDecodeError) as e:
+                error = f"{path.name} is not an exported model"
+                raise ValueError(error) from e
+            if config.get("version") != FORMAT_VERSION:
+                error = f"{path.name} was exported in an unsupported format"
+                raise ValueError(error)
+            return cls(
+                [
+                    Dense(
+                        data[f"kernel_{index}"].astype(np.float32),
+                        data[f"bias_{index}"].astype(np.float32),
+                        activation,
+                    )
+                    for index, activation in enumerate(
+                        cast("list[str]", config["activations"])
+                    )
+                ]
+            )
+
+    @classmethod
+    def from_keras(cls, model: Any) -> NumpyModel:  # noqa: ANN401  # pyright: ignore[reportExplicitAny]
+        """
+        Convert a Keras model made of `Flatten`, `Dense` and `Dropout` layers.
+
+        Args:
+            model: The Keras model.
+
+        Returns:
+            A model with the same weights.
+
+        Raises:
+            ValueError: If the model has a layer the runtime can't run.
+
+        """
+        layers: list[Dense] = []
+        for layer in model.layers:  # pyright: ignore[reportAny]
+            kind = type(layer).__name__  # pyright: ignore[reportAny]
+            if kind in {"InputLayer", "Flatten", "Dropout"}:
+                # flattening is done up front, dropout is a no-op for inference
+                continue
+            if kind != "Dense":
+                error = f"Unsupported layer: {kind}"
+                raise ValueError(error)
+            kernel, bias = cast("list[NDArray[np.float32]]", layer.get_weights())  # pyright: ignore[reportAny]
+            activation = cast("str", layer.get_config()["activation"])  # pyright: ignore[reportAny]
+            layers.append(
+                Dense(kernel.astype(np.float32), bias.astype(np.float32), activation)
+            )
+        return cls(layers)
@@ -0,0 +1,74 @@
+import numpy as np
+from numpy.typing import NDArray
+
+from .common import Location
+
+
+class AgentTable:
+    """
+    Column store for the per-agent state the engine updates every round.
+
+    Each agent owns one slot for the whole game. Slots are handed out in spawn
+    order and never reused, so iterating slots matches the order of `Game.agents`.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """
+        Initialize an empty table.
+
+        Args:
+            capacity: Number of slots to allocate up front.
+
+        """
+        self.size: int = 0
+        self.ids: NDArray[np.int32] = np.zeros(capacity, dtype=np.int32)
+        self.energy: NDArray[np.int32] = np.zeros(capacity, dtype=np.int32)
+        self.x: NDArray[np.int32] = np.zeros(capacity, dtype=np.int32)
+        self.y: NDArray[np.int32] = np.zeros(capacity, dtype=np.int32)
+        self.cooldown: NDArray[np.int32] = np.zeros(capacity, dtype=np.int32)
+        self.steps: NDArray[np.int32] = np.zeros(capacity, dtype=np.int32)
+        self.alive: NDArray[np.bool_] = np.zeros(capacity, dtype=np.bool_)
+
+    def add(self, agent_id: int, location: Location, energy: int, cooldown: int) -> int:
+        """
+        Allocate a slot for a new agent.
+
+        Returns:
+            The slot of the agent.
+
+        """
+        if self.size == len(self.ids):
+            self._grow()
+
+        slot = self.size
+        self.size += 1
+        self.ids[slot] = agent_id
+        self.energy[slot] = energy
+        self.x[slot] = location.x
+        self.y[slot] = location.y
+        self.cooldown[slot] = cooldown
+        self.steps[slot] = 0
+        self.alive[slot] = True
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """Mark the agent in `slot` as dead. Its last state is kept."""
+        self.alive[slot] = False
+
+    def alive_slots(self) -> NDArray[np.intp]:
+        """Return the slots of every living agent, in spawn order."""
+        return np.flatnonzero(self.alive[: self.size])
+
+    def tick_cooldowns(self, amount: int) -> None:
+        """Lower the cooldown of every living agent, clamping at zero."""
+        alive = self.alive[: self.size]
+        cooldown = self.cooldown[: self.size]
+        cooldown[alive] = np.maximum(cooldown[alive] - amount, 0)
+
+    def _grow(self) -> None:
+        capacity = max(1, len(self.ids) * 2)
+        for name in ("ids", "energy", "x", "y", "cooldown", "steps", "alive"):
+            column: NDArray[np.generic] = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: len(column)] = column
+            setattr(self, name, grown)
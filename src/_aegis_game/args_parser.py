@@ -1,14 +1,14 @@
 import argparse
 from dataclasses import dataclass
 
-from .aegis_config import get_feature_value
+from .aegis_config import load_features
 from .constants import Constants
 
 
 @dataclass
 class TypedNamespace:
     command: str
-    amount: int
+    amount: int | None
     world: list[str]
     rounds: int
     agent: str | None
@@ -16,7 +16,11 @@ class TypedNamespace:
     client: bool
     debug: bool
     log: bool
+    preset: str | None
+    workers: int
     init_type: str
+    model: str
+    output: str | None
 
 
 @dataclass
@@ -29,6 +33,8 @@ class LaunchArgs:
     client: bool
     debug: bool
     log: bool
+    preset: str | None = None
+    workers: int = 0
 
 
 @dataclass
@@ -36,6 +42,12 @@ class InitArgs:
     init_type: str
 
 
+@dataclass
+class ExportArgs:
+    model: str
+    output: str | None
+
+
 @dataclass
 class ForgeArgs:
     # If we ever need args
@@ -54,19 +66,33 @@ class Args:
     launch_args: LaunchArgs | None = None
     forge_args: ForgeArgs | None = None
     init_args: InitArgs | None = None
+    export_args: ExportArgs | None = None
     update_args: UpdateArgs | None = None
 
 
-def parse_args() -> Args:
-    parser = argparse.ArgumentParser(description="AEGIS Simulation")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+def resolve_agent_amount(requested: int | None, preset: str | None) -> int:
+    """
+    Resolve the number of agents to run with the rules of the selected config.
+
+    Args:
+        requested: The amount passed with `--amount`, if any.
+        preset: The preset the game runs with, None for the main config.
 
-    # Do not require a config file for commands other than launch.
-    # If the config is missing, we will fall back to a safe default of 1.
+    Returns:
+        The number of agents to spawn.
+
+    """
     try:
-        default_agent_amount = get_feature_value("DEFAULT_AGENT_AMOUNT")
+        features = load_features(preset)
     except FileNotFoundError:
-        default_agent_amount = None
+        # the missing config is reported when the game starts
+        return requested if requested is not None else 1
+    return features.agent_amount(requested)
+
+
+def parse_args() -> Args:
+    parser = argparse.ArgumentParser(description="AEGIS Simulation")
+    subparsers = parser.add_subparsers(dest="command", required=True)
 
     run_parser = subparsers.add_parser("launch", help="Run a game")
     _ = run_parser.add_argument(
@@ -79,8 +105,11 @@ def parse_args() -> Args:
     _ = run_parser.add_argument(
         "--amount",
         type=int,
-        default=default_agent_amount if default_agent_amount is not None else 1,
-        help="Number of agents to run (default = 1)",
+        default=None,
+        help=(
+            "Number of agents to run, only used if the config allows a custom agent "
+            "count (default = the config's DEFAULT_AGENT_AMOUNT, or 1)"
+        ),
     )
     _ = run_parser.add_argument(
         "--rounds",
@@ -121,6 +150,24 @@ def parse_args() -> Args:
         action="store_true",
         help="Enable AEGIS console output logging to a file",
     )
+    _ = run_parser.add_argument(
+        "--preset",
+        type=str,
+        required=False,
+        help=(
+            "Name of a preset under 'config/presets' (without .yaml) to run the "
+            "game with instead of 'config/config.yaml'"
+        ),
+    )
+    _ = run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help=(
+            "Run agent turns in this many worker processes instead of threads "
+            "of the game process (default = 0, no workers)"
+        ),
+    )
 
     _ = subparsers.add_parser("forge", help="Make stub.py file after config changes")
 
@@ -140,13 +187,30 @@ def parse_args() -> Args:
         "update", help="Update the AEGIS client to the latest version"
     )
 
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Export a trained Keras model so agents can use it without TensorFlow",
+    )
+    _ = export_parser.add_argument(
+        "--model",
+        type=str,
+        required=True,
+        help="Path of the Keras model file (e.g., 'agents/agent_prediction/trained_net.keras')",
+    )
+    _ = export_parser.add_argument(
+        "--output",
+        type=str,
+        required=False,
+        help="Path of the .npz file to write (default = the model path with .npz)",
+    )
+
     args = parser.parse_args(namespace=TypedNamespace)
 
     if args.command == "launch":
         return Args(
             command="run",
             launch_args=LaunchArgs(
-                amount=args.amount,
+                amount=resolve_agent_amount(args.amount, args.preset),
                 world=args.world,
                 rounds=args.rounds,
                 agent=args.agent,
@@ -154,6 +218,8 @@ def parse_args() -> Args:
                 client=args.client,
                 debug=args.debug,
                 log=args.log,
+                preset=args.preset,
+                workers=args.workers,
             ),
         )
     if args.command == "forge":
@@ -162,6 +228,11 @@ def parse_args() -> Args:
         return Args(command="init", init_args=InitArgs(init_type=args.init_type))
     if args.command == "update":
         return Args(command="update", update_args=UpdateArgs())
+    if args.command == "export":
+        return Args(
+            command="export",
+            export_args=ExportArgs(model=args.model, output=args.output),
+        )
 
     error = f"Unknown command: {args.command}"
     raise ValueError(error)
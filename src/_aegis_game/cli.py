@@ -1,8 +1,9 @@
 import sys
 import traceback
 
-from .args_parser import parse_args
+from .args_parser import ExportArgs, parse_args
 from .cli_scripts.client_installer import main as install_client
+from .cli_scripts.export_model import export_model
 from .cli_scripts.init_scaffold import init_scaffold
 from .cli_scripts.update_client import main as update_client
 from .play import run
@@ -38,6 +39,8 @@ def main() -> None:  # noqa: C901
         except Exception:  # noqa: BLE001
             traceback.print_exc()
             sys.exit(1)
+    elif args.command == "export":
+        export(args.export_args)
     elif args.command == "update":
         try:
             if args.update_args is None:
@@ -48,5 +51,15 @@ def main() -> None:  # noqa: C901
             sys.exit(1)
 
 
+def export(export_args: ExportArgs | None) -> None:
+    try:
+        if export_args is None:
+            sys.exit(1)
+        export_model(export_args.model, export_args.output)
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
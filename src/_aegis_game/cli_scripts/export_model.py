@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from _aegis_game.agent_predictions.model_cache import load_keras_model
+from _aegis_game.agent_predictions.numpy_model import NumpyModel
+
+
+def export_model(model: str, output: str | None = None) -> None:
+    """
+    Export a trained Keras model to a `.npz` of weights agents can use without TF.
+
+    Args:
+        model: Path of the Keras model file.
+        output: Path of the `.npz` file to write. Defaults to the model's path with
+            a `.npz` suffix.
+
+    """
+    model_path = Path(model)
+    output_path = Path(output) if output is not None else model_path.with_suffix(".npz")
+    NumpyModel.from_keras(load_keras_model(model_path)).save(output_path)
+    print(f"[aegis] Exported {model_path} to {output_path}")
@@ -2,10 +2,16 @@ __all__ = [
     "Cell",
     "CellInfo",
     "Direction",
+    "LayerStack",
     "Location",
+    "RegionInfo",
+    "TeamKnowledge",
 ]
 
 from .cell import Cell
 from .cell_info import CellInfo
 from .direction import Direction
+from .layer_stack import LayerStack
 from .location import Location
+from .region_info import RegionInfo
+from .team_knowledge import TeamKnowledge
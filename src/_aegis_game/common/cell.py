@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from typing import override
+from typing import TYPE_CHECKING, override
 
 from _aegis_game.types import CellType
 
+from .layer_stack import LayerStack
 from .location import Location
-from .objects import Survivor, WorldObject
+
+if TYPE_CHECKING:
+    from .objects import WorldObject
 
 
 class Cell:
+    __slots__: tuple[str, ...] = ("agents", "layers", "location", "move_cost", "type")
+
     def __init__(self, x: int, y: int) -> None:
         self.type: CellType = CellType.NORMAL_CELL
-        self.layers: list[WorldObject] = []
+        self.layers: LayerStack = LayerStack()
         self.move_cost: int = 1
         self.agents: list[int] = []
         self.location: Location = Location(x, y)
@@ -19,12 +24,25 @@ class Cell:
     def _copy(self) -> Cell: # type: ignore
         cell = Cell(self.location.x, self.location.y)
         cell.type = self.type
-        cell.layers = []
+        cell.layers = LayerStack(world_object._copy() for world_object in self.layers)
         cell.move_cost = self.move_cost
         cell.agents = []
         cell.agents.extend(self.agents)
-        for world_object in self.layers:
-            cell.layers.append(world_object._copy())
+        return cell
+
+    def staged_copy(self) -> Cell:
+        """
+        Copy the cell for copy-on-write staging.
+
+        Layers are shared with the original, since only the agent list can change
+        while a round is being played.
+        """
+        cell = Cell.__new__(Cell)
+        cell.type = self.type
+        cell.layers = self.layers
+        cell.move_cost = self.move_cost
+        cell.agents = list(self.agents)
+        cell.location = self.location
         return cell
 
     def setup_cell(self, cell_state_type: str) -> None:
@@ -58,11 +76,12 @@ class Cell:
     def set_killer_cell(self) -> None:
         self.type = CellType.KILLER_CELL
 
-    def get_layers(self) -> list[WorldObject]:
+    def get_layers(self) -> LayerStack:
         return self.layers
 
     def add_layer(self, layer: WorldObject) -> None:
-        self.layers.append(layer)
+        """Add a layer below the existing ones."""
+        self.layers.add_bottom(layer)
 
     def remove_top_layer(self) -> WorldObject:
         """
@@ -77,25 +96,19 @@ class Cell:
             IndexError: If there are no layers to remove.
 
         """
-        return self.layers.pop(0)
+        return self.layers.pop()
 
     def get_top_layer(self) -> WorldObject | None:
-        if not self.layers:
-            return None
-        return self.layers[0]
+        return self.layers.top
 
     def set_top_layer(self, top_layer: WorldObject | None) -> None:
         self.layers.clear()
         if top_layer is None:
             return
-        self.layers.append(top_layer)
+        self.layers.push(top_layer)
 
     def number_of_survivors(self) -> int:
-        count = 0
-        for layer in self.layers:
-            if isinstance(layer, Survivor):
-                count += 1
-        return count
+        return self.layers.survivor_count
 
     def is_spawn(self) -> bool:
         return self.type == CellType.SPAWN_CELL
@@ -2,6 +2,7 @@ from typing import override
 
 from _aegis_game.types import CellType
 
+from .layer_stack import LayerStack
 from .location import Location
 from .objects import WorldObject
 
@@ -19,9 +20,18 @@ class CellInfo:
 
     """
 
+    __slots__: tuple[str, ...] = (
+        "_layers",
+        "_stack",
+        "agents",
+        "location",
+        "move_cost",
+        "type",
+    )
+
     def __init__(
         self,
-        layers: list[WorldObject],
+        layers: list[WorldObject] | LayerStack,
         cell_type: CellType,
         location: Location | None,
         move_cost: int,
@@ -31,11 +41,30 @@ class CellInfo:
         self.location: Location = location if location is not None else Location(-1, -1)
         self.move_cost: int = move_cost
         self.agents: list[int] = agents if agents is not None else []
-        self.layers: list[WorldObject] = layers
+        # a cell's stack is only turned into a list if the layers are asked for
+        self._stack: LayerStack | None = None
+        self._layers: list[WorldObject] | None = None
+        if isinstance(layers, LayerStack):
+            self._stack = layers
+        else:
+            self._layers = layers
+
+    @property
+    def layers(self) -> list[WorldObject]:
+        """Stack of world objects present in the cell, top first."""
+        if self._layers is None:
+            self._layers = self._stack.top_first() if self._stack is not None else []
+        return self._layers
+
+    @layers.setter
+    def layers(self, layers: list[WorldObject]) -> None:
+        self._layers = layers
 
     @property
     def top_layer(self) -> WorldObject | None:
         """Get the top-most layer of the cell."""
+        if self._layers is None and self._stack is not None:
+            return self._stack.top
         return self.layers[0] if self.layers else None
 
     def is_killer_cell(self) -> bool:
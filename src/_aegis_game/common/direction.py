@@ -8,8 +8,16 @@ class Direction(Enum):
     Represents the eight principal compass directions plus the center (no movement).
 
     Each direction has a tuple value representing its (dx, dy) movement on a grid.
+
+    Attributes:
+        dx: The change in the x direction.
+        dy: The change in the y direction.
+
     """
 
+    dx: int
+    dy: int
+
     NORTH = (0, 1)
     """Direction that points north (up)."""
 
@@ -37,15 +45,10 @@ class Direction(Enum):
     CENTER = (0, 0)
     """Direction that points center (not moving)."""
 
-    @property
-    def dx(self) -> int:
-        """The change in the x direction."""
-        return self.value[0]
-
-    @property
-    def dy(self) -> int:
-        """The change in the y direction."""
-        return self.value[1]
+    def __init__(self, dx: int, dy: int) -> None:
+        # plain attributes, so reading them skips the enum `value` lookup
+        self.dx = dx
+        self.dy = dy
 
     def rotate_left(self) -> Direction:
         """
@@ -105,3 +108,10 @@ dir_order = [
     Direction.CENTER,
 ]
 dir_to_index = {d: i for i, d in enumerate(dir_order)}
+
+# (dx, dy) of every direction in `dir_order` order
+DIRECTION_OFFSETS: tuple[tuple[int, int], ...] = tuple((d.dx, d.dy) for d in dir_order)
+# maps the sign of (dx, dy) to the direction pointing that way
+OFFSET_TO_DIRECTION: dict[tuple[int, int], Direction] = {
+    (d.dx, d.dy): d for d in dir_order
+}
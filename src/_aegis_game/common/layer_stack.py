@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, override
+
+from .objects import Rubble, Survivor, WorldObject
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class LayerStack:
+    """
+    The stack of world objects in a cell.
+
+    Layers are stored bottom first, so the top of the stack is the end of the list
+    and pushing or popping the top is O(1). The number of survivors and rubble in
+    the stack is kept up to date as layers are added and removed.
+
+    Iterating the stack yields the layers top first, the same order agents see in
+    `CellInfo.layers`.
+
+    Attributes:
+        survivor_count: Number of survivors in the stack.
+        rubble_count: Number of rubble objects in the stack.
+
+    """
+
+    __slots__: tuple[str, ...] = ("_layers", "rubble_count", "survivor_count")
+
+    def __init__(self, layers: Iterable[WorldObject] = ()) -> None:
+        """
+        Initialize a stack.
+
+        Args:
+            layers: The initial layers, top first.
+
+        """
+        self._layers: list[WorldObject] = list(layers)
+        self._layers.reverse()
+        self.survivor_count: int = 0
+        self.rubble_count: int = 0
+        for layer in self._layers:
+            self._count(layer, 1)
+
+    def _count(self, layer: WorldObject, amount: int) -> None:
+        if isinstance(layer, Survivor):
+            self.survivor_count += amount
+        elif isinstance(layer, Rubble):
+            self.rubble_count += amount
+
+    @property
+    def top(self) -> WorldObject | None:
+        """The top layer, or None if the stack is empty."""
+        return self._layers[-1] if self._layers else None
+
+    def push(self, layer: WorldObject) -> None:
+        """Put a layer on top of the stack."""
+        self._layers.append(layer)
+        self._count(layer, 1)
+
+    def pop(self) -> WorldObject:
+        """
+        Remove and return the top layer.
+
+        Returns:
+            The removed layer.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        """
+        layer = self._layers.pop()
+        self._count(layer, -1)
+        return layer
+
+    def add_bottom(self, layer: WorldObject) -> None:
+        """Put a layer below every other layer, used when building a cell."""
+        self._layers.insert(0, layer)
+        self._count(layer, 1)
+
+    def clear(self) -> None:
+        """Remove every layer."""
+        self._layers.clear()
+        self.survivor_count = 0
+        self.rubble_count = 0
+
+    def top_first(self) -> list[WorldObject]:
+        """Return a new list of the layers, top first."""
+        return self._layers[::-1]
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __iter__(self) -> Iterator[WorldObject]:
+        return reversed(self._layers)
+
+    @override
+    def __str__(self) -> str:
+        return str(self.top_first())
+
+    @override
+    def __repr__(self) -> str:
+        return self.__str__()
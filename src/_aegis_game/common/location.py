@@ -1,31 +1,103 @@
 from __future__ import annotations
 
-from typing import override
+from typing import NoReturn, override
 
-from _aegis_game.common.direction import Direction
+from _aegis_game.common.direction import OFFSET_TO_DIRECTION, Direction
+
+# Interned locations covering `[0, _intern_width) x [0, _intern_height)`, indexed by
+# `x + y * _intern_width`, see `Location.intern`
+_interned: list[Location] = []
+_intern_width = 0
+_intern_height = 0
 
 
 class Location:
     """
     Represents a coordinate location with x and y integer values.
 
+    Locations are immutable: `x` and `y` can't be assigned to, use `add` or
+    create a new `Location` to get another location. Locations on the current
+    world are interned, so creating one for a cell of the world doesn't allocate
+    a new object.
+
     Attributes:
         x: The x-coordinate.
         y: The y-coordinate.
 
     """
 
-    def __init__(self, x: int, y: int) -> None:
+    __slots__: tuple[str, ...] = ("x", "y")
+    x: int
+    y: int
+
+    def __new__(cls, x: int, y: int) -> Location:  # noqa: PYI034
         """
-        Initialize a Location with given x and y coordinates.
+        Create a Location with given x and y coordinates.
 
         Args:
             x: The x-coordinate.
             y: The y-coordinate.
 
         """
-        self.x: int = x
-        self.y: int = y
+        if (
+            type(x) is int
+            and type(y) is int
+            and 0 <= x < _intern_width
+            and 0 <= y < _intern_height
+            and cls is Location
+        ):
+            return _interned[x + y * _intern_width]
+        return cls._create(x, y)
+
+    @classmethod
+    def _create(cls, x: int, y: int) -> Location:
+        location = object.__new__(cls)
+        object.__setattr__(location, "x", x)
+        object.__setattr__(location, "y", y)
+        return location
+
+    @staticmethod
+    def intern(width: int, height: int) -> None:
+        """
+        Intern every location of a world of the given size.
+
+        The locations of the previous world are dropped from the table, so it
+        never holds more than the current world's cells. Those locations stay
+        valid, they are just no longer shared.
+
+        Args:
+            width: The width of the world.
+            height: The height of the world.
+
+        """
+        global _interned, _intern_width, _intern_height  # noqa: PLW0603
+
+        if width == _intern_width and height == _intern_height:
+            return
+
+        _interned = [
+            _interned[x + y * _intern_width]
+            if x < _intern_width and y < _intern_height
+            else Location._create(x, y)
+            for y in range(height)
+            for x in range(width)
+        ]
+        _intern_width = width
+        _intern_height = height
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        error = "Location is immutable"
+        raise AttributeError(error)
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        error = "Location is immutable"
+        raise AttributeError(error)
+
+    @override
+    def __reduce__(self) -> tuple[type[Location], tuple[int, int]]:
+        return (Location, (self.x, self.y))
 
     def add(self, direction: Direction) -> Location:
         """
@@ -54,21 +126,7 @@ class Location:
         dx = location.x - self.x
         dy = location.y - self.y
 
-        key = (dx > 0) - (dx < 0), (dy > 0) - (dy < 0)
-
-        direction_map = {
-            (1, 1): Direction.NORTHEAST,
-            (1, -1): Direction.SOUTHEAST,
-            (-1, 1): Direction.NORTHWEST,
-            (-1, -1): Direction.SOUTHWEST,
-            (1, 0): Direction.EAST,
-            (-1, 0): Direction.WEST,
-            (0, 1): Direction.NORTH,
-            (0, -1): Direction.SOUTH,
-            (0, 0): Direction.CENTER,
-        }
-
-        return direction_map.get(key, Direction.CENTER)
+        return OFFSET_TO_DIRECTION[(dx > 0) - (dx < 0), (dy > 0) - (dy < 0)]
 
     def distance_to(self, location: Location) -> int:
         """
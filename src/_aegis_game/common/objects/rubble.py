@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import override
+from typing import NoReturn, override
 
 from .world_object import WorldObject
 
@@ -9,6 +9,8 @@ class Rubble(WorldObject):
     """
     Represents a rubble object in the world.
 
+    Rubble is immutable.
+
     Attributes:
         id: Unique identifier for the rubble.
         energy_required: Amount of energy needed to remove the rubble.
@@ -16,13 +18,30 @@ class Rubble(WorldObject):
 
     """
 
+    __slots__: tuple[str, ...] = ("agents_required", "energy_required")
+    energy_required: int
+    agents_required: int
+
     def __init__(
         self, rubble_id: int = -1, energy_required: int = 1, agents_required: int = 1
     ) -> None:
-        super().__init__()
-        self.id: int = rubble_id
-        self.energy_required: int = energy_required
-        self.agents_required: int = agents_required
+        object.__setattr__(self, "id", rubble_id)
+        object.__setattr__(self, "energy_required", energy_required)
+        object.__setattr__(self, "agents_required", agents_required)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        error = "Rubble is immutable"
+        raise AttributeError(error)
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        error = "Rubble is immutable"
+        raise AttributeError(error)
+
+    @override
+    def __reduce__(self) -> tuple[type[Rubble], tuple[int, int, int]]:
+        return (Rubble, (self.id, self.energy_required, self.agents_required))
 
     def _copy(self) -> Rubble: # type: ignore
         rubble = Rubble(self.id, self.energy_required, self.agents_required)
@@ -15,6 +15,8 @@ class Survivor(WorldObject):
 
     """
 
+    __slots__: tuple[str, ...] = ("health",)
+
     def __init__(self, survivor_id: int = -1, health: int = 1) -> None:
         super().__init__()
         self.id: int = survivor_id
@@ -5,6 +5,8 @@ from typing import override
 
 
 class WorldObject(ABC):
+    __slots__: tuple[str, ...] = ("id",)
+
     def __init__(self) -> None:
         self.id: int = -1
 
@@ -0,0 +1,94 @@
+from typing import override
+
+import numpy as np
+from numpy.typing import NDArray
+
+from _aegis_game.types import CellType, LayerKind
+
+from .location import Location
+
+
+class RegionInfo:
+    """
+    Represents information about a rectangle of cells in the world.
+
+    Every array is indexed `[y, x]`, relative to the region's `location`, so the
+    cell at `Location(x, y)` is at `[y - location.y, x - location.x]`.
+
+    Attributes:
+        location: The coordinates of the region's lowest x and y corner.
+        move_costs: The movement cost to traverse each cell.
+        cell_types: The `CellType` value of each cell.
+        top_layer_kinds: What is on top of each cell, 0 for nothing, 1 for a
+            survivor and 2 for rubble.
+        agent_counts: Number of agents in each cell, 0 where agents are hidden.
+        visible: Whether the agents in each cell are visible.
+
+    """
+
+    __slots__: tuple[str, ...] = (
+        "agent_counts",
+        "cell_types",
+        "location",
+        "move_costs",
+        "top_layer_kinds",
+        "visible",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        location: Location,
+        *,
+        move_costs: NDArray[np.int32],
+        cell_types: NDArray[np.int8],
+        top_layer_kinds: NDArray[np.int8],
+        agent_counts: NDArray[np.int32],
+        visible: NDArray[np.bool_],
+    ) -> None:
+        self.location: Location = location
+        self.move_costs: NDArray[np.int32] = move_costs
+        self.cell_types: NDArray[np.int8] = cell_types
+        self.top_layer_kinds: NDArray[np.int8] = top_layer_kinds
+        self.agent_counts: NDArray[np.int32] = agent_counts
+        self.visible: NDArray[np.bool_] = visible
+
+    @property
+    def width(self) -> int:
+        """Number of cells along x."""
+        return self.move_costs.shape[1]
+
+    @property
+    def height(self) -> int:
+        """Number of cells along y."""
+        return self.move_costs.shape[0]
+
+    def killer_cells(self) -> NDArray[np.bool_]:
+        """Return whether each cell is a killer cell."""
+        return self.cell_types == CellType.KILLER_CELL.value
+
+    def charging_cells(self) -> NDArray[np.bool_]:
+        """Return whether each cell is a charging cell."""
+        return self.cell_types == CellType.CHARGING_CELL.value
+
+    def survivor_cells(self) -> NDArray[np.bool_]:
+        """Return whether each cell has a survivor on top."""
+        return self.top_layer_kinds == LayerKind.SURVIVOR.value
+
+    def rubble_cells(self) -> NDArray[np.bool_]:
+        """Return whether each cell has rubble on top."""
+        return self.top_layer_kinds == LayerKind.RUBBLE.value
+
+    @override
+    def __str__(self) -> str:
+        return (
+            f"RegionInfo(\n"
+            f"  X: {self.location.x},\n"
+            f"  Y: {self.location.y},\n"
+            f"  Width: {self.width},\n"
+            f"  Height: {self.height}\n"
+            f")"
+        )
+
+    @override
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,76 @@
+from typing import override
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class TeamKnowledge:
+    """
+    Represents what a team has learned about the world so far.
+
+    The arrays are read-only views of the team's knowledge, kept up to date by the
+    game at the start of every round, so they can be kept around between turns.
+    Every array is indexed `[y, x]`.
+
+    Attributes:
+        move_costs: The movement cost to traverse each cell, as far as the team
+            knows. With hidden move costs, cells no agent of the team has
+            visited cost 1.
+        top_layer_kinds: What is on top of each cell this round, 0 for nothing,
+            1 for a survivor and 2 for rubble.
+        visited: Whether an agent of the team has been on or next to each cell.
+        scanned: Whether a drone scan of the team has covered each cell.
+
+    """
+
+    __slots__: tuple[str, ...] = (
+        "move_costs",
+        "scanned",
+        "top_layer_kinds",
+        "visited",
+    )
+
+    def __init__(
+        self,
+        move_costs: NDArray[np.int32],
+        top_layer_kinds: NDArray[np.int8],
+        visited: NDArray[np.bool_],
+        scanned: NDArray[np.bool_],
+    ) -> None:
+        self.move_costs: NDArray[np.int32] = move_costs
+        self.top_layer_kinds: NDArray[np.int8] = top_layer_kinds
+        self.visited: NDArray[np.bool_] = visited
+        self.scanned: NDArray[np.bool_] = scanned
+
+    @classmethod
+    def read_only(
+        cls,
+        move_costs: NDArray[np.int32],
+        top_layer_kinds: NDArray[np.int8],
+        visited: NDArray[np.bool_],
+        scanned: NDArray[np.bool_],
+    ) -> "TeamKnowledge":
+        """Return read-only views of the arrays, without copying them."""
+        views: list[NDArray[np.generic]] = []
+        for array in (move_costs, top_layer_kinds, visited, scanned):
+            # a view over a read-only buffer can't be made writeable again, unlike
+            # a view of the array with its flag cleared
+            buffer = memoryview(array).toreadonly()
+            views.append(np.frombuffer(buffer, dtype=array.dtype).reshape(array.shape))
+        return cls(*views)  # pyright: ignore[reportArgumentType]
+
+    @override
+    def __str__(self) -> str:
+        height, width = self.move_costs.shape
+        return (
+            f"TeamKnowledge(\n"
+            f"  Width: {width},\n"
+            f"  Height: {height},\n"
+            f"  Visited: {int(np.count_nonzero(self.visited))},\n"
+            f"  Scanned: {int(np.count_nonzero(self.scanned))}\n"
+            f")"
+        )
+
+    @override
+    def __repr__(self) -> str:
+        return self.__str__()
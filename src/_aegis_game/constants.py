@@ -13,6 +13,7 @@ class Constants:
     DEFAULT_MAX_ROUNDS: int = 1000
     MESSAGE_HISTORY_LIMIT: int = 5
     MAX_TURN_TIME_LIMIT: float = 1.0
+    TURN_DEADLINE: float = 5.0  # Hard limit, turns still running are stopped
     INITIAL_TEAM_LUMENS: int = 100
 
     # Points constants
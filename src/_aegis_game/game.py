@@ -1,6 +1,7 @@
 import random
 import time
 from collections.abc import Callable
+from pathlib import Path
 from typing import cast
 
 import numpy as np
@@ -8,22 +9,30 @@ from numpy.typing import NDArray
 
 from _aegis_game.decorator import requires
 
-from .aegis_config import get_feature_value, has_feature
+from .aegis_config import Features, load_features
 from .agent import Agent
 from .agent_controller import AgentController
 from .agent_predictions.prediction_handler import PredictionHandler
+from .agent_table import AgentTable
 from .agent_type import AgentType
 from .args_parser import LaunchArgs
-from .common import Cell, CellInfo, Direction, Location
+from .common import Cell, CellInfo, Direction, Location, RegionInfo, TeamKnowledge
 from .common.objects import Rubble, Survivor
 from .constants import Constants
 from .game_pb import GamePb
 from .id_gen import IDGenerator
+from .knowledge import KnowledgeGrid
 from .logger import LOGGER
+from .pathfinding import PathFinder
+from .process_runner.pool import AgentProcessPool
+from .sandbox.core import MainTemplate
+from .sandbox.memory import BYTES_PER_MB, MemoryMeter
+from .sandbox.meter import InstructionMeter
 from .sandbox.sandbox import Sandbox
+from .sandbox.scheduler import TurnScheduler
 from .team import Team
 from .team_info import TeamInfo
-from .types import GameOverReason, MethodDict
+from .types import CellType, GameOverReason, LayerKind, MethodDict
 from .world import World
 
 
@@ -34,9 +43,13 @@ class Game:
         args: LaunchArgs,
         world: World,
         game_pb: GamePb,
+        features: Features | None = None,
     ) -> None:
         random.seed(world.seed)
+        self.features: Features = features if features is not None else load_features()
         self.code: list[Sandbox | None] = code
+        # each team's main module is executed once and cloned for its agents
+        self.main_templates: list[MainTemplate] = [MainTemplate() for _ in code]
         self.args: LaunchArgs = args
         self.running: bool = True
         self.reason: GameOverReason | None = None
@@ -51,20 +64,68 @@ class Game:
         self._queued_layers_to_remove: dict[Location, dict[Team, int]] = {}
         self._drone_scans: dict[Location, dict[Team, int]] = {}
         self._pending_drone_scans: dict[Location, dict[Team, int]] = {}
+        # only used when SHARE_VISITED_CELLS is enabled
+        self._team_visited: dict[Team, NDArray[np.bool_]] = {}
+        # owner of a visited map -> times it gained cells, see `visited_owner`
+        self._visited_revisions: dict[Team | int, int] = {}
+        self.path_finder: PathFinder = PathFinder(world.width)
         self._prediction_handler: PredictionHandler | None = (
-            PredictionHandler(args) if has_feature("ALLOW_AGENT_PREDICTIONS") else None
+            PredictionHandler(args) if self.features.allow_agent_predictions else None
         )
         self.agents: dict[int, Agent] = {}
+        self.agent_table: AgentTable = AgentTable()
         self.team_agents: dict[Team, str] = {}
         if self.args.agent is not None:
             self.team_agents[Team.GOOBS] = self.args.agent
         if self.args.agent2 is not None:
             self.team_agents[Team.VOIDSEERS] = self.args.agent2
-        self._init_spawn()
-        self.next_world: World = None # type: ignore
+        # every agent of the game plays its turns on the same few threads
+        self.turn_scheduler: TurnScheduler = TurnScheduler(
+            deadline=Constants.TURN_DEADLINE
+        )
+        # only set when turns are metered instead of timed
+        self.instruction_meter: InstructionMeter | None = None
+        if self.features.turn_instruction_budget > 0:
+            self.instruction_meter = InstructionMeter(
+                self.features.turn_instruction_budget
+            )
+            for sandbox in code:
+                if sandbox is not None:
+                    self.instruction_meter.watch(sandbox)
+        # only set when agents' memory is accounted
+        self.memory_meter: MemoryMeter | None = (
+            MemoryMeter(self.features.agent_memory_quota_mb)
+            if self.features.agent_memory_quota_mb > 0
+            else None
+        )
+        # agent id -> most memory the agent held, reported at the end of the game
+        self.memory_peaks: dict[int, int] = {}
+        # only filled when ALLOW_TEAM_KNOWLEDGE is enabled
+        self.team_knowledge: dict[Team, KnowledgeGrid] = {}
+        if self.features.allow_team_knowledge:
+            for team in Team:
+                self.team_knowledge[team] = KnowledgeGrid(
+                    world, hidden_move_costs=self.features.hidden_move_costs
+                )
+        self._stopped: bool = False
+        # only set when agent turns run in worker processes
+        self.agent_pool: AgentProcessPool | None = None
+        try:
+            if args.workers > 0:
+                self.agent_pool = AgentProcessPool(self, args.workers)
+            self._init_spawn()
+        except Exception:
+            # workers, turn threads and monitoring tool ids outlive a failed game
+            self.stop()
+            raise
+        self.current_world.commit()
+        # fixed for the whole game, inspect it to profile a round phase by phase
+        self.round_phases: list[tuple[str, Callable[[], None]]] = (
+            self._build_round_phases()
+        )
 
     def _init_spawn(self) -> None:
-        if has_feature("ALLOW_AGENT_TYPES"):
+        if self.features.allow_agent_types:
             # if agent types enabled, spawn one commander at a random spawn location for each team (team needs to spawn rest of agents)
 
             spawns = self.get_spawns()
@@ -125,32 +186,130 @@ class Game:
         start = time.perf_counter()
         agent.turn()
         end = time.perf_counter()
-        duration = end - start
+        # importing heavy modules is setup, it doesn't count against the turn
+        setup = agent.core.setup_time  # pyright: ignore[reportOptionalMemberAccess]
+        self._enforce_turn_time(agent, end - start - setup)
+        self._enforce_memory_quota(agent)
+
+    def _enforce_turn_time(self, agent: Agent, duration: float) -> None:
+        if agent.timed_out:
+            LOGGER.warning(
+                f"{agent.id}'s turn was stopped at the {Constants.TURN_DEADLINE}s deadline"
+            )
+            self.kill_agent(agent.id)
+            return
+        # metered turns are stopped by their instruction budget instead
+        if self.features.turn_instruction_budget > 0:
+            return
         if duration >= Constants.MAX_TURN_TIME_LIMIT:
             LOGGER.warning(
                 f"{agent.id}'s turn took {duration:.2f}s (over {Constants.MAX_TURN_TIME_LIMIT}s limit)"
             )
             self.kill_agent(agent.id)
 
+    def _enforce_memory_quota(self, agent: Agent) -> None:
+        if self.memory_meter is None:
+            return
+        self.memory_peaks[agent.id] = agent.memory_peak
+        # the agent may already have been killed for its turn time
+        if agent.id in self.agents and agent.memory_peak > self.memory_meter.quota:
+            LOGGER.warning(
+                f"{agent.id}'s memory peaked at {agent.memory_peak / BYTES_PER_MB:.1f} MB (over {self.features.agent_memory_quota_mb} MB quota)"
+            )
+            self.kill_agent(agent.id)
+
+    def _build_round_phases(self) -> list[tuple[str, Callable[[], None]]]:
+        """
+        Assemble the phases of a round from the enabled features.
+
+        Phases of disabled subsystems are left out so they cost nothing per round.
+
+        Returns:
+            The `(name, phase)` pairs in the order they run each round.
+
+        """
+        features = self.features
+
+        phases: list[tuple[str, Callable[[], None]]] = []
+        if features.allow_drone_scan:
+            phases.append(("tick_drone_scans", self.tick_drone_scans))
+        phases.append(("start_round", self.start_round))
+        if features.allow_team_knowledge:
+            phases.append(("update_team_knowledge", self.update_team_knowledge))
+        if self.agent_pool is not None:
+            phases.append(("run_turns", self.run_remote_turns))
+        else:
+            phases.append(("run_turns", self.run_turns))
+        if features.allow_agent_messages:
+            phases.append(("rotate_message_buffers", self.rotate_message_buffers))
+        if features.allow_drone_scan:
+            phases.append(
+                ("activate_pending_drone_scans", self.activate_pending_drone_scans)
+            )
+            phases.append(("send_drone_scan_update", self.send_drone_scan_update))
+        if features.surv_health_decay_rate > 0:
+            phases.append(
+                ("apply_survivor_health_decay", self.apply_survivor_health_decay)
+            )
+        phases.append(("grim_reaper", self.grim_reaper))
+        # agent moves, spawns and deaths only become visible from next round on
+        phases.append(("commit_world", self.current_world.commit))
+        phases.append(("serialize_team_info", self.serialize_team_info))
+        if features.allow_drone_scan:
+            phases.append(("serialize_drone_scans", self.serialize_drone_scans))
+        phases.append(("end_round", self.game_pb.end_round))
+        phases.append(("check_game_over", self.check_game_over))
+        return phases
+
     def run_round(self) -> None:
-        self.tick_drone_scans()
+        for _, phase in self.round_phases:
+            phase()
+
+    def start_round(self) -> None:
         self.round += 1
         self.game_pb.start_round(self.round)
         self.team_info.add_lumens(Team.GOOBS, Constants.LUMENS_PER_ROUND)
-        self.team_info.add_lumens(Team.VOIDSEERS, Constants.LUMENS_PER_ROUND)        
-        self.next_world = self.current_world._copy()
+        self.team_info.add_lumens(Team.VOIDSEERS, Constants.LUMENS_PER_ROUND)
+        self.agent_table.tick_cooldowns(Constants.COOLDOWN_TICK)
+
+    def update_team_knowledge(self) -> None:
+        """Add what each team's agents can see this round to the team's knowledge."""
+        for team, grid in self.team_knowledge.items():
+            agents = [agent for agent in self.agents.values() if agent.team == team]
+            grid.update(
+                self.current_world,
+                [agent.location for agent in agents],
+                [agent.has_visited for agent in agents],
+                [loc for loc, teams in self._drone_scans.items() if team in teams],
+            )
+
+    def run_turns(self) -> None:
         self.for_each_agent(self._run_turn)
-        self.current_world = self.next_world
-        self.next_world = self.current_world._copy()
-        self.rotate_message_buffers()
-        self.activate_pending_drone_scans()
-        self.game_pb.send_drone_scan_update(self._drone_scans)
-        self.apply_survivor_health_decay()
-        self.grim_reaper()
-        self.serialize_team_info()
-        self.serialize_drone_scans()
-        self.game_pb.end_round()
-        self.check_game_over()
+        self.game_pb.add_turns(self.agent_table)
+
+    def run_remote_turns(self) -> None:
+        """
+        Play every agent's turn in the worker processes, then apply them in order.
+
+        Agents think against the world as it was at the start of the round, seeing
+        only their own actions. Their intents are then applied through their
+        controllers in `for_each_agent` order, so the outcome of each action is
+        decided by the game exactly as for agents running in this process.
+        """
+        if self.agent_pool is None:
+            error = "Agent turns aren't running in worker processes"
+            raise RuntimeError(error)
+        pool = self.agent_pool
+        results = pool.play(list(self.agents.values()))
+
+        def apply(agent: Agent) -> None:
+            result = results[agent.id]
+            agent.apply_remote_turn(result, pool.controller(agent.id))
+            self._enforce_turn_time(agent, result.duration)
+            self._enforce_memory_quota(agent)
+
+        self.for_each_agent(apply)
+        self.game_pb.add_turns(self.agent_table)
 
     def rotate_message_buffers(self) -> None:
         """
@@ -174,36 +333,46 @@ class Game:
 
         if self.reason is not None:
             self.stop()
-            if has_feature("ADVANCED_SCORING_SYSTEM"):
+            if self.features.advanced_scoring_system:
                 for team in Team:
                     alive_agents = self.team_info.get_units(team)
                     alive_agent_score = alive_agents * Constants.ALIVE_AGENT_SCORE
                     self.team_info.add_score(team, alive_agent_score)
 
     def grim_reaper(self) -> None:
-        dead_agents: list[Agent] = []
-
-        for agent in self.agents.values():
-            died = False
-            cell = self.get_cell_at_current(agent.location)
-            if agent.energy_level <= 0:
-                LOGGER.info("Agent %s ran out of energy and died.\n", agent.id)
-                died = True
-            elif cell and cell.is_killer_cell():
-                LOGGER.info("Agent %s ran into killer cell and died.\n", agent.id)
-                died = True
-
-            if died:
-                dead_agents.append(agent)
-
-        for agent in dead_agents:
-            self.kill_agent(agent.id)
+        table = self.agent_table
+        slots = table.alive_slots()
+        out_of_energy = table.energy[slots] <= 0
+        cell_indices = table.x[slots] + table.y[slots] * self.current_world.width
+        on_killer_cell = (
+            self.current_world.cell_types[cell_indices] == CellType.KILLER_CELL.value
+        )
+        died = out_of_energy | on_killer_cell
+
+        for agent_id, no_energy in zip(
+            table.ids[slots[died]].tolist(), out_of_energy[died].tolist(), strict=True
+        ):
+            if no_energy:
+                LOGGER.info("Agent %s ran out of energy and died.\n", agent_id)
+            else:
+                LOGGER.info("Agent %s ran into killer cell and died.\n", agent_id)
+            self.kill_agent(agent_id)
 
         self.process_layers_queued_to_be_removed()
 
     def stop(self) -> None:
         self.running = False
+        if self._stopped:
+            return
+        self._stopped = True
         self.for_each_agent(lambda agent: self.kill_agent(agent.id))
+        self.turn_scheduler.shutdown()
+        if self.instruction_meter is not None:
+            self.instruction_meter.close()
+        if self.memory_meter is not None:
+            self.memory_meter.close()
+        if self.agent_pool is not None:
+            self.agent_pool.close()
 
     def end_if_no_units(self, _team: Team) -> None:
         if self.reason is not None:
@@ -221,8 +390,11 @@ class Game:
     def kill_agent(self, agent_id: int) -> None:
         agent = self.agents[agent_id]
         del self.agents[agent_id]
+        self.agent_table.remove(agent.slot)
         self.remove_agent_from_loc(agent_id, agent.location)
         agent.kill()
+        if self.agent_pool is not None:
+            self.agent_pool.kill(agent_id)
         self.game_pb.add_dead(agent_id)
         self.team_info.add_units(agent.team, -1)
         self.end_if_no_units(agent.team)
@@ -237,8 +409,12 @@ class Game:
         agent_id = self.id_gen.next_id() if agent_id is None else agent_id
         energy = int(self.current_world.start_energy * agent_type.energy_multiplier)
         agent = Agent(self, agent_id, loc, team, energy, agent_type)
-        ac = AgentController(self, agent)
-        agent.launch(self.code[team.value], self.methods(ac), debug=self.args.debug)
+        ac = AgentController(self, agent, self.features)
+        if self.agent_pool is not None:
+            agent.debug = self.args.debug
+            self.agent_pool.launch(agent, ac)
+        else:
+            agent.launch(self.code[team.value], self.methods(ac), debug=self.args.debug)
         self.add_agent(agent, loc)
         self.team_info.add_units(agent.team, 1)
         self.game_pb.add_spawn(agent.id, agent.team, agent.location)
@@ -247,13 +423,16 @@ class Game:
         if agent not in self.agents:
             self.agents[agent.id] = agent
 
-            cell = self.get_cell_at_current(loc)
+            cell = self.get_cell_at_next(loc)
             cell.agents.append(agent.id)
             LOGGER.info("Added agent %s", agent.id)
 
     def get_agent(self, agent_id: int) -> Agent:
         return self.agents[agent_id]
 
+    def agent_directory(self, team: Team) -> Path:
+        return Path.cwd() / "agents" / self.team_agents[team]
+
     def for_each_agent(self, fn: Callable[[Agent], None]) -> None:
         for agent in list(self.agents.values()):
             fn(agent)
@@ -275,9 +454,11 @@ class Game:
             # set true if at least one team meets threshold to remove the layer
             will_remove = False
             agents_needed_to_remove = 1
-            top_layer = self.get_cell_info_at_current(loc).top_layer
-            if isinstance(top_layer, Rubble):
-                agents_needed_to_remove = top_layer.agents_required
+            index = loc.x + loc.y * self.current_world.width
+            if self.current_world.top_layer_kinds[index] == LayerKind.RUBBLE.value:
+                agents_needed_to_remove = int(
+                    self.current_world.top_rubble_agents[index]
+                )
             # see if each team met threshold to acc remove the layer
             for team, num_agents_queued in teams_data.items():
                 if num_agents_queued >= agents_needed_to_remove:
@@ -296,8 +477,7 @@ class Game:
 
         if isinstance(top_layer, Survivor):
             points = 0
-            decay_rate = get_feature_value("SURV_HEALTH_DECAY_RATE")
-            if decay_rate is not None and decay_rate > 0:
+            if self.features.surv_health_decay_rate > 0:
                 points = top_layer.health
             else:
                 points = (
@@ -310,26 +490,49 @@ class Game:
             self.team_info.add_score(team, points)
 
     def remove_layer(self, loc: Location) -> None:
-        cell = self.get_cell_at_current(loc)
-        _ = cell.remove_top_layer()
+        index = loc.x + loc.y * self.current_world.width
+        self.current_world.remove_top_layer(index)
         self.game_pb.add_removed_layer(loc)
 
-    def mark_surrounding_cells_visited(self, agent: Agent, loc: Location) -> None:
-        for direction in Direction:
-            if direction == Direction.CENTER:
-                continue
+    def get_visited_map(self, team: Team) -> NDArray[np.bool_]:
+        """
+        Return the visited map for a new agent, indexed by `[y, x]`.
 
-            new_loc = loc.add(direction)
-            if not self.on_map(new_loc):
-                continue
+        With `SHARE_VISITED_CELLS` enabled every agent of a team gets the same map,
+        otherwise each agent gets its own.
+        """
+        shape = (self.current_world.height, self.current_world.width)
+        if not self.features.share_visited_cells:
+            return np.zeros(shape, dtype=np.bool_)
+
+        if team not in self._team_visited:
+            self._team_visited[team] = np.zeros(shape, dtype=np.bool_)
+        return self._team_visited[team]
 
-            index = new_loc.x + new_loc.y * self.current_world.width
-            agent.has_visited[index] = True
+    def visited_owner(self, agent: Agent) -> Team | int:
+        """Return whose visited map an agent has, its team's or its own."""
+        return agent.team if self.features.share_visited_cells else agent.id
+
+    def visited_revision(self, agent: Agent) -> int:
+        """Return how many times the agent's visited map gained cells."""
+        return self._visited_revisions.get(self.visited_owner(agent), 0)
+
+    def mark_surrounding_cells_visited(self, agent: Agent, loc: Location) -> None:
+        visited = agent.has_visited
+        # only the eight neighbours are marked, not the cell itself
+        center = visited[loc.y, loc.x]
+        visited[loc.y, loc.x] = True
+        around = visited[max(loc.y - 1, 0) : loc.y + 2, max(loc.x - 1, 0) : loc.x + 2]
+        if not around.all():
+            around[...] = True
+            owner = self.visited_owner(agent)
+            self._visited_revisions[owner] = self._visited_revisions.get(owner, 0) + 1
+        visited[loc.y, loc.x] = center
 
     def add_agent_to_loc(self, agent_id: int, loc: Location) -> None:
         self.get_cell_at_next(loc).agents.append(agent_id)
         agent = self.get_agent(agent_id)
-        if has_feature("HIDDEN_MOVE_COSTS"):
+        if self.features.hidden_move_costs:
             self.mark_surrounding_cells_visited(agent, loc)
 
     def remove_agent_from_loc(self, agent_id: int, loc: Location) -> None:
@@ -359,6 +562,10 @@ class Game:
     def is_loc_drone_scanned(self, loc: Location, team: Team) -> bool:
         return loc in self._drone_scans and team in self._drone_scans[loc]
 
+    def drone_scans(self) -> dict[Location, dict[Team, int]]:
+        """Return the active drone scans, location -> team -> rounds left."""
+        return self._drone_scans
+
     def get_drone_scan_duration(self, loc: Location, team: Team) -> int:
         return self._drone_scans[loc][team]
 
@@ -369,6 +576,10 @@ class Game:
                 if teams[team] <= 0:
                     del self._drone_scans[loc][team]
 
+    def send_drone_scan_update(self) -> None:
+        """Send the active drone scans to the client."""
+        self.game_pb.send_drone_scan_update(self._drone_scans)
+
     def serialize_drone_scans(self) -> None:
         """Add all active drone scans to the protobuf data for this round."""
         for loc, teams in self._drone_scans.items():
@@ -377,25 +588,30 @@ class Game:
 
     def apply_survivor_health_decay(self) -> None:
         """Apply health decay to all survivors based on config setting."""
-        decay_rate = get_feature_value("SURV_HEALTH_DECAY_RATE")
-        if decay_rate is None or decay_rate <= 0:
+        decay_rate = self.features.surv_health_decay_rate
+        if decay_rate <= 0:
             return  # Decay rate of 0 turns off health decay
 
-        for cell in self.current_world.cells:
-            for layer in cell.layers:
-                if isinstance(layer, Survivor) and layer.is_alive():
-                    layer.health = max(0, layer.health - decay_rate)
+        world = self.current_world
+        registry = world.survivors
+        changed = registry.decay(decay_rate)
+        if changed.size == 0:
+            return
+
+        for slot in changed[registry.health[changed] == 0].tolist():
+            LOGGER.info(f"Survivor {registry.ids[slot]} died from health decay")
 
-                    if layer.health <= 0:
-                        LOGGER.info(f"Survivor {layer.id} died from health decay")
+        cell_indices = registry.cell_indices[changed]
+        for index in np.unique(cell_indices).tolist():
+            world.update_cell(index)
 
-                    # Track health change for client (only once per survivor per round)
-                    self.game_pb.add_survivor_health_update(
-                        cell.location,
-                        layer.id,
-                        layer.health,
-                        is_alive=layer.health > 0,
-                    )
+        # Track health changes for client (only survivors whose health changed)
+        self.game_pb.add_survivor_health_updates(
+            cell_indices % world.width,
+            cell_indices // world.width,
+            registry.ids[changed],
+            registry.health[changed],
+        )
 
     def save(self, survivor: Survivor, agent: Agent) -> None:
         if (
@@ -414,7 +630,7 @@ class Game:
             f"Saving survivor {survivor.id} at {agent.location} for team {agent.team.name} on round {self.round}"
         )
         if (
-            has_feature("ALLOW_AGENT_PREDICTIONS")
+            self.features.allow_agent_predictions
             and self._prediction_handler is not None
         ):
             LOGGER.info(
@@ -437,7 +653,7 @@ class Game:
 
     def predict(self, surv_id: int, label: np.int32, agent: Agent) -> None:
         if (
-            not has_feature("ALLOW_AGENT_PREDICTIONS")
+            not self.features.allow_agent_predictions
             or self._prediction_handler is None
         ):
             return
@@ -468,7 +684,7 @@ class Game:
 
     def get_cell_at_current(self, loc: Location) -> Cell:
         index = loc.x + loc.y * self.current_world.width
-        return self.current_world.cells[index]
+        return self.current_world.get_cell(index)
 
     def get_cell_info_at_current(self, location: Location) -> CellInfo:
         cell = self.get_cell_at_current(location)
@@ -483,7 +699,7 @@ class Game:
     
     def get_cell_at_next(self, loc: Location) -> Cell:
         index = loc.x + loc.y * self.current_world.width
-        return self.next_world.cells[index]
+        return self.current_world.get_staged_cell(index)
 
     
     def get_cell_info_at_next(self, location: Location) -> CellInfo:
@@ -496,26 +712,24 @@ class Game:
         self.game_pb.add_team_info(Team.GOOBS, self.team_info)
         self.game_pb.add_team_info(Team.VOIDSEERS, self.team_info)
 
-    def get_survs(self) -> list[Location]:
-        """Return a list of survivor locations."""
-        return [
-            cell.location for cell in self.current_world.cells if cell.number_of_survivors() > 0
-        ]
+    def get_survs(self) -> tuple[Location, ...]:
+        """Return a tuple of survivor locations."""
+        return self.current_world.survivor_locations()
 
     @requires("ALLOW_AGENT_TYPES")
-    def get_spawns(self) -> list[Location]:
-        """Return a list of spawn locations."""
-        return [cell.location for cell in self.current_world.cells if cell.is_spawn()]
+    def get_spawns(self) -> tuple[Location, ...]:
+        """Return a tuple of spawn locations."""
+        return self.current_world.spawn_locations()
 
-    def get_charging_cells(self) -> list[Location]:
-        """Return a list of charging locations."""
-        return [cell.location for cell in self.current_world.cells if cell.is_charging_cell()]
+    def get_charging_cells(self) -> tuple[Location, ...]:
+        """Return a tuple of charging locations."""
+        return self.current_world.charging_locations()
 
     def get_prediction_info_for_agent(
         self, team: Team
     ) -> list[tuple[int, NDArray[np.uint8], NDArray[np.int32]]]:
         if (
-            not has_feature("ALLOW_AGENT_PREDICTIONS")
+            not self.features.allow_agent_predictions
             or self._prediction_handler is None
         ):
             return []
@@ -527,6 +741,8 @@ class Game:
             "CellInfo": CellInfo,
             "Direction": Direction,
             "Location": Location,
+            "RegionInfo": RegionInfo,
+            "TeamKnowledge": TeamKnowledge,
             "Rubble": Rubble,
             "Survivor": Survivor,
             "Team": Team,
@@ -538,6 +754,10 @@ class Game:
             "get_energy_level": ac.get_energy_level,
             "get_lumens": ac.get_lumens,
             "get_cell_info_at": ac.get_cell_info_at,
+            "get_region_info": ac.get_region_info,
+            "get_team_knowledge": ac.get_team_knowledge,
+            "get_path_to": ac.get_path_to,
+            "get_direction_to": ac.get_direction_to,
             "send_message": ac.send_message,
             "read_messages": ac.read_messages,
             "drone_scan": ac.drone_scan,
@@ -546,7 +766,9 @@ class Game:
             "dig": ac.dig,
             "recharge": ac.recharge,
             "predict": ac.predict,
+            "load_prediction_model": ac.load_prediction_model,
             "read_pending_predictions": ac.read_pending_predictions,
+            "read_model_predictions": ac.read_model_predictions,
             "spawn_agent": ac.spawn_agent,
             "on_map": self.on_map,
             "get_charging_cells": self.get_charging_cells,
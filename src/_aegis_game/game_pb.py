@@ -1,4 +1,8 @@
+import numpy as np
+from numpy.typing import NDArray
+
 from .agent import Agent
+from .agent_table import AgentTable
 from .common import Location
 from .schemas.event_pb2 import Event
 from .schemas.game_pb2 import (
@@ -9,14 +13,13 @@ from .schemas.game_pb2 import (
     GamesFooter,
     GamesHeader,
     Round,
-    SurvivorHealthUpdate,
+    SurvivorHealthBatch,
 )
 from .schemas.location_pb2 import Location as PbLocation
 from .schemas.spawn_pb2 import Spawn
 from .schemas.team_pb2 import Team as PbTeam
 from .schemas.team_pb2 import TeamInfo as PbTeamInfo
 from .schemas.turn_pb2 import Turn
-from .schemas.world_object_pb2 import SurvivorState
 from .server_websocket import WebSocketServer
 from .team import Team
 from .team_info import TeamInfo
@@ -33,7 +36,11 @@ class GamePb:
         self.removed_layers: list[PbLocation] = []
         self.dead_ids: list[int] = []
         self.drone_scans: list[DroneScan] = []
-        self.survivor_health_updates: list[SurvivorHealthUpdate] = []
+        self.survivor_health: SurvivorHealthBatch = SurvivorHealthBatch()
+        # slot and spawns of each turn played this round, see `add_turns`
+        self._turn_slots: list[int] = []
+        self._turn_spawns: list[list[Spawn]] = []
+        self._turn_instructions: list[int] = []
         self.ws_server: WebSocketServer | None = None
 
     def make_games_header(self, ws_server: WebSocketServer) -> None:
@@ -108,7 +115,8 @@ class GamePb:
         pb_round.layers_removed.extend(self.removed_layers)
         pb_round.dead_ids.extend(self.dead_ids)
         pb_round.drone_scans.extend(self.drone_scans)
-        pb_round.survivor_health_updates.extend(self.survivor_health_updates)
+        if self.survivor_health.survivor_ids:
+            pb_round.survivor_health.CopyFrom(self.survivor_health)
 
         event = Event()
         event.round.CopyFrom(pb_round)
@@ -118,21 +126,40 @@ class GamePb:
         self.clear_round()
 
     def end_turn(self, agent: Agent) -> None:
-        pb_turn = Turn()
-        pb_turn.agentId = agent.id
-        pb_turn.energy_level = agent.energy_level
-        pb_turn.steps_taken = agent.steps_taken
-
-        pb_loc = PbLocation()
-        pb_loc.x = agent.location.x
-        pb_loc.y = agent.location.y
-        pb_turn.loc.CopyFrom(pb_loc)
-
-        pb_turn.spawns.extend(self.spawns)
-
-        self.turns.append(pb_turn)
+        # The turn itself is built by `add_turns` once every agent has played,
+        # an agent's state can't change after its own turn until then.
+        self._turn_slots.append(agent.slot)
+        self._turn_spawns.append(list(self.spawns))
+        self._turn_instructions.append(agent.instructions)
         self.clear_turn()
 
+    def add_turns(self, agent_table: AgentTable) -> None:
+        """Serialize every turn played this round from the agent table."""
+        slots = np.array(self._turn_slots, dtype=np.intp)
+        self.turns.extend(
+            Turn(
+                agentId=agent_id,
+                energy_level=energy,
+                steps_taken=steps,
+                loc=PbLocation(x=x, y=y),
+                spawns=spawns,
+                instructions=instructions,
+            )
+            for agent_id, energy, steps, x, y, spawns, instructions in zip(
+                agent_table.ids[slots].tolist(),
+                agent_table.energy[slots].tolist(),
+                agent_table.steps[slots].tolist(),
+                agent_table.x[slots].tolist(),
+                agent_table.y[slots].tolist(),
+                self._turn_spawns,
+                self._turn_instructions,
+                strict=True,
+            )
+        )
+        self._turn_slots.clear()
+        self._turn_spawns.clear()
+        self._turn_instructions.clear()
+
     def make_game_footer(self) -> None:
         if self.ws_server is None:
             error = "Server should have started."
@@ -201,17 +228,23 @@ class GamePb:
         pb_drone_scan.duration = duration
         self.drone_scans.append(pb_drone_scan)
 
-    def add_survivor_health_update(
-        self, location: Location, survivor_id: int, new_health: int, *, is_alive: bool
+    def add_survivor_health_updates(
+        self,
+        xs: NDArray[np.int32],
+        ys: NDArray[np.int32],
+        survivor_ids: NDArray[np.int32],
+        new_health: NDArray[np.int32],
     ) -> None:
-        """Add a survivor health update to be sent to the client."""
-        pb_update = SurvivorHealthUpdate()
-        pb_update.location.x = location.x
-        pb_update.location.y = location.y
-        pb_update.survivor_id = survivor_id
-        pb_update.new_health = new_health
-        pb_update.new_state = SurvivorState.ALIVE if is_alive else SurvivorState.DEAD
-        self.survivor_health_updates.append(pb_update)
+        """
+        Add a batch of survivor health updates to be sent to the client.
+
+        The updates are sent as packed columns, a survivor is dead once its health
+        is 0.
+        """
+        self.survivor_health.xs.extend(xs.tolist())
+        self.survivor_health.ys.extend(ys.tolist())
+        self.survivor_health.survivor_ids.extend(survivor_ids.tolist())
+        self.survivor_health.new_health.extend(new_health.tolist())
 
     def team_to_schema(self, team: Team) -> PbTeam:
         return PbTeam.GOOBS if team == Team.GOOBS else PbTeam.VOIDSEERS
@@ -223,7 +256,7 @@ class GamePb:
         self.removed_layers.clear()
         self.dead_ids.clear()
         self.drone_scans.clear()
-        self.survivor_health_updates.clear()
+        self.survivor_health.Clear()
 
     def clear_turn(self) -> None:
         self.spawns.clear()
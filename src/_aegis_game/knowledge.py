@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .common import TeamKnowledge
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import NDArray
+
+    from .common import Location
+    from .world import World
+
+
+class KnowledgeGrid:
+    """
+    Keeps what one team has learned about the world, for its agents to read.
+
+    The game updates the grid at the start of every round, move costs are only
+    written for the cells the team just found out about. Agents get read-only views
+    of the same arrays through `knowledge`, so nothing is copied for them.
+    """
+
+    def __init__(self, world: World, *, hidden_move_costs: bool) -> None:
+        """
+        Initialize the grid of a team that hasn't seen anything yet.
+
+        Args:
+            world: The world of the game.
+            hidden_move_costs: Whether move costs are only known once visited.
+
+        """
+        shape = (world.height, world.width)
+        self.hidden_move_costs: bool = hidden_move_costs
+        self.move_costs: NDArray[np.int32] = (
+            np.ones(shape, dtype=np.int32)
+            if hidden_move_costs
+            else world.move_costs.reshape(shape).copy()
+        )
+        self.top_layer_kinds: NDArray[np.int8] = world.top_layer_kinds.reshape(
+            shape
+        ).copy()
+        self.visited: NDArray[np.bool_] = np.zeros(shape, dtype=np.bool_)
+        self.scanned: NDArray[np.bool_] = np.zeros(shape, dtype=np.bool_)
+        # cells whose move cost the team knows, with hidden move costs
+        self._revealed: NDArray[np.bool_] = np.zeros(shape, dtype=np.bool_)
+        self.knowledge: TeamKnowledge = TeamKnowledge.read_only(
+            self.move_costs, self.top_layer_kinds, self.visited, self.scanned
+        )
+
+    def update(
+        self,
+        world: World,
+        locations: Iterable[Location],
+        visited_maps: Iterable[NDArray[np.bool_]],
+        scans: Iterable[Location],
+    ) -> None:
+        """
+        Add what the team learned since the last update.
+
+        Args:
+            world: The committed world, as agents see it this round.
+            locations: The locations of the team's agents.
+            visited_maps: The cells each agent of the team has visited, indexed
+                `[y, x]`, they reveal move costs if these are hidden.
+            scans: The locations the team's drone scans cover.
+
+        """
+        for loc in locations:
+            self.visited[
+                max(loc.y - 1, 0) : loc.y + 2, max(loc.x - 1, 0) : loc.x + 2
+            ] = True
+        for loc in scans:
+            self.scanned[loc.y, loc.x] = True
+        np.copyto(
+            self.top_layer_kinds, world.top_layer_kinds.reshape(self.visited.shape)
+        )
+
+        if not self.hidden_move_costs:
+            return
+        revealed = self._revealed.copy()
+        for visited in visited_maps:
+            revealed |= visited
+        new = np.flatnonzero(revealed & ~self._revealed)
+        if new.size:
+            self.move_costs.ravel()[new] = world.move_costs[new]
+            self._revealed = revealed
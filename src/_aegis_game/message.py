@@ -1,10 +1,12 @@
-from typing import override
+from typing import NoReturn, override
 
 
 class Message:
     """
     Represents a message sent by an agent during a specific round.
 
+    Messages are immutable, since the same message is handed to every recipient.
+
     Attributes:
         message: The content of the message.
         round_num: The round number when the message was sent.
@@ -12,10 +14,29 @@ class Message:
 
     """
 
+    __slots__: tuple[str, ...] = ("message", "round_num", "sender_id")
+    message: str
+    round_num: int
+    sender_id: int
+
     def __init__(self, message: str, round_num: int, sender_id: int) -> None:
-        self.message: str = message
-        self.round_num: int = round_num
-        self.sender_id: int = sender_id
+        object.__setattr__(self, "message", message)
+        object.__setattr__(self, "round_num", round_num)
+        object.__setattr__(self, "sender_id", sender_id)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        error = "Message is immutable"
+        raise AttributeError(error)
+
+    @override
+    def __delattr__(self, name: str) -> NoReturn:
+        error = "Message is immutable"
+        raise AttributeError(error)
+
+    @override
+    def __reduce__(self) -> tuple[type["Message"], tuple[str, int, int]]:
+        return (Message, (self.message, self.round_num, self.sender_id))
 
     @override
     def __str__(self) -> str:
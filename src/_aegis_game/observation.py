@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .common import Location, RegionInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from numpy.typing import NDArray
+
+
+def neighborhood(loc: Location, width: int, height: int) -> tuple[Location, Location]:
+    """Return the corners of a location and the cells around it, on the map."""
+    return (
+        Location(max(loc.x - 1, 0), max(loc.y - 1, 0)),
+        Location(min(loc.x + 1, width - 1), min(loc.y + 1, height - 1)),
+    )
+
+
+def observe_region(  # noqa: PLR0913
+    min_loc: Location,
+    max_loc: Location,
+    width: int,
+    *,
+    agent: Location,
+    move_costs: NDArray[np.int32],
+    cell_types: NDArray[np.int8],
+    top_layer_kinds: NDArray[np.int8],
+    scanned: NDArray[np.bool_],
+    visited: NDArray[np.bool_] | None,
+    count_agents: Callable[[int], int],
+) -> RegionInfo:
+    """
+    Gather what an agent sees of a rectangle of cells, for `get_region_info`.
+
+    The rules are those of `get_cell_info_at`: agents are only visible in cells
+    next to the agent or scanned by its team's drones, and with `visited` given,
+    cells the agent hasn't visited have a move cost of 1.
+
+    Args:
+        min_loc: The corner of the region with the lowest x and y, on the map.
+        max_loc: The corner of the region with the highest x and y, on the map.
+        width: The width of the world.
+        agent: The location of the agent.
+        move_costs: The move cost of every cell, by cell index.
+        cell_types: The type of every cell, by cell index.
+        top_layer_kinds: The kind of the top layer of every cell, by cell index.
+        scanned: Whether each cell is scanned by the agent's team, by cell index.
+        visited: The cells the agent has visited, indexed `[y, x]`, if move costs
+            are hidden.
+        count_agents: Returns the number of agents in the cell at an index.
+
+    Returns:
+        The region, as the agent sees it.
+
+    """
+    ys = np.arange(min_loc.y, max_loc.y + 1)[:, np.newaxis]
+    xs = np.arange(min_loc.x, max_loc.x + 1)[np.newaxis, :]
+    indices = xs + ys * width
+
+    costs = move_costs[indices]
+    if visited is not None:
+        costs = np.where(visited[ys, xs], costs, 1).astype(np.int32)
+
+    adjacent = (np.abs(xs - agent.x) <= 1) & (np.abs(ys - agent.y) <= 1)
+    visible = adjacent | scanned[indices]
+    agent_counts = np.zeros(indices.shape, dtype=np.int32)
+    # only a few cells are visible, the ones around the agent and drone scans
+    for y, x in np.argwhere(visible).tolist():
+        agent_counts[y, x] = count_agents(int(indices[y, x]))
+
+    return RegionInfo(
+        min_loc,
+        move_costs=costs,
+        cell_types=cell_types[indices],
+        top_layer_kinds=top_layer_kinds[indices],
+        agent_counts=agent_counts,
+        visible=visible,
+    )
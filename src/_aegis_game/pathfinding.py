@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import heapq
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .common import Direction, Location
+from .types import CellType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from numpy.typing import NDArray
+
+# Known move cost of a cell agents can't enter
+BLOCKED = -1
+# Searches kept per owner of known move costs, one for each goal
+DEFAULT_FIELD_CAPACITY = 64
+
+_MOVES: tuple[Direction, ...] = tuple(d for d in Direction if d != Direction.CENTER)
+
+
+def known_move_costs(
+    move_costs: NDArray[np.int32],
+    cell_types: NDArray[np.int8],
+    visited: NDArray[np.bool_] | None = None,
+) -> NDArray[np.int32]:
+    """
+    Return the move costs an agent knows of, the way `PathFinder` takes them.
+
+    Args:
+        move_costs: The move cost of every cell, by cell index.
+        cell_types: The type of every cell, by cell index.
+        visited: The cells the agent has visited, indexed `[y, x]`. If given,
+            cells it hasn't visited cost 1, as `HIDDEN_MOVE_COSTS` shows them.
+
+    Returns:
+        The known move cost of every cell, `BLOCKED` for killer cells.
+
+    """
+    costs = move_costs if visited is None else np.where(visited.ravel(), move_costs, 1)
+    return np.where(cell_types == CellType.KILLER_CELL.value, BLOCKED, costs).astype(
+        np.int32
+    )
+
+
+def _next_cells(costs: list[int], width: int, goal: int) -> list[int]:
+    # Dijkstra from the goal backwards, moving into a cell costs its move cost.
+    # Relaxing the whole grid with NumPy until nothing changes is no faster on open
+    # maps of the largest size, and it takes a sweep per step of the longest path,
+    # so a map of winding walls takes twenty times as long
+    height = len(costs) // width
+    best = [float("inf")] * len(costs)
+    next_cells = [-1] * len(costs)
+    best[goal] = 0
+    heap = [(0, goal)]
+    while heap:
+        dist, cell = heapq.heappop(heap)
+        cost = costs[cell]
+        if dist > best[cell] or cost == BLOCKED:
+            continue
+        x, y = cell % width, cell // width
+        dist += cost
+        for move in _MOVES:
+            nx, ny = x + move.dx, y + move.dy
+            if 0 <= nx < width and 0 <= ny < height:
+                neighbor = nx + ny * width
+                if dist < best[neighbor]:
+                    best[neighbor] = dist
+                    next_cells[neighbor] = cell
+                    heapq.heappush(heap, (dist, neighbor))
+    return next_cells
+
+
+class PathFinder:
+    """
+    Finds cheapest paths for agents of one game, outside the sandbox.
+
+    A search from the goal gives the next step towards it from every cell, so it is
+    kept and reused by every agent sharing the same knowledge of the move costs,
+    its team with `SHARE_VISITED_CELLS` enabled, heading to the same goal. The
+    searches of an owner are dropped once the revision of its knowledge changes, so
+    telling whether a search is still valid doesn't look at the costs at all.
+    """
+
+    def __init__(self, width: int, capacity: int = DEFAULT_FIELD_CAPACITY) -> None:
+        """
+        Initialize a path finder with no searches cached.
+
+        Args:
+            width: The width of the world.
+            capacity: Number of searches kept per owner.
+
+        """
+        self.width: int = width
+        self.capacity: int = capacity
+        # owner -> (revision, goal -> next cell towards the goal)
+        self._searches: dict[Hashable, tuple[int, OrderedDict[int, list[int]]]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def path(
+        self,
+        owner: Hashable,
+        revision: int,
+        costs: Callable[[], NDArray[np.int32]],
+        start: Location,
+        goal: Location,
+    ) -> list[Direction] | None:
+        """
+        Return a cheapest path between two locations.
+
+        Args:
+            owner: Whose knowledge of the move costs the path follows, searches
+                are cached per owner.
+            revision: The revision of the owner's knowledge, it must change
+                whenever the known move costs do.
+            costs: Returns the known move costs, from `known_move_costs`. Only
+                called if no cached search can be used.
+            start: Where the path starts.
+            goal: Where the path ends.
+
+        Returns:
+            The directions to move in, in order, or None if `goal` can't be
+            reached.
+
+        """
+        width = self.width
+        next_cells = self._search(owner, revision, costs, goal.x + goal.y * width)
+        path: list[Direction] = []
+        cell = start.x + start.y * width
+        while cell != goal.x + goal.y * width:
+            next_cell = next_cells[cell]
+            if next_cell < 0:
+                return None
+            path.append(
+                Direction(
+                    (
+                        next_cell % width - cell % width,
+                        next_cell // width - cell // width,
+                    )
+                )
+            )
+            cell = next_cell
+        return path
+
+    def _search(
+        self,
+        owner: Hashable,
+        revision: int,
+        costs: Callable[[], NDArray[np.int32]],
+        goal: int,
+    ) -> list[int]:
+        with self._lock:
+            cached = self._searches.get(owner)
+            if cached is None or cached[0] != revision:
+                # searches for an older revision are never used again
+                cached = (revision, OrderedDict())
+                self._searches[owner] = cached
+            searches = cached[1]
+            next_cells = searches.get(goal)
+            if next_cells is not None:
+                searches.move_to_end(goal)
+                return next_cells
+
+            next_cells = _next_cells(costs().tolist(), self.width, goal)
+            searches[goal] = next_cells
+            while len(searches) > self.capacity:
+                _ = searches.popitem(last=False)
+            return next_cells
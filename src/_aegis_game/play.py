@@ -2,11 +2,13 @@ from pathlib import Path
 
 from google.protobuf.message import DecodeError
 
-from .aegis_config import has_feature
+from .aegis_config import load_features
 from .args_parser import LaunchArgs
 from .game import Game
 from .game_pb import GamePb
 from .logger import LOGGER, setup_console_and_file_logging, setup_console_logging
+from .sandbox.compile_cache import DEFAULT_CACHE_DIR, CompileCache
+from .sandbox.memory import BYTES_PER_MB
 from .sandbox.sandbox import Sandbox
 from .server_websocket import WebSocketServer
 from .team import Team
@@ -19,7 +21,7 @@ def log_game_end(game: Game, args: LaunchArgs, i: int) -> None:
     LOGGER.info(f"Reason: {getattr(game.reason, 'value', 'Unknown')}")
     LOGGER.info("")
     LOGGER.info(f"{'Team':<12} {'Score':>8} {'Saved':>8}")
-    if has_feature("ALLOW_AGENT_PREDICTIONS"):
+    if game.features.allow_agent_predictions:
         LOGGER.info(f"{'Team':<12} {'Score':>8} {'Saved':>8} {'Predictions':>14}")
         LOGGER.info("-" * 46)
     else:
@@ -33,16 +35,26 @@ def log_game_end(game: Game, args: LaunchArgs, i: int) -> None:
         saved = game.team_info.get_saved(team)
         predictions = game.team_info.get_predicted_right(team)
 
-        if has_feature("ALLOW_AGENT_PREDICTIONS"):
+        if game.features.allow_agent_predictions:
             LOGGER.info(f"{team.name:<12} {score:>8} {saved:>8} {predictions:>14}")
         else:
             LOGGER.info(f"{team.name:<12} {score:>8} {saved:>8}")
 
-    if has_feature("ALLOW_AGENT_PREDICTIONS"):
+    if game.features.allow_agent_predictions:
         LOGGER.info("=" * 46)
     else:
         LOGGER.info("=" * 31)
 
+    if game.memory_peaks:
+        LOGGER.info("")
+        LOGGER.info(f"{'Agent':<12} {'Peak MB':>8}")
+        LOGGER.info("-" * 21)
+        for agent_id, peak in sorted(
+            game.memory_peaks.items(), key=lambda item: item[1], reverse=True
+        ):
+            LOGGER.info(f"{agent_id:<12} {peak / BYTES_PER_MB:>8.1f}")
+        LOGGER.info("=" * 21)
+
     if i < len(args.world) - 1:
         print("\n" + "=" * 80 + "\n\n")
 
@@ -65,18 +77,20 @@ def run(args: LaunchArgs) -> None:
 
     setup_console_and_file_logging() if args.log else setup_console_logging()
 
+    cache = CompileCache(Path.cwd() / DEFAULT_CACHE_DIR)
     sandbox_goobs = (
-        Sandbox.from_directory(Path.cwd() / "agents" / args.agent)
+        Sandbox.from_directory(Path.cwd() / "agents" / args.agent, cache)
         if args.agent is not None
         else None
     )
     sandbox_seers = (
-        Sandbox.from_directory(Path.cwd() / "agents" / args.agent2)
+        Sandbox.from_directory(Path.cwd() / "agents" / args.agent2, cache)
         if args.agent2 is not None
         else None
     )
     ws_server = WebSocketServer(wait_for_client=args.client)
     game_pb = GamePb()
+    features = load_features(args.preset)
 
     ws_server.start()
     game_pb.make_games_header(ws_server)
@@ -94,7 +108,7 @@ def run(args: LaunchArgs) -> None:
         world.rounds = args.rounds
 
         try:
-            game = Game([sandbox_goobs, sandbox_seers], args, world, game_pb)
+            game = Game([sandbox_goobs, sandbox_seers], args, world, game_pb, features)
         except ValueError as e:
             enhanced_msg = f"Error in world '{world_name}': {e}"
             raise ValueError(enhanced_msg) from e
@@ -103,12 +117,15 @@ def run(args: LaunchArgs) -> None:
         LOGGER.info(make_game_start_string(args, world_name))
 
         game_pb.make_game_header(world)
-        while game.running:
-            try:
-                game.run_round()
-            except Exception:  # noqa: BLE001
-                LOGGER.exception("This shouldn't have happened. Internal error.")
-                game.running = False
+        try:
+            while game.running:
+                try:
+                    game.run_round()
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("This shouldn't have happened. Internal error.")
+                    game.running = False
+        finally:
+            game.stop()
 
         game_pb.make_game_footer()
         log_game_end(game, args, i)
@@ -0,0 +1,637 @@
+from __future__ import annotations
+
+import functools
+import pickle
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from _aegis_game.agent_controller import AgentError, BaseAgentController
+from _aegis_game.agent_predictions.batcher import shared_prediction_batcher
+from _aegis_game.agent_predictions.model_cache import (
+    resolve_agent_file,
+    shared_model_cache,
+)
+from _aegis_game.agent_type import AgentType
+from _aegis_game.common import (
+    CellInfo,
+    Direction,
+    LayerStack,
+    Location,
+    RegionInfo,
+    TeamKnowledge,
+)
+from _aegis_game.common.objects import Rubble, Survivor, WorldObject
+from _aegis_game.constants import Constants
+from _aegis_game.observation import neighborhood, observe_region
+from _aegis_game.pathfinding import PathFinder, known_move_costs
+from _aegis_game.team import Team
+from _aegis_game.types import CellType, LayerKind
+
+from .snapshot import (
+    AGENT_COUNT,
+    GOOBS_LUMENS,
+    KNOWLEDGE_ARRAYS,
+    ROUND,
+    VOIDSEERS_LUMENS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+    from _aegis_game.aegis_config import Features
+    from _aegis_game.message import Message
+    from _aegis_game.message_buffer import MessageBuffer
+    from _aegis_game.types import MethodDict
+
+    from .snapshot import WorldSnapshot
+
+# A call the agent made that changes the game, as `(method name, arguments)`
+Intent = tuple[str, tuple[object, ...]]
+
+
+@dataclass
+class TurnInput:
+    """
+    Per-agent state a worker needs for one turn that isn't in the snapshot.
+
+    Attributes:
+        agent_id: The agent playing the turn.
+        messages: The agent's message buffer, if messages are enabled.
+        predictions: The team's pending predictions, if predictions are enabled.
+
+    """
+
+    agent_id: int
+    messages: MessageBuffer | None = None
+    predictions: list[tuple[int, NDArray[np.uint8], NDArray[np.int32]]] | None = None
+
+
+@dataclass
+class TurnResult:
+    """
+    What an agent did during a turn played in a worker process.
+
+    Attributes:
+        agent_id: The agent that played the turn.
+        intents: The game-changing calls the agent made, in order, leaving out the
+            calls that raised `AgentError` in the worker.
+        errors: Errors reported while the agent was thinking.
+        duration: Time the agent spent thinking, in seconds, not counting time
+            spent importing lazily imported modules.
+        instructions: Instructions the turn executed, 0 if turns aren't metered.
+        timed_out: Whether the turn was stopped at the turn deadline.
+        memory_peak: Most memory the agent's turns held, 0 if it isn't accounted.
+
+    """
+
+    agent_id: int
+    intents: list[Intent] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    duration: float = 0.0
+    instructions: int = 0
+    timed_out: bool = False
+    memory_peak: int = 0
+
+
+class SnapshotReader:
+    """Answers world queries from a snapshot, shared by every agent of a worker."""
+
+    def __init__(self, snapshot: WorldSnapshot, features: Features) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            snapshot: The snapshot to read.
+            features: The features the game runs with.
+
+        """
+        self.snapshot: WorldSnapshot = snapshot
+        self.features: Features = features
+        self.width: int = snapshot.layout.width
+        self.height: int = snapshot.layout.height
+        self.arrays: dict[str, NDArray[np.generic]] = snapshot.arrays
+        # layers built for agents this round, keyed by cell index
+        self._layers: dict[int, LayerStack] = {}
+        # copies of the teams' knowledge, agents keep read-only views of them, so
+        # they stay valid when the snapshot is replaced
+        self._knowledge: dict[
+            Team, tuple[dict[str, NDArray[np.generic]], TeamKnowledge]
+        ] = {}
+
+    def begin_round(self) -> None:
+        """Forget everything built from the previous round's snapshot."""
+        self._layers.clear()
+        for team, (arrays, _) in self._knowledge.items():
+            self._copy_knowledge(team, arrays)
+
+    @property
+    def round(self) -> int:
+        return int(self.arrays["header"][ROUND])
+
+    def lumens(self, team: Team) -> int:
+        slot = GOOBS_LUMENS if team == Team.GOOBS else VOIDSEERS_LUMENS
+        return int(self.arrays["header"][slot])
+
+    def on_map(self, loc: Location) -> bool:
+        return 0 <= loc.x < self.width and 0 <= loc.y < self.height
+
+    def index(self, loc: Location) -> int:
+        return loc.x + loc.y * self.width
+
+    def cell_type(self, index: int) -> CellType:
+        return CellType(int(self.arrays["cell_types"][index]))
+
+    def move_cost(self, index: int) -> int:
+        return int(self.arrays["move_costs"][index])
+
+    def layers(self, index: int) -> LayerStack:
+        stack = self._layers.get(index)
+        if stack is None:
+            start = int(self.arrays["layer_start"][index])
+            end = start + int(self.arrays["layer_counts"][index])
+            layers: list[WorldObject] = []
+            for slot in range(start, end):
+                layer_id = int(self.arrays["layer_ids"][slot])
+                value = int(self.arrays["layer_values"][slot])
+                if self.arrays["layer_kinds"][slot] == LayerKind.SURVIVOR.value:
+                    layers.append(Survivor(layer_id, value))
+                else:
+                    agents_required = int(self.arrays["layer_agents_required"][slot])
+                    layers.append(Rubble(layer_id, value, agents_required))
+            stack = LayerStack(layers)
+            self._layers[index] = stack
+        return stack
+
+    def agents_at(self, index: int) -> list[int]:
+        start = int(self.arrays["cell_agent_start"][index])
+        count = int(self.arrays["cell_agent_counts"][index])
+        return self.arrays["cell_agents"][start : start + count].tolist()
+
+    def is_drone_scanned(self, index: int, team: Team) -> bool:
+        return bool(self.arrays["drone_scanned"][team.value, index])
+
+    def team_knowledge(self, team: Team) -> TeamKnowledge:
+        mirror = self._knowledge.get(team)
+        if mirror is None:
+            shape = (self.height, self.width)
+            arrays = {
+                name: np.empty(shape, dtype=self.arrays[name].dtype)
+                for name in KNOWLEDGE_ARRAYS
+            }
+            mirror = (arrays, TeamKnowledge.read_only(*arrays.values()))  # pyright: ignore[reportArgumentType]
+            self._knowledge[team] = mirror
+            self._copy_knowledge(team, arrays)
+        return mirror[1]
+
+    def keep_knowledge(self, reader: SnapshotReader) -> None:
+        """Keep updating the knowledge another reader handed out to agents."""
+        self._knowledge = reader._knowledge
+        for team, (arrays, _) in self._knowledge.items():
+            self._copy_knowledge(team, arrays)
+
+    def _copy_knowledge(
+        self, team: Team, arrays: dict[str, NDArray[np.generic]]
+    ) -> None:
+        for name, array in arrays.items():
+            np.copyto(array, self.arrays[name][team.value].reshape(array.shape))
+
+    def units(self, team: Team) -> int:
+        size = int(self.arrays["header"][AGENT_COUNT])
+        alive = self.arrays["agent_alive"][:size]
+        return int(
+            np.count_nonzero(alive & (self.arrays["agent_teams"][:size] == team.value))
+        )
+
+    def locations_of(self, indices: NDArray[np.intp]) -> tuple[Location, ...]:
+        return tuple(
+            Location(i % self.width, i // self.width) for i in indices.tolist()
+        )
+
+
+def _recorded(method: Callable[..., None]) -> Callable[..., None]:
+    """Record calls to an action as intents, only once they succeeded."""
+
+    @functools.wraps(method)
+    def record(self: RemoteAgentController, *args: object) -> None:
+        self._check_sendable(method.__name__, args)
+        method(self, *args)
+        self.result.intents.append((method.__name__, args))
+
+    return record
+
+
+class RemoteAgentController(BaseAgentController):
+    """
+    The agent API for an agent whose sandbox runs in a worker process.
+
+    Queries are answered from the round's snapshot. Calls that change the game are
+    checked against the agent's own state with the checks `AgentController` makes,
+    and recorded as intents for the game to apply once every agent has played. The
+    agent's own location, energy and cooldown follow its actions during the turn.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        reader: SnapshotReader,
+        agent_id: int,
+        slot: int,
+        team: Team,
+        agent_type: AgentType,
+        max_agents: int,
+        directory: Path | None = None,
+        *,
+        path_finder: PathFinder | None = None,
+    ) -> None:
+        """
+        Initialize the controller of one agent.
+
+        Args:
+            reader: The worker's snapshot reader.
+            agent_id: The id of the agent.
+            slot: The agent's slot in the game's agent table.
+            team: The team of the agent.
+            agent_type: The type of the agent.
+            max_agents: Maximum number of agents per team.
+            directory: The agent's directory, models are loaded from it.
+            path_finder: The path finder the worker's agents share. If None, the
+                agent gets its own.
+
+        """
+        super().__init__(reader.features)
+        self._reader: SnapshotReader = reader
+        self._id: int = agent_id
+        self._slot: int = slot
+        self._team: Team = team
+        self._type: AgentType = agent_type
+        self._max_agents: int = max_agents
+        self._directory: Path | None = directory
+        self._location: Location = Location(-1, -1)
+        self._energy: int = 0
+        self._cooldown: int = 0
+        self._visited: NDArray[np.bool_] = np.zeros((0, 0), dtype=np.bool_)
+        # revision of the visited map in the snapshot, see `Game.visited_revision`
+        self._visited_revision: int = 0
+        # whether the agent revealed cells during this turn, and how many times it
+        # ever did
+        self._revealed: bool = False
+        self._own_revision: int = 0
+        self._path_finder: PathFinder = (
+            path_finder if path_finder is not None else PathFinder(reader.width)
+        )
+        self._messages: MessageBuffer | None = None
+        self._predictions: list[tuple[int, NDArray[np.uint8], NDArray[np.int32]]] = []
+        self.result: TurnResult = TurnResult(agent_id)
+
+    def attach(self, reader: SnapshotReader) -> None:
+        """Read from a new snapshot, after the game had to grow it."""
+        self._reader = reader
+
+    def begin_turn(self, turn: TurnInput) -> None:
+        """Load the agent's state at the start of its turn."""
+        arrays = self._reader.arrays
+        slot = self._slot
+        self._location = Location(
+            int(arrays["agent_x"][slot]), int(arrays["agent_y"][slot])
+        )
+        self._energy = int(arrays["agent_energy"][slot])
+        self._cooldown = int(arrays["agent_cooldown"][slot])
+        self._visited = arrays["agent_visited"][slot].copy()
+        self._visited_revision = int(arrays["agent_visited_revisions"][slot])
+        self._revealed = False
+        self._messages = turn.messages
+        self._predictions = turn.predictions or []
+        self.result = TurnResult(self._id)
+
+    def error(self, msg: str) -> None:
+        self.result.errors.append(msg)
+
+    def _record(self, name: str, *args: object) -> None:
+        self._check_sendable(name, args)
+        self.result.intents.append((name, args))
+
+    @staticmethod
+    def _check_sendable(name: str, args: tuple[object, ...]) -> None:
+        try:
+            _ = pickle.dumps(args)
+        except Exception as e:
+            error = f"Invalid argument for {name}"
+            raise AgentError(error) from e
+
+    def _add_energy(self, energy: int) -> None:
+        self._energy = min(Constants.MAX_ENERGY_LEVEL, self._energy + energy)
+
+    def _add_cooldown(self) -> None:
+        self._cooldown = self._type.action_cooldown
+
+    def _top_layer(self) -> WorldObject | None:
+        return self._reader.layers(self._reader.index(self._location)).top
+
+    def _agent_type(self) -> AgentType:
+        return self._type
+
+    def _agent_location(self) -> Location:
+        return self._location
+
+    def _action_cooldown(self) -> int:
+        return self._cooldown
+
+    def _on_map(self, loc: Location) -> bool:
+        return self._reader.on_map(loc)
+
+    def _is_spawn_location(self, loc: Location) -> bool:
+        reader = self._reader
+        return (
+            reader.on_map(loc)
+            and reader.cell_type(reader.index(loc)) == CellType.SPAWN_CELL
+        )
+
+    def _team_is_full(self) -> bool:
+        return self._reader.units(self._team) == self._max_agents
+
+    # Agent API, see `AgentController` for the documentation
+
+    def get_round_number(self) -> int:
+        return self._reader.round
+
+    def get_id(self) -> int:
+        return self._id
+
+    def get_type(self) -> AgentType:
+        return self._type
+
+    def get_team(self) -> Team:
+        return self._team
+
+    def get_location(self) -> Location:
+        return self._location
+
+    def get_energy_level(self) -> int:
+        return self._energy
+
+    def get_lumens(self) -> int:
+        return self._reader.lumens(self._team)
+
+    @_recorded
+    def move(self, direction: Direction) -> None:
+        self.assert_move(direction)
+        new_loc = self._location.add(direction)
+        self._add_cooldown()
+        if direction != Direction.CENTER:
+            self._add_energy(-self._reader.move_cost(self._reader.index(new_loc)))
+        self._location = new_loc
+        if self._features.hidden_move_costs:
+            center = self._visited[new_loc.y, new_loc.x]
+            self._visited[new_loc.y, new_loc.x] = True
+            around = self._visited[
+                max(new_loc.y - 1, 0) : new_loc.y + 2,
+                max(new_loc.x - 1, 0) : new_loc.x + 2,
+            ]
+            if not around.all():
+                around[...] = True
+                self._revealed = True
+                self._own_revision += 1
+            self._visited[new_loc.y, new_loc.x] = center
+
+    @_recorded
+    def save(self) -> None:
+        self.assert_save()
+        self._add_cooldown()
+        if isinstance(self._top_layer(), Survivor):
+            self._add_energy(-Constants.SAVE_ENERGY_COST)
+
+    @_recorded
+    def recharge(self) -> None:
+        self.assert_cooldown()
+        self._add_cooldown()
+        index = self._reader.index(self._location)
+        if self._reader.cell_type(index) != CellType.CHARGING_CELL:
+            return
+        self._add_energy(
+            min(Constants.NORMAL_CHARGE, Constants.MAX_ENERGY_LEVEL - self._energy)
+        )
+
+    @_recorded
+    def dig(self) -> None:
+        self.assert_dig()
+        self._add_cooldown()
+        top = self._top_layer()
+        if isinstance(top, Rubble) and self._energy >= top.energy_required:
+            self._add_energy(-top.energy_required)
+
+    @_recorded
+    def predict(self, surv_id: int, label: np.int32) -> None:
+        # scored by the game when it applies the intent
+        _ = surv_id, label
+        self.assert_predict()
+
+    def load_prediction_model(self, path: str) -> object:
+        self.assert_predict()
+        if self._directory is None:
+            error = "The agent's directory is unknown"
+            raise AgentError(error)
+        try:
+            return shared_model_cache().get(resolve_agent_file(self._directory, path))
+        except (OSError, ValueError) as e:
+            raise AgentError(str(e)) from e
+
+    def read_model_predictions(
+        self, path: str
+    ) -> list[tuple[int, NDArray[np.float32]]]:
+        self.assert_predict()
+        if not self._predictions:
+            return []
+        if self._directory is None:
+            error = "The agent's directory is unknown"
+            raise AgentError(error)
+        try:
+            return shared_prediction_batcher().run(
+                self._team, resolve_agent_file(self._directory, path), self._predictions
+            )
+        except (OSError, ValueError) as e:
+            raise AgentError(str(e)) from e
+
+    def read_pending_predictions(
+        self,
+    ) -> list[tuple[int, NDArray[np.uint8], NDArray[np.int32]]]:
+        self.assert_predict()
+        return self._predictions
+
+    @_recorded
+    def send_message(self, message: str, dest_ids: list[int]) -> None:
+        # delivered by the game when it applies the intent
+        _ = message, dest_ids
+
+    def read_messages(self, round_num: int = -1) -> list[Message]:
+        if self._messages is None:
+            return []
+        if round_num == -1:
+            return self._messages.get_all_messages()
+        return self._messages.get_messages(round_num)
+
+    @_recorded
+    def drone_scan(self, loc: Location) -> None:
+        self.assert_scan()
+        self._add_cooldown()
+        self.assert_loc(loc)
+        self._add_energy(-Constants.DRONE_SCAN_ENERGY_COST)
+
+    def get_cell_info_at(self, loc: Location) -> CellInfo:
+        self.assert_loc(loc)
+        reader = self._reader
+        index = reader.index(loc)
+        is_adjacent = self._location.is_adjacent_to(loc)
+        is_scanned = reader.is_drone_scanned(index, self._team)
+
+        layers = reader.layers(index)
+        if is_adjacent or is_scanned:
+            cell_info = CellInfo(
+                layers,
+                reader.cell_type(index),
+                loc,
+                reader.move_cost(index),
+                reader.agents_at(index),
+            )
+        else:
+            top = layers.top
+            cell_info = CellInfo(
+                [top] if top is not None else [],
+                reader.cell_type(index),
+                loc,
+                reader.move_cost(index),
+                [],
+            )
+
+        if self._features.hidden_move_costs and not self._visited[loc.y, loc.x]:
+            cell_info.move_cost = 1
+
+        return cell_info
+
+    def get_region_info(
+        self, min_loc: Location | None = None, max_loc: Location | None = None
+    ) -> RegionInfo:
+        reader = self._reader
+        if min_loc is None and max_loc is None:
+            min_loc, max_loc = neighborhood(self._location, reader.width, reader.height)
+        self.assert_region(min_loc, max_loc)  # pyright: ignore[reportArgumentType]
+        arrays = reader.arrays
+        return observe_region(
+            min_loc,  # pyright: ignore[reportArgumentType]
+            max_loc,  # pyright: ignore[reportArgumentType]
+            reader.width,
+            agent=self._location,
+            move_costs=arrays["move_costs"],  # pyright: ignore[reportArgumentType]
+            cell_types=arrays["cell_types"],  # pyright: ignore[reportArgumentType]
+            top_layer_kinds=arrays["top_layer_kinds"],  # pyright: ignore[reportArgumentType]
+            scanned=arrays["drone_scanned"][self._team.value],  # pyright: ignore[reportArgumentType]
+            visited=self._visited if self._features.hidden_move_costs else None,
+            count_agents=lambda index: int(arrays["cell_agent_counts"][index]),
+        )
+
+    def get_team_knowledge(self) -> TeamKnowledge:
+        self.assert_team_knowledge()
+        return self._reader.team_knowledge(self._team)
+
+    def get_path_to(self, loc: Location) -> list[Direction] | None:
+        self.assert_pathfinding()
+        self.assert_loc(loc)
+        reader = self._reader
+        hidden = self._features.hidden_move_costs
+        owner: Hashable = self._team
+        revision = 0
+        if self._revealed:
+            # cells revealed during the turn are only known here until the game
+            # applies the agent's moves
+            owner, revision = self, self._own_revision
+        elif hidden:
+            owner = self._team if self._features.share_visited_cells else self._id
+            revision = self._visited_revision
+        return self._path_finder.path(
+            owner,
+            revision,
+            lambda: known_move_costs(
+                reader.arrays["move_costs"],  # pyright: ignore[reportArgumentType]
+                reader.arrays["cell_types"],  # pyright: ignore[reportArgumentType]
+                self._visited if hidden else None,
+            ),
+            self._location,
+            loc,
+        )
+
+    def get_direction_to(self, loc: Location) -> Direction:
+        path = self.get_path_to(loc)
+        return path[0] if path else Direction.CENTER
+
+    @_recorded
+    def spawn_agent(self, loc: Location, agent_type: AgentType) -> None:
+        _ = agent_type
+        self.assert_spawn(loc)
+
+    def on_map(self, loc: Location) -> bool:
+        return self._reader.on_map(loc)
+
+    def get_charging_cells(self) -> tuple[Location, ...]:
+        return self._cells_of_type(CellType.CHARGING_CELL)
+
+    def get_spawns(self) -> tuple[Location, ...]:
+        return self._cells_of_type(CellType.SPAWN_CELL)
+
+    def get_survs(self) -> tuple[Location, ...]:
+        return self._reader.locations_of(
+            np.flatnonzero(self._reader.arrays["survivor_counts"])
+        )
+
+    def _cells_of_type(self, cell_type: CellType) -> tuple[Location, ...]:
+        return self._reader.locations_of(
+            np.flatnonzero(self._reader.arrays["cell_types"] == cell_type.value)
+        )
+
+    def log(self, *args: object) -> None:
+        self._record("log", *map(str, args))
+
+    def methods(self) -> MethodDict:
+        """Return the agent API, with the same names as `Game.methods`."""
+        return {
+            "AgentType": AgentType,
+            "CellInfo": CellInfo,
+            "Direction": Direction,
+            "Location": Location,
+            "RegionInfo": RegionInfo,
+            "TeamKnowledge": TeamKnowledge,
+            "Rubble": Rubble,
+            "Survivor": Survivor,
+            "Team": Team,
+            "get_round_number": self.get_round_number,
+            "get_id": self.get_id,
+            "get_type": self.get_type,
+            "get_team": self.get_team,
+            "get_location": self.get_location,
+            "get_energy_level": self.get_energy_level,
+            "get_lumens": self.get_lumens,
+            "get_cell_info_at": self.get_cell_info_at,
+            "get_region_info": self.get_region_info,
+            "get_team_knowledge": self.get_team_knowledge,
+            "get_path_to": self.get_path_to,
+            "get_direction_to": self.get_direction_to,
+            "send_message": self.send_message,
+            "read_messages": self.read_messages,
+            "drone_scan": self.drone_scan,
+            "move": self.move,
+            "save": self.save,
+            "dig": self.dig,
+            "recharge": self.recharge,
+            "predict": self.predict,
+            "load_prediction_model": self.load_prediction_model,
+            "read_pending_predictions": self.read_pending_predictions,
+            "read_model_predictions": self.read_model_predictions,
+            "spawn_agent": self.spawn_agent,
+            "on_map": self.on_map,
+            "get_charging_cells": self.get_charging_cells,
+            "get_spawns": self.get_spawns,
+            "get_survs": self.get_survs,
+            "log": self.log,
+        }
@@ -0,0 +1,170 @@
+# pyright: reportImportCycles = false
+from __future__ import annotations
+
+import marshal
+import multiprocessing
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from _aegis_game.team import Team
+
+from .controller import TurnInput, TurnResult
+from .snapshot import WorldSnapshot
+from .worker import WorkerSetup, run_worker
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from _aegis_game.agent import Agent
+    from _aegis_game.agent_controller import AgentController
+    from _aegis_game.game import Game
+
+# Seconds a worker gets to exit on its own before it is terminated
+_STOP_TIMEOUT = 1.0
+
+
+class AgentProcessPool:
+    """
+    Plays agent turns in worker processes instead of threads of the game process.
+
+    Every worker hosts the sandboxes of several agents. At the start of a turn phase
+    the game writes a `WorldSnapshot` to shared memory, each worker plays the turns of
+    its agents against it and sends back what they did. The game then applies those
+    intents through the agents' real controllers, in `Game.for_each_agent` order, so
+    the game state stays authoritative.
+    """
+
+    def __init__(self, game: Game, workers: int) -> None:
+        """
+        Start the worker processes.
+
+        Args:
+            game: The game the agents play in.
+            workers: Number of worker processes to start.
+
+        """
+        self._game: Game = game
+        self._snapshot: WorldSnapshot = WorldSnapshot.create(
+            game, len(game.agent_table.ids)
+        )
+        code = [
+            {name: marshal.dumps(module) for name, module in sandbox.code.items()}
+            if sandbox is not None
+            else None
+            for sandbox in game.code
+        ]
+        setup = WorkerSetup(
+            code,
+            game.features,
+            self._snapshot.layout,
+            game.args.amount,
+            [
+                game.agent_directory(team) if team in game.team_agents else None
+                for team in Team
+            ],
+            game.current_world.seed,
+        )
+
+        # a fresh interpreter per worker, so no engine state leaks into agents
+        context = multiprocessing.get_context("spawn")
+        self._connections: list[Connection] = []
+        self._processes: list[BaseProcess] = []
+        for _ in range(workers):
+            conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=run_worker, args=(child_conn, setup), daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._connections.append(conn)
+            self._processes.append(process)
+
+        # agent id -> index of the worker hosting it
+        self._workers: dict[int, int] = {}
+        self._controllers: dict[int, AgentController] = {}
+
+    def launch(self, agent: Agent, controller: AgentController) -> None:
+        """Start an agent's sandbox on the least loaded worker."""
+        load = Counter(self._workers.values())
+        worker = min(range(len(self._connections)), key=lambda index: load[index])
+        self._workers[agent.id] = worker
+        self._controllers[agent.id] = controller
+        self._connections[worker].send(
+            ("launch", agent.id, agent.slot, agent.team.value, agent.type.name)
+        )
+
+    def kill(self, agent_id: int) -> None:
+        """Drop an agent's sandbox from its worker."""
+        worker = self._workers.pop(agent_id, None)
+        if worker is None:
+            return
+        del self._controllers[agent_id]
+        self._connections[worker].send(("kill", agent_id))
+
+    def controller(self, agent_id: int) -> AgentController:
+        """Return the controller intents of an agent are applied through."""
+        return self._controllers[agent_id]
+
+    def play(self, agents: list[Agent]) -> dict[int, TurnResult]:
+        """
+        Play a turn of every agent in the worker processes.
+
+        Args:
+            agents: The agents to play, in turn order.
+
+        Returns:
+            The result of each agent's turn, keyed by agent id.
+
+        """
+        game = self._game
+        table = game.agent_table
+        if table.size > self._snapshot.layout.agent_capacity:
+            self._snapshot.unlink()
+            self._snapshot = WorldSnapshot.create(game, len(table.ids))
+        self._snapshot.publish(game)
+
+        predictions: dict[
+            Team, list[tuple[int, NDArray[np.uint8], NDArray[np.int32]]]
+        ] = {}
+        turns: list[list[TurnInput]] = [[] for _ in self._connections]
+        for agent in agents:
+            turn = TurnInput(agent.id)
+            if game.features.allow_agent_messages:
+                turn.messages = agent.message_buffer
+            if game.features.allow_agent_predictions:
+                if agent.team not in predictions:
+                    predictions[agent.team] = game.get_prediction_info_for_agent(
+                        agent.team
+                    )
+                turn.predictions = predictions[agent.team]
+            turns[self._workers[agent.id]].append(turn)
+
+        busy = [index for index, worker_turns in enumerate(turns) if worker_turns]
+        for index in busy:
+            self._connections[index].send(("turn", self._snapshot.layout, turns[index]))
+
+        results: dict[int, TurnResult] = {}
+        for index in busy:
+            for result in self._connections[index].recv():
+                results[result.agent_id] = result
+        return results
+
+    def close(self) -> None:
+        """Stop the workers and free the snapshot."""
+        if not self._processes:
+            return
+        for conn in self._connections:
+            conn.send(("stop",))
+        for process in self._processes:
+            process.join(_STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+        self._connections.clear()
+        self._processes.clear()
+        self._snapshot.unlink()
@@ -0,0 +1,273 @@
+# pyright: reportImportCycles = false
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from _aegis_game.common.objects import Rubble, Survivor
+from _aegis_game.team import Team
+from _aegis_game.types import LayerKind
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from _aegis_game.game import Game
+
+# Offset of every array in the segment is rounded up to this many bytes
+_ALIGNMENT = 8
+
+# Slots of the `header` array
+ROUND = 0
+GOOBS_LUMENS = 1
+VOIDSEERS_LUMENS = 2
+AGENT_COUNT = 3
+# Arrays of each team's knowledge grid, in the order `TeamKnowledge` takes them
+KNOWLEDGE_ARRAYS = (
+    "knowledge_move_costs",
+    "knowledge_top_layer_kinds",
+    "knowledge_visited",
+    "knowledge_scanned",
+)
+
+
+@dataclass(frozen=True)
+class SnapshotLayout:
+    """
+    Describes a snapshot segment, so worker processes can attach to it.
+
+    Attributes:
+        name: Name of the shared memory segment.
+        width: Width of the world.
+        height: Height of the world.
+        layer_capacity: Number of layers the world started with.
+        agent_capacity: Number of agent slots the segment has room for.
+
+    """
+
+    name: str
+    width: int
+    height: int
+    layer_capacity: int
+    agent_capacity: int
+
+    def fields(self) -> list[tuple[str, type[np.generic], tuple[int, ...]]]:
+        """Return the `(name, dtype, shape)` of every array in the segment."""
+        cells = self.width * self.height
+        layers = max(self.layer_capacity, 1)
+        agents = self.agent_capacity
+        return [
+            ("header", np.int64, (4,)),
+            ("cell_types", np.int8, (cells,)),
+            ("move_costs", np.int32, (cells,)),
+            ("survivor_counts", np.int32, (cells,)),
+            # layers of a cell are stored top first from `layer_start`
+            ("layer_start", np.int32, (cells,)),
+            ("layer_counts", np.int32, (cells,)),
+            ("top_layer_kinds", np.int8, (cells,)),
+            ("layer_kinds", np.int8, (layers,)),
+            ("layer_ids", np.int32, (layers,)),
+            # survivor health or rubble energy required
+            ("layer_values", np.int32, (layers,)),
+            ("layer_agents_required", np.int32, (layers,)),
+            # ids of the agents in a cell, in the cell's own order
+            ("cell_agent_start", np.int32, (cells,)),
+            ("cell_agent_counts", np.int32, (cells,)),
+            ("cell_agents", np.int32, (agents,)),
+            # agent columns, indexed by agent table slot
+            ("agent_ids", np.int32, (agents,)),
+            ("agent_x", np.int32, (agents,)),
+            ("agent_y", np.int32, (agents,)),
+            ("agent_energy", np.int32, (agents,)),
+            ("agent_cooldown", np.int32, (agents,)),
+            ("agent_teams", np.int8, (agents,)),
+            ("agent_alive", np.bool_, (agents,)),
+            ("agent_visited", np.bool_, (agents, self.height, self.width)),
+            # times the agent's visited map gained cells, see `Game.visited_revision`
+            ("agent_visited_revisions", np.int64, (agents,)),
+            ("drone_scanned", np.bool_, (len(Team), cells)),
+            # each team's knowledge grid, if team knowledge is enabled
+            ("knowledge_move_costs", np.int32, (len(Team), cells)),
+            ("knowledge_top_layer_kinds", np.int8, (len(Team), cells)),
+            ("knowledge_visited", np.bool_, (len(Team), cells)),
+            ("knowledge_scanned", np.bool_, (len(Team), cells)),
+        ]
+
+    def size(self) -> int:
+        """Return the number of bytes the segment needs."""
+        offset = 0
+        for _, dtype, shape in self.fields():
+            offset = _align(offset) + int(np.dtype(dtype).itemsize * np.prod(shape))
+        return max(offset, 1)
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class WorldSnapshot:
+    """
+    Copy of the world state agents can read during a round, kept in shared memory.
+
+    The game writes the snapshot at the start of every round and worker processes
+    read it while their agents think. Only the committed world is copied, which is
+    what agents see during a round anyway.
+    """
+
+    def __init__(self, layout: SnapshotLayout, shm: SharedMemory) -> None:
+        """
+        Map the arrays of a snapshot segment.
+
+        Use `create` or `attach` instead of calling this directly.
+
+        Args:
+            layout: The layout of the segment.
+            shm: The shared memory segment.
+
+        """
+        self.layout: SnapshotLayout = layout
+        self.shm: SharedMemory = shm
+        self.arrays: dict[str, NDArray[np.generic]] = {}
+        offset = 0
+        for name, dtype, shape in layout.fields():
+            offset = _align(offset)
+            array: NDArray[np.generic] = np.ndarray(
+                shape, dtype=dtype, buffer=shm.buf, offset=offset
+            )
+            self.arrays[name] = array
+            offset += array.nbytes
+
+    @classmethod
+    def create(cls, game: Game, agent_capacity: int) -> WorldSnapshot:
+        """
+        Allocate a snapshot segment for a game.
+
+        Args:
+            game: The game to snapshot.
+            agent_capacity: Number of agent slots to make room for.
+
+        Returns:
+            The new snapshot, owned by the caller.
+
+        """
+        world = game.current_world
+        layer_capacity = sum(len(cell.layers) for cell in world.cells)
+        probe = SnapshotLayout(
+            "", world.width, world.height, layer_capacity, agent_capacity
+        )
+        shm = SharedMemory(create=True, size=probe.size())
+        layout = SnapshotLayout(
+            shm.name, world.width, world.height, layer_capacity, agent_capacity
+        )
+        snapshot = cls(layout, shm)
+
+        # layers are only ever removed, so every cell keeps its starting slot
+        counts = np.array([len(cell.layers) for cell in world.cells], dtype=np.int32)
+        starts = snapshot.arrays["layer_start"]
+        starts[0] = 0
+        np.cumsum(counts[:-1], out=starts[1:])
+        snapshot.arrays["cell_types"][:] = world.cell_types
+        return snapshot
+
+    @classmethod
+    def attach(cls, layout: SnapshotLayout) -> WorldSnapshot:
+        """Attach to a snapshot segment created by the game."""
+        return cls(layout, SharedMemory(name=layout.name))
+
+    def publish(self, game: Game) -> None:
+        """Write the state agents can read this round."""
+        world = game.current_world
+        arrays = self.arrays
+        header = arrays["header"]
+        header[ROUND] = game.round
+        header[GOOBS_LUMENS] = game.team_info.get_lumens(Team.GOOBS)
+        header[VOIDSEERS_LUMENS] = game.team_info.get_lumens(Team.VOIDSEERS)
+
+        arrays["move_costs"][:] = world.move_costs
+        arrays["survivor_counts"][:] = world.survivor_counts
+        arrays["layer_counts"][:] = world.layer_counts
+        arrays["top_layer_kinds"][:] = world.top_layer_kinds
+        self._write_layers(game)
+        self._write_agents(game)
+
+        scanned = arrays["drone_scanned"]
+        scanned[:] = False
+        for loc, teams in game.drone_scans().items():
+            for team in teams:
+                scanned[team.value, loc.x + loc.y * world.width] = True
+
+        for team, grid in game.team_knowledge.items():
+            arrays["knowledge_move_costs"][team.value] = grid.move_costs.ravel()
+            arrays["knowledge_top_layer_kinds"][team.value] = (
+                grid.top_layer_kinds.ravel()
+            )
+            arrays["knowledge_visited"][team.value] = grid.visited.ravel()
+            arrays["knowledge_scanned"][team.value] = grid.scanned.ravel()
+
+    def _write_layers(self, game: Game) -> None:
+        world = game.current_world
+        starts = self.arrays["layer_start"]
+        kinds = self.arrays["layer_kinds"]
+        ids = self.arrays["layer_ids"]
+        values = self.arrays["layer_values"]
+        agents_required = self.arrays["layer_agents_required"]
+        for index in np.flatnonzero(world.layer_counts).tolist():
+            slot = int(starts[index])
+            for layer in world.cells[index].layers:
+                ids[slot] = layer.id
+                if isinstance(layer, Survivor):
+                    kinds[slot] = LayerKind.SURVIVOR.value
+                    values[slot] = layer.health
+                    agents_required[slot] = 0
+                elif isinstance(layer, Rubble):
+                    kinds[slot] = LayerKind.RUBBLE.value
+                    values[slot] = layer.energy_required
+                    agents_required[slot] = layer.agents_required
+                slot += 1
+
+    def _write_agents(self, game: Game) -> None:
+        world = game.current_world
+        table = game.agent_table
+        arrays = self.arrays
+        size = table.size
+        arrays["header"][AGENT_COUNT] = size
+        arrays["agent_ids"][:size] = table.ids[:size]
+        arrays["agent_x"][:size] = table.x[:size]
+        arrays["agent_y"][:size] = table.y[:size]
+        arrays["agent_energy"][:size] = table.energy[:size]
+        arrays["agent_cooldown"][:size] = table.cooldown[:size]
+        arrays["agent_alive"][:size] = table.alive[:size]
+
+        visited = arrays["agent_visited"]
+        revisions = arrays["agent_visited_revisions"]
+        teams = arrays["agent_teams"]
+        for agent in game.agents.values():
+            teams[agent.slot] = agent.team.value
+            visited[agent.slot] = agent.has_visited
+            revisions[agent.slot] = game.visited_revision(agent)
+
+        # agent ids of every occupied cell, in the same order as the cell's own list
+        start = arrays["cell_agent_start"]
+        counts = arrays["cell_agent_counts"]
+        cell_agents = arrays["cell_agents"]
+        counts[:] = 0
+        slots = table.alive_slots()
+        offset = 0
+        for index in np.unique(table.x[slots] + table.y[slots] * world.width).tolist():
+            agent_ids = world.cells[index].agents
+            start[index] = offset
+            counts[index] = len(agent_ids)
+            cell_agents[offset : offset + len(agent_ids)] = agent_ids
+            offset += len(agent_ids)
+
+    def close(self) -> None:
+        """Detach from the segment."""
+        self.arrays.clear()
+        self.shm.close()
+
+    def unlink(self) -> None:
+        """Detach from and free the segment. Only the game calls this."""
+        self.close()
+        self.shm.unlink()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import marshal
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from _aegis_game.agent_type import AgentType
+from _aegis_game.common import Location
+from _aegis_game.constants import Constants
+from _aegis_game.pathfinding import PathFinder
+from _aegis_game.sandbox.core import LumenCore, MainTemplate
+from _aegis_game.sandbox.memory import MemoryMeter
+from _aegis_game.sandbox.meter import InstructionMeter
+from _aegis_game.sandbox.random_state import RandomState
+from _aegis_game.sandbox.sandbox import Sandbox
+from _aegis_game.sandbox.scheduler import TurnScheduler
+from _aegis_game.team import Team
+
+from .controller import RemoteAgentController, SnapshotReader, TurnInput, TurnResult
+from .snapshot import SnapshotLayout, WorldSnapshot
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from pathlib import Path
+
+    from _aegis_game.aegis_config import Features
+
+
+@dataclass
+class WorkerSetup:
+    """
+    Everything a worker process needs before it can host agents.
+
+    Attributes:
+        code: Marshaled code modules of each team, indexed by team value.
+        features: The features the game runs with.
+        layout: Layout of the first snapshot segment.
+        max_agents: Maximum number of agents per team.
+        directories: Directory of each team's agent, indexed by team value.
+        seed: Seed of the world, each agent's `random` stream is seeded from it
+            and the agent's id.
+
+    """
+
+    code: list[dict[str, bytes] | None]
+    features: Features
+    layout: SnapshotLayout
+    max_agents: int
+    directories: list[Path | None]
+    seed: int
+
+
+def run_worker(conn: Connection, setup: WorkerSetup) -> None:
+    """
+    Host agents in this process until the game tells the worker to stop.
+
+    The game sends one command at a time and waits for the reply to `turn`:
+
+        ("launch", agent_id, slot, team, agent_type)
+        ("kill", agent_id)
+        ("turn", layout, turns)  -> list[TurnResult]
+        ("stop",)
+
+    Args:
+        conn: This worker's end of the pipe to the game.
+        setup: The game's code, features and first snapshot layout.
+
+    """
+    host = AgentHost(setup)
+    try:
+        while True:
+            match conn.recv():
+                case ("launch", agent_id, slot, team, agent_type):
+                    host.launch(agent_id, slot, Team(team), AgentType[agent_type])
+                case ("kill", agent_id):
+                    host.kill(agent_id)
+                case ("turn", layout, turns):
+                    conn.send(host.play(layout, turns))
+                case _:
+                    break
+    finally:
+        host.close()
+
+
+class AgentHost:
+    """The agents of one worker process and everything their turns share."""
+
+    def __init__(self, setup: WorkerSetup) -> None:
+        """
+        Prepare the worker to host agents.
+
+        Args:
+            setup: The game's code, features and first snapshot layout.
+
+        """
+        self.setup: WorkerSetup = setup
+        Location.intern(setup.layout.width, setup.layout.height)
+        # code objects can't be pickled, the game marshals the modules it compiled
+        self.code: list[Sandbox | None] = [
+            Sandbox({name: marshal.loads(blob) for name, blob in modules.items()})  # noqa: S302
+            if modules is not None
+            else None
+            for modules in setup.code
+        ]
+        self.main_templates: list[MainTemplate] = [MainTemplate() for _ in self.code]
+        self.meter: InstructionMeter | None = None
+        if setup.features.turn_instruction_budget > 0:
+            self.meter = InstructionMeter(setup.features.turn_instruction_budget)
+            for sandbox in self.code:
+                if sandbox is not None:
+                    self.meter.watch(sandbox)
+        self.memory: MemoryMeter | None = None
+        if setup.features.agent_memory_quota_mb > 0:
+            self.memory = MemoryMeter(setup.features.agent_memory_quota_mb)
+        # a runaway agent is stopped here, so it can't wedge the whole worker
+        self.scheduler: TurnScheduler = TurnScheduler(deadline=Constants.TURN_DEADLINE)
+        self.reader: SnapshotReader = SnapshotReader(
+            WorldSnapshot.attach(setup.layout), setup.features
+        )
+        # the worker's agents share their searches, like the game's agents do
+        self.path_finder: PathFinder = PathFinder(setup.layout.width)
+        self.agents: dict[int, tuple[LumenCore, RemoteAgentController]] = {}
+
+    def launch(
+        self, agent_id: int, slot: int, team: Team, agent_type: AgentType
+    ) -> None:
+        """Start hosting an agent."""
+        controller = RemoteAgentController(
+            self.reader,
+            agent_id,
+            slot,
+            team,
+            agent_type,
+            self.setup.max_agents,
+            self.setup.directories[team.value],
+            path_finder=self.path_finder,
+        )
+        sandbox = self.code[team.value]
+        if sandbox is None:
+            error = "No code provided to launch."
+            raise ValueError(error)
+        core = LumenCore(
+            sandbox,
+            controller.methods(),
+            controller.error,
+            self.scheduler,
+            self.meter,
+            self.memory,
+            random_state=RandomState(self.setup.seed, agent_id),
+            main=self.main_templates[team.value],
+        )
+        self.agents[agent_id] = (core, controller)
+
+    def kill(self, agent_id: int) -> None:
+        """Stop hosting an agent."""
+        agent = self.agents.pop(agent_id, None)
+        if agent is not None:
+            agent[0].kill()
+
+    def play(self, layout: SnapshotLayout, turns: list[TurnInput]) -> list[TurnResult]:
+        """Play the turns of a round on the snapshot with the given layout."""
+        if layout != self.reader.snapshot.layout:
+            self.reader.snapshot.close()
+            previous = self.reader
+            self.reader = SnapshotReader(
+                WorldSnapshot.attach(layout), self.setup.features
+            )
+            self.reader.keep_knowledge(previous)
+            for _, controller in self.agents.values():
+                controller.attach(self.reader)
+        self.reader.begin_round()
+        return [self._play_turn(turn) for turn in turns]
+
+    def close(self) -> None:
+        """Release what the agents shared."""
+        self.scheduler.shutdown()
+        self.reader.snapshot.close()
+
+    def _play_turn(self, turn: TurnInput) -> TurnResult:
+        core, controller = self.agents[turn.agent_id]
+        controller.begin_turn(turn)
+        start = time.perf_counter()
+        core.run()
+        controller.result.duration = time.perf_counter() - start - core.setup_time
+        controller.result.instructions = core.instructions
+        controller.result.timed_out = core.timed_out
+        controller.result.memory_peak = core.memory_peak
+        return controller.result
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+from importlib.metadata import version
+from pathlib import Path
+from types import CodeType
+
+from _aegis_game.logger import LOGGER
+
+from .typed_ast import POLICY_VERSION
+
+# Relative to the directory aegis is launched from
+DEFAULT_CACHE_DIR = Path(".aegis_cache") / "compiled"
+
+
+class CompileCache:
+    """
+    Keeps compiled agent code on disk so unchanged agents skip the AST transform.
+
+    Entries are addressed by a hash of the source and its filename, together with the
+    RestrictedPython version, the `NodeTransformer` policy version and the bytecode
+    magic number, so a change to any of them misses the cache instead of loading
+    stale code. Entries are marshalled code objects written atomically, so
+    concurrent launches can share a directory.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Initialize the cache, the directory is created on the first store.
+
+        Args:
+            directory: Directory the compiled code is kept in.
+
+        """
+        self.directory: Path = directory
+        self._salt: bytes = b"\0".join(
+            [
+                version("RestrictedPython").encode(),
+                str(POLICY_VERSION).encode(),
+                importlib.util.MAGIC_NUMBER,
+            ]
+        )
+
+    def key(self, filename: str, source: str) -> str:
+        """Return the cache key of a source file."""
+        digest = hashlib.sha256(self._salt)
+        digest.update(b"\0" + filename.encode() + b"\0")
+        digest.update(source.encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> CodeType | None:
+        """
+        Load compiled code from the cache.
+
+        Args:
+            key: Key of the source file, from `key`.
+
+        Returns:
+            The compiled code, or None if it isn't cached or can't be read.
+
+        """
+        try:
+            data = (self.directory / key).read_bytes()
+        except OSError:
+            return None
+        try:
+            # only ever read back what this cache wrote itself
+            code = marshal.loads(data)  # noqa: S302
+        except (EOFError, ValueError, TypeError):
+            LOGGER.warning(f"Ignoring corrupt compile cache entry {key}")
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def store(self, key: str, code: CodeType) -> None:
+        """
+        Store compiled code in the cache, failing to write it is only logged.
+
+        Args:
+            key: Key of the source file, from `key`.
+            code: The code the source compiled to.
+
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{key}")
+            with os.fdopen(fd, "wb") as file:
+                _ = file.write(marshal.dumps(code))
+            _ = Path(tmp).replace(self.directory / key)
+        except OSError as e:
+            LOGGER.warning(f"Failed to write compile cache entry {key}: {e}")
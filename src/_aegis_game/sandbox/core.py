@@ -1,11 +1,16 @@
 # pyright: reportMissingTypeStubs = false
 # pyright: reportUnknownMemberType = false
 import builtins as py_builtins
+import copy
+import gc
+import operator
+import random
+import sys
 import traceback
 import types
 from collections.abc import Callable, Mapping, Sequence
-from threading import Event, Thread
-from typing import Any, override
+from functools import cache
+from typing import Any
 
 from RestrictedPython import (  # pyright: ignore[reportMissingImports]
     Guards,
@@ -15,40 +20,87 @@ from RestrictedPython import (  # pyright: ignore[reportMissingImports]
 
 from _aegis_game.types import MethodDict
 
+from .lazy_import import SETUP_CLOCK, lazy_module
+from .memory import BYTES_PER_MB, MemoryMeter
+from .meter import InstructionBudgetExceededError, InstructionMeter
+from .random_state import RandomState
 from .sandbox import Sandbox
+from .scheduler import TurnScheduler
+
+# Augmented assignments in agent code rebind the name to a new value instead of
+# updating it in place
+_INPLACE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "+=": operator.add,
+    "-=": operator.sub,
+    "*=": operator.mul,
+    "/=": operator.truediv,
+    "%=": operator.mod,
+    "**=": operator.pow,
+    "<<=": operator.lshift,
+    ">>=": operator.rshift,
+    "|=": operator.or_,
+    "^=": operator.xor,
+    "&=": operator.and_,
+    "//=": operator.floordiv,
+    "@=": operator.floordiv,
+}
+
+
+def _inplacevar_(op: str, var: Any, expr: Any) -> Any:  # noqa: ANN401
+    operator_ = _INPLACE_OPERATORS.get(op)
+    return None if operator_ is None else operator_(var, expr)
+
+
+ALLOWED_MODULES = frozenset(
+    {
+        "os",
+        "typing",
+        "pathlib",
+        "random",
+        "heapq",
+        "math",
+        "json",
+        "re",
+        "enum",
+        "numpy",
+        "tensorflow",
+        "tf",
+    }
+)
+
+# Allowed modules that take seconds to import, agents get a proxy that imports
+# them on first use and the time it takes is charged to setup instead of the turn
+LAZY_MODULES = frozenset({"tensorflow"})
+
+
+class AgentStoppedError(Exception):
+    """Raised when a stopped agent calls the agent API, its calls don't count."""
 
 
-def _inplacevar_(op: str, var:Any, expr:Any) -> Any:  # noqa: ANN401, C901, PLR0911, RET503
-    if op == "+=":
-        return var + expr
-    if op == "-=":
-        return var - expr
-    if op == "*=":
-        return var * expr
-    if op == "/=":
-        return var / expr
-    if op == "%=":
-        return var % expr
-    if op == "**=":
-        return var ** expr
-    if op == "<<=":
-        return var << expr
-    if op == ">>=":
-        return var >> expr
-    if op == "|=":
-        return var | expr
-    if op == "^=":
-        return var ^ expr
-    if op == "&=":
-        return var & expr
-    if op in {"//=", "@="}:
-        return var // expr
+def _gate(method: Callable[..., object]) -> Callable[..., object]:
+    def call(core: LumenCore, *args: object, **kwargs: object) -> object:
+        if core.stopped:
+            error = "The agent was stopped, it can't act anymore"
+            raise AgentStoppedError(error)
+        return method(*args, **kwargs)
+
+    return call
+
 
 class LumenCore:
     """Core executor for running agent code in a restricted, sandboxed environment."""
 
-    def __init__(
-        self, code: Sandbox, methods: MethodDict, error: Callable[..., None]
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        code: Sandbox,
+        methods: MethodDict,
+        error: Callable[..., None],
+        scheduler: TurnScheduler | None = None,
+        meter: InstructionMeter | None = None,
+        memory: MemoryMeter | None = None,
+        *,
+        random_state: RandomState | None = None,
+        main: "MainTemplate | None" = None,
     ) -> None:
         """
         Initialize the LumenCore executor.
@@ -57,30 +109,46 @@ class LumenCore:
             code: A sandboxed script containing the agent logic.
             methods: A dictionary of allowed API methods for the agent.
             error: A callback to report errors during execution.
+            scheduler: The scheduler turns are played on. If None, turns are
+                played on the calling thread.
+            meter: Meter that stops a turn once it runs out of instructions. If
+                None, turns aren't metered.
+            memory: Meter that accounts the memory the agent allocates. If None,
+                memory isn't accounted.
+            random_state: The agent's own `random` stream, swapped in for its
+                turns. If None, the agent draws from the process-wide stream.
+            main: The team's main module template the agent's globals are cloned
+                from. If None, the agent executes the module itself.
 
         """
         self.code: Sandbox = code
-        self.methods: MethodDict = methods
+        # the API refuses every call once the agent is stopped, so code still
+        # running on an abandoned thread can't act for it, even through a method
+        # it kept a reference to
+        self.methods: MethodDict = {
+            name: types.MethodType(_gate(method), self)
+            if isinstance(method, types.MethodType)
+            else method
+            for name, method in methods.items()
+        }
         self.error: Callable[..., None] = error
+        self.scheduler: TurnScheduler | None = scheduler
+        self.meter: InstructionMeter | None = meter
+        self.memory: MemoryMeter | None = memory
+        self.random_state: RandomState | None = random_state
+        self.main: MainTemplate | None = main
+        # bytes the agent's turns allocated and still hold, and the most they held
+        self.memory_held: int = 0
+        self.memory_peak: int = 0
+        # instructions executed by the last turn, 0 if turns aren't metered
+        self.instructions: int = 0
+        # whether the last turn was stopped at the scheduler's deadline
+        self.timed_out: bool = False
+        # seconds the last turn spent importing lazily imported modules
+        self.setup_time: float = 0.0
         self.initialized: bool = False
-        self.thread: LumenThread = LumenThread(self)
-        self.thread.start()
-
-        self.allowed_modules: set[str] = {
-            "os",
-            "typing",
-            "pathlib",
-            "random",
-            "heapq",
-            "math",
-            "json",
-            "re",
-            "enum",
-            "numpy",
-            "tensorflow",
-            "tf",
-        }
-
+        # whether the agent was killed or its turn stopped at the deadline
+        self.stopped: bool = False
         self.namespace: dict[str, object] = self._build_namespace()
 
     def _build_namespace(self) -> dict[str, object]:
@@ -91,55 +159,20 @@ class LumenCore:
             A dictionary representing the sandboxed execution environment.
 
         """
-        builtins: MethodDict = {
-            **safe_builtins,
-            **limited_builtins,
-            **self.methods,
-            **{
-                name: getattr(py_builtins, name)
-                for name in [
-                    "all",
-                    "any",
-                    "list",
-                    "dict",
-                    "set",
-                    "tuple",
-                    "enumerate",
-                    "reversed",
-                    "max",
-                    "min",
-                    "sum",
-                ]
-            },
-        }
-
-        builtins["__import__"] = self.custom_import
+        return namespace_template().instantiate(self.methods)
 
-        namespace: dict[str, object] = {
-            "__builtins__": builtins,
-            "_inplacevar_": _inplacevar_,
-            "__name__": "__main__",
-            "_getattr_": self.deny_private_attr,
-            "_getitem_": self.deny_private_items,
-            "_getiter_": self.default_guarded_iter,
-            "_write_": self.default_guarded_write,
-            "__metaclass__": type,
-            "_unpack_sequence_": Guards.guarded_unpack_sequence,
-            "_iter_unpack_sequence_": Guards.guarded_iter_unpack_sequence,
-        }
-
-        return namespace
-
-    def default_guarded_iter(self, ob: object) -> object:
+    @staticmethod
+    def default_guarded_iter(ob: object) -> object:
         """Bypass iteration restrictions (safe override for RestrictedPython)."""
         return ob
 
-    def default_guarded_write(self, ob: object) -> object:
+    @staticmethod
+    def default_guarded_write(ob: object) -> object:
         """Bypass write restrictions (safe override for RestrictedPython)."""
         return ob
 
+    @staticmethod
     def custom_import(
-        self,
         name: str,
         globals_: Mapping[str, object] | None = None,
         locals_: Mapping[str, object] | None = None,
@@ -150,9 +183,21 @@ class LumenCore:
         Import guard for controlling allowed modules.
 
         Disallows relative/private imports and validates modules against allowlist.
+        Modules in `LAZY_MODULES` are returned as proxies that import on first use.
         """
+        # C extensions of allowed modules, numpy's array methods for example, import
+        # their already loaded helpers on first use with an empty fromlist list,
+        # which agent code can't pass
+        if (
+            isinstance(fromlist, list)
+            and not fromlist
+            and name.partition(".")[0] in ALLOWED_MODULES
+            and name in sys.modules
+        ):
+            return sys.modules[name]
+
         # Allow "import module" if it's in the allowed list
-        if not fromlist and name not in self.allowed_modules:
+        if not fromlist and name not in ALLOWED_MODULES:
             error = f"Import of module '{name}' is not allowed"
             raise ImportError(error)
 
@@ -167,9 +212,13 @@ class LumenCore:
             raise ImportError(error)
 
         # Disallow private imports
-        if name.startswith("_") or name not in self.allowed_modules:
+        if name.startswith("_") or name not in ALLOWED_MODULES:
             error = f"Import of module '{name}' is not allowed"
             raise ImportError(error)
+
+        # "from module import name" needs the module right away
+        if not fromlist and name in LAZY_MODULES and name not in sys.modules:
+            return lazy_module(name)
         return __import__(name, globals_, locals_, fromlist, level)  # pyright: ignore[reportAny]
 
     @staticmethod
@@ -191,7 +240,10 @@ class LumenCore:
     def init(self) -> None:
         """Initialize the agent's main code."""
         try:
-            exec(self.code["main"], self.namespace)  # noqa: S102
+            if self.main is None:
+                exec(self.code["main"], self.namespace)  # noqa: S102
+            else:
+                self.main.execute_into(self.code, self.namespace, self.methods)
             self.initialized = True
         except Exception:  # noqa: BLE001
             self.error(traceback.format_exc(limit=5))
@@ -208,71 +260,295 @@ class LumenCore:
             self.error(traceback.format_exc(limit=5))
 
     def run(self) -> None:
-        """Triggers a turn execution in the LumenThread and waits for completion."""
-        self.thread.trigger_turn()
-        self.thread.wait_for_turn()
+        """Play a turn on the scheduler and wait for it to finish or time out."""
+        setup_start = SETUP_CLOCK.seconds()
+        try:
+            if self.random_state is None:
+                self._schedule()
+            else:
+                with self.random_state.swapped_in():
+                    self._schedule()
+        finally:
+            self.setup_time = SETUP_CLOCK.seconds() - setup_start
+
+    def _schedule(self) -> None:
+        if self.scheduler is None:
+            self.run_inline()
+            return
+
+        self.timed_out = not self.scheduler.run(self.run_inline, self.code)
+        if self.timed_out:
+            self.stopped = True
+            self.error(
+                f"Turn stopped after exceeding the {self.scheduler.deadline}s deadline"
+            )
+
+    def run_inline(self) -> None:
+        """Play a turn on the calling thread."""
+        if self.memory is None:
+            self._run_metered()
+            return
+
+        self.memory.start()
+        try:
+            self._run_metered()
+        finally:
+            self.memory_held, peak = self.memory.stop(self.memory_held)
+            self.memory_peak = max(self.memory_peak, peak)
+        if peak > self.memory.quota:
+            self.error(
+                f"Agent used {peak / BYTES_PER_MB:.1f} MB, over its "
+                f"{self.memory.quota // BYTES_PER_MB} MB memory quota"
+            )
+
+    def _run_metered(self) -> None:
+        if self.meter is None:
+            self._play()
+            return
+
+        self.meter.start()
+        try:
+            self._play()
+        except InstructionBudgetExceededError:
+            self.error(
+                f"Turn stopped after using its budget of {self.meter.budget} instructions"
+            )
+        finally:
+            self.instructions = self.meter.stop()
+
+    def _play(self) -> None:
+        if not self.initialized:
+            self.init()
+        self.think()
 
     def kill(self) -> None:
-        """Terminates the thread execution and waits for cleanup."""
-        self.thread.kill()
-        self.thread.join()
+        """Stop the agent and drop its namespace, no thread has to be waited for."""
+        self.stopped = True
+        self.namespace.clear()
 
 
-class LumenThread(Thread):
-    """Manages a background thread for executing agent logic turn-by-turn."""
+class NamespaceTemplate:
+    """
+    The part of an agent namespace that is the same for every agent.
 
-    def __init__(self, runner: LumenCore) -> None:
+    Merging RestrictedPython's builtins and the guards is done once, spawning an
+    agent only copies the template and adds that agent's own API methods.
+    """
+
+    def __init__(self) -> None:
+        """Build the shared builtins and guards."""
+        self.builtins: MethodDict = {
+            **safe_builtins,
+            **limited_builtins,
+            **{
+                name: getattr(py_builtins, name)
+                for name in [
+                    "all",
+                    "any",
+                    "list",
+                    "dict",
+                    "set",
+                    "tuple",
+                    "enumerate",
+                    "reversed",
+                    "max",
+                    "min",
+                    "sum",
+                ]
+            },
+        }
+        self.globals: dict[str, object] = {
+            "_inplacevar_": _inplacevar_,
+            "__name__": "__main__",
+            "_getattr_": LumenCore.deny_private_attr,
+            "_getitem_": LumenCore.deny_private_items,
+            "_getiter_": LumenCore.default_guarded_iter,
+            "_write_": LumenCore.default_guarded_write,
+            "__metaclass__": type,
+            "_unpack_sequence_": Guards.guarded_unpack_sequence,
+            "_iter_unpack_sequence_": Guards.guarded_iter_unpack_sequence,
+        }
+
+    def instantiate(self, methods: MethodDict) -> dict[str, object]:
         """
-        Initialize a turn-based thread runner.
+        Create the namespace of one agent.
 
         Args:
-            runner: The LumenCore instance this thread manages.
+            methods: The agent's API methods, they can't shadow `__import__`.
 
+        Returns:
+            A fresh namespace, nothing in it is shared with other agents' namespaces
+            except the immutable builtins themselves.
+
+        """
+        builtins = {**self.builtins, **methods}
+        builtins["__import__"] = LumenCore.custom_import
+        return {"__builtins__": builtins, **self.globals}
+
+
+@cache
+def namespace_template() -> NamespaceTemplate:
+    """Return the namespace template shared by every agent of this process."""
+    return NamespaceTemplate()
+
+
+class _RecordedMethod:
+    """Calls an agent API method and remembers that it was called."""
+
+    def __init__(self, method: Callable[..., object]) -> None:
+        self.method: Callable[..., object] = method
+        # agent code can swallow the method's errors, so the call is remembered
+        self.called: bool = False
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        self.called = True
+        return self.method(*args, **kwargs)
+
+
+class MainTemplate:
+    """
+    A team's main module, executed once per game and cloned for each of its agents.
+
+    Executing the module is most of an agent's first turn, and a commander spawning
+    agents mid-game pays it again for every one of them. The first agent to play
+    executes it in its own namespace, as it would without a template, and a copy of
+    the resulting globals becomes the template. Every later agent gets a deep copy
+    of it, with the module's functions rebuilt around the agent's own namespace so
+    they call that agent's API.
+
+    The copy is only the same as executing the module if the module's top-level code
+    doesn't depend on the agent. A module that calls the agent API, draws from
+    `random`, fails, or defines classes or closures over its globals isn't cloned,
+    each later agent executes it on its own instead. Either way the module runs
+    once per agent at most.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a template that hasn't executed the module yet."""
+        self.executed: bool = False
+        # the template's globals, None if the module can't be cloned
+        self._namespace: dict[str, object] | None = None
+        self._functions: list[types.FunctionType] = []
+        # stand in for the agent API methods in the template's globals
+        self._placeholders: dict[str, object] = {}
+        # objects every clone shares instead of copying, by id
+        self._shared: dict[int, object] = {}
+
+    def execute_into(
+        self, code: Sandbox, namespace: dict[str, object], methods: MethodDict
+    ) -> None:
         """
-        super().__init__()
-        self.runner: LumenCore = runner
-        self.running: bool = True
-        self.paused: bool = False
+        Fill an agent's namespace with the executed main module.
 
-        self.run_event: Event = Event()
-        self.pause_event: Event = Event()
-        self.turn_done_event: Event = Event()
+        The first agent executes the module itself and the time it takes is part of
+        its turn. Errors raised by the module propagate to the caller.
 
-    @override
-    def run(self) -> None:
-        """Thread loop. Waits for turn triggers and runs agent logic."""
-        while self.running:
-            _ = self.run_event.wait()
-            if not self.running:
-                break
-
-            if not self.runner.initialized:
-                self.runner.init()
-
-            self.runner.think()
-            self.run_event.clear()
-            self.turn_done_event.set()
-
-    def trigger_turn(self) -> None:
-        """Signals the thread to start or resume a turn."""
-        if self.paused:
-            self.pause_event.set()
-        else:
-            self.run_event.set()
-
-    def wait_for_turn(self) -> None:
-        """Wait for the current turn to finish."""
-        _ = self.turn_done_event.wait()
-        _ = self.turn_done_event.clear()
-
-    def wait_for_resume(self) -> None:
-        """Wait for the thread to resume if paused."""
-        self.turn_done_event.set()
-        _ = self.pause_event.wait()
-        self.pause_event.clear()
+        Args:
+            code: The team's code.
+            namespace: The agent's namespace, as built from the namespace template.
+            methods: The agent's API methods.
 
-    def kill(self) -> None:
-        """Gracefully shuts down the thread."""
-        self.running = False
-        self.run_event.set()
-        self.pause_event.set()
+        """
+        if not self.executed:
+            self.executed = True
+            self._execute(code, namespace, methods)
+            return
+        source = self._namespace
+        if source is not None:
+            substitutes: dict[int, object] = {
+                id(placeholder): methods[name]
+                for name, placeholder in self._placeholders.items()
+            }
+            try:
+                clone, _ = self._clone(source, self._functions, namespace, substitutes)
+            except Exception:  # noqa: BLE001
+                # an object of the module can't be copied, it never will be
+                self._namespace = None
+            else:
+                namespace.update(clone)
+                return
+        exec(code["main"], namespace)  # noqa: S102
+
+    def _execute(
+        self, code: Sandbox, namespace: dict[str, object], methods: MethodDict
+    ) -> None:
+        # bound methods are the agent's API, everything else is the same for every
+        # agent
+        recorded = {
+            name: _RecordedMethod(method)
+            for name, method in methods.items()
+            if isinstance(method, types.MethodType)
+        }
+        builtins: MethodDict = namespace["__builtins__"]  # pyright: ignore[reportAssignmentType]
+        builtins.update(recorded)
+        state = random.getstate()
+        try:
+            exec(code["main"], namespace)  # noqa: S102
+        finally:
+            builtins.update({name: methods[name] for name in recorded})
+        if random.getstate() != state or any(
+            method.called for method in recorded.values()
+        ):
+            return
+
+        # every function the module created refers to its globals
+        functions = [
+            referrer
+            for referrer in gc.get_referrers(namespace)
+            if isinstance(referrer, types.FunctionType)
+        ]
+        if any(f.__closure__ is not None or "." in f.__qualname__ for f in functions):
+            return
+
+        self._shared = {id(module): module for module in sys.modules.values()}
+        self._shared.update(
+            (id(value), value)
+            for value in namespace.values()
+            if isinstance(value, types.ModuleType)
+        )
+        # the agent goes on to change its globals, the template keeps a copy of
+        # them as the module left them
+        self._placeholders = {name: object() for name in recorded}
+        substitutes: dict[int, object] = {
+            id(method): self._placeholders[name] for name, method in recorded.items()
+        }
+        template = namespace_template().instantiate(self._placeholders)
+        try:
+            clone, functions = self._clone(namespace, functions, template, substitutes)
+        except Exception:  # noqa: BLE001
+            return
+        template.update(clone)
+        self._namespace = template
+        self._functions = functions
+
+    def _clone(
+        self,
+        source: dict[str, object],
+        functions: list[types.FunctionType],
+        namespace: dict[str, object],
+        substitutes: dict[int, object],
+    ) -> tuple[dict[str, object], list[types.FunctionType]]:
+        memo = self._shared.copy()
+        memo.update(substitutes)
+        memo[id(source)] = namespace
+        memo[id(source["__builtins__"])] = namespace["__builtins__"]
+
+        clones: list[tuple[types.FunctionType, types.FunctionType]] = []
+        for function in functions:
+            clone = types.FunctionType(function.__code__, namespace, function.__name__)
+            memo[id(function)] = clone
+            clones.append((function, clone))
+        # defaults may refer to other functions of the module, so they are copied
+        # once every function has its clone
+        for function, clone in clones:
+            clone.__qualname__ = function.__qualname__
+            clone.__defaults__ = copy.deepcopy(function.__defaults__, memo)
+            clone.__kwdefaults__ = copy.deepcopy(function.__kwdefaults__, memo)
+            clone.__annotations__ = copy.deepcopy(function.__annotations__, memo)
+            clone.__dict__.update(copy.deepcopy(function.__dict__, memo))
+
+        return {
+            name: copy.deepcopy(value, memo)
+            for name, value in source.items()
+            if name != "__builtins__"
+        }, [clone for _, clone in clones]
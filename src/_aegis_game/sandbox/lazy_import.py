@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+import types
+from functools import cache
+
+
+class SetupClock:
+    """
+    Adds up the time spent loading lazily imported modules.
+
+    Turns of one process are played one at a time, so the time a turn spent
+    loading modules is how much the clock moved while it ran. It is subtracted
+    from the turn's time, loading a module is setup rather than thinking.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a clock that hasn't counted anything yet."""
+        self._seconds: float = 0.0
+        self._loading_since: float | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def seconds(self) -> float:
+        """Return the time spent loading so far, including a load in progress."""
+        with self._lock:
+            if self._loading_since is None:
+                return self._seconds
+            return self._seconds + time.perf_counter() - self._loading_since
+
+    def load(self, name: str) -> types.ModuleType:
+        """Import a module and count the time it took."""
+        with self._lock:
+            self._loading_since = time.perf_counter()
+        try:
+            return importlib.import_module(name)
+        finally:
+            with self._lock:
+                self._seconds += time.perf_counter() - self._loading_since
+                self._loading_since = None
+
+
+SETUP_CLOCK = SetupClock()
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stands in for a heavy module until agent code first uses one of its attributes.
+
+    Agents often import a module at the top of their code and only use it on some
+    code paths, importing it lazily keeps them from paying for it otherwise.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the proxy without importing the module.
+
+        Args:
+            name: Name of the module to import on first use.
+
+        """
+        super().__init__(name)
+        self._lazy_lock: threading.Lock = threading.Lock()
+        self._lazy_module: types.ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> object:
+        """Import the module if it isn't yet, then look the attribute up in it."""
+        module = self._lazy_module
+        if module is None:
+            with self._lazy_lock:
+                module = self._lazy_module
+                if module is None:
+                    module = SETUP_CLOCK.load(self.__name__)
+                    # later lookups of the module's attributes skip this method
+                    for key, value in vars(module).items():
+                        if not key.startswith("_"):
+                            setattr(self, key, value)
+                    self._lazy_module = module
+        return getattr(module, attr)
+
+
+@cache
+def lazy_module(name: str) -> LazyModule:
+    """Return the proxy of a module, shared by every agent of this process."""
+    return LazyModule(name)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import tracemalloc
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class MemoryMeter:
+    """
+    Accounts the memory agents allocate during their turns, using `tracemalloc`.
+
+    Turns of one process are played one at a time, so whatever the traced heap
+    grows by while a turn runs is charged to the agent playing it. What a turn
+    leaves behind is carried over to the agent's next turns, and the highest point
+    the agent's memory reaches, including memory freed again before the turn
+    ended, is its peak.
+    """
+
+    def __init__(self, quota_mb: int) -> None:
+        """
+        Start tracing allocations, unless something else is tracing them already.
+
+        Args:
+            quota_mb: Megabytes an agent's peak may reach.
+
+        """
+        self.quota: int = quota_mb * BYTES_PER_MB
+        self._started: bool = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self._before: int = 0
+
+    def start(self) -> None:
+        """Start accounting a new turn."""
+        tracemalloc.reset_peak()
+        self._before, _ = tracemalloc.get_traced_memory()
+
+    def stop(self, held: int) -> tuple[int, int]:
+        """
+        Account the turn that just ended.
+
+        Args:
+            held: Bytes the agent held before the turn.
+
+        Returns:
+            The bytes the agent holds after the turn, and its peak during the turn.
+
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        return max(held + current - self._before, 0), held + peak - self._before
+
+    def close(self) -> None:
+        """Stop tracing allocations if this meter started it."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import sys
+from types import CodeType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .sandbox import Sandbox
+
+_monitoring = sys.monitoring
+_INSTRUCTION = _monitoring.events.INSTRUCTION
+
+# Tool ids not reserved for debuggers, coverage tools, profilers or optimizers
+_TOOL_IDS = (3, 4)
+
+
+class InstructionBudgetExceededError(BaseException):
+    """
+    Raised in agent code once its turn has used up its instruction budget.
+
+    Derives from `BaseException` so `except Exception` in agent code can't catch it,
+    and it is raised again on every following instruction, so a bare `except` can't
+    keep the turn going either.
+    """
+
+
+class InstructionMeter:
+    """
+    Counts the bytecode instructions agent code executes, using `sys.monitoring`.
+
+    Only code objects compiled for a sandbox are watched, so the game methods an
+    agent calls and the modules it imports don't count against its budget. The
+    count only depends on the agent's code and the game state, never on how busy
+    the machine is.
+    """
+
+    def __init__(self, budget: int) -> None:
+        """
+        Claim a `sys.monitoring` tool id and start listening for instructions.
+
+        Args:
+            budget: Number of instructions a turn may execute.
+
+        Raises:
+            RuntimeError: If every tool id aegis can use is taken.
+
+        """
+        self.budget: int = budget
+        self.count: int = 0
+        self._watched: list[CodeType] = []
+
+        self._tool: int = claim_tool_id("aegis meter")
+        _ = _monitoring.register_callback(
+            self._tool, _INSTRUCTION, self._on_instruction
+        )
+
+    def watch(self, code: Sandbox) -> None:
+        """Count the instructions of every module, function and class in `code`."""
+        for code_object in code_objects(code):
+            _monitoring.set_local_events(self._tool, code_object, _INSTRUCTION)
+            self._watched.append(code_object)
+
+    def start(self) -> None:
+        """Start counting a new turn."""
+        self.count = 0
+
+    def stop(self) -> int:
+        """Return the number of instructions the turn executed."""
+        return min(self.count, self.budget)
+
+    def _on_instruction(self, _code: CodeType, _offset: int) -> None:
+        self.count += 1
+        if self.count > self.budget:
+            raise InstructionBudgetExceededError
+
+    def close(self) -> None:
+        """Stop watching agent code and give the tool id back."""
+        for code_object in self._watched:
+            _monitoring.set_local_events(self._tool, code_object, 0)
+        self._watched.clear()
+        _ = _monitoring.register_callback(self._tool, _INSTRUCTION, None)
+        _monitoring.free_tool_id(self._tool)
+
+
+def claim_tool_id(name: str) -> int:
+    """
+    Claim a free `sys.monitoring` tool id.
+
+    Args:
+        name: Name the tool id is registered under.
+
+    Returns:
+        The claimed tool id, to be given back with `sys.monitoring.free_tool_id`.
+
+    Raises:
+        RuntimeError: If every tool id aegis can use is taken.
+
+    """
+    for tool in _TOOL_IDS:
+        if _monitoring.get_tool(tool) is None:
+            _monitoring.use_tool_id(tool, name)
+            return tool
+    error = f"No sys.monitoring tool id is free for the {name}"
+    raise RuntimeError(error)
+
+
+def code_objects(code: Sandbox) -> Iterator[CodeType]:
+    """Yield every module, function and class body code object of a sandbox."""
+    for module in code.code.values():
+        yield from _nested(module)
+
+
+def _nested(code: CodeType) -> Iterator[CodeType]:
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _nested(const)
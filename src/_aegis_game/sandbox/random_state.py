@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class RandomState:
+    """
+    The `random` stream of one agent.
+
+    Agents import the process-wide `random` module, so in worker processes the
+    stream one agent sees would depend on which other agents share its worker. Each
+    agent playing in a worker gets its own stream seeded from the world's seed and
+    the agent's id instead, which is swapped in for the agent's turns only. Agents
+    playing in the game process keep drawing from the stream the game seeds, so
+    games without workers replay the way they always have.
+    """
+
+    def __init__(self, seed: int, agent_id: int) -> None:
+        """
+        Initialize the stream of an agent that hasn't drawn anything yet.
+
+        Args:
+            seed: The seed of the world.
+            agent_id: The id of the agent.
+
+        """
+        self._state: tuple[object, ...] = random.Random(f"{seed}:{agent_id}").getstate()
+
+    @contextmanager
+    def swapped_in(self) -> Iterator[None]:
+        """Make `random` draw from the agent's stream until the block exits."""
+        outer = random.getstate()
+        random.setstate(self._state)
+        try:
+            yield
+        finally:
+            self._state = random.getstate()
+            random.setstate(outer)
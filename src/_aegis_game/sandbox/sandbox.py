@@ -17,6 +17,8 @@ if TYPE_CHECKING:
     from pathlib import Path
     from types import CodeType
 
+    from .compile_cache import CompileCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,12 +34,16 @@ class Sandbox:
         self.code: dict[str, CodeType] = code.copy()
 
     @classmethod
-    def from_directory_dict(cls, files: dict[str, str]) -> Sandbox:
+    def from_directory_dict(
+        cls, files: dict[str, str], cache: CompileCache | None = None
+    ) -> Sandbox:
         """
         Create CodeSandbox from a dictionary of filename -> source code mappings.
 
         Args:
             files: Dictionary mapping filenames to their source code content.
+            cache: Cache of previously compiled files. If None, every file is
+                compiled.
 
         Returns:
             A new CodeSandbox instance with compiled modules.
@@ -56,6 +62,12 @@ class Sandbox:
             module_name = filename.removesuffix(".py")
             cleaned_source = cls._strip_stub_import(source)
 
+            key = cache.key(filename, cleaned_source) if cache is not None else ""
+            cached = cache.load(key) if cache is not None else None
+            if cached is not None:
+                code[module_name] = cached
+                continue
+
             try:
                 compiled = cast(
                     "CodeType",
@@ -70,17 +82,23 @@ class Sandbox:
                 error = f"Failed to compile {filename}: {e}"
                 raise CompilationError(error) from e
 
+            if cache is not None:
+                cache.store(key, compiled)
             code[module_name] = compiled
 
         return cls(code)
 
     @classmethod
-    def from_directory(cls, directory_path: Path) -> Sandbox:
+    def from_directory(
+        cls, directory_path: Path, cache: CompileCache | None = None
+    ) -> Sandbox:
         """
         Create CodeSandbox from a directory containing Python files.
 
         Args:
             directory_path: Path to directory containing Python files.
+            cache: Cache of previously compiled files. If None, every file is
+                compiled.
 
         Returns:
             A new CodeSandbox instance with compiled modules from the directory.
@@ -111,7 +129,7 @@ class Sandbox:
             if not files:
                 LOGGER.warning(f"No readable Python files found in {directory_path}")
 
-            return cls.from_directory_dict(files)
+            return cls.from_directory_dict(files, cache)
 
         except OSError as e:
             error = f"Failed to access directory {directory_path}: {e}"
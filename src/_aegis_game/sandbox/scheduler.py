@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from queue import SimpleQueue
+from typing import TYPE_CHECKING
+
+from .lazy_import import SETUP_CLOCK
+from .watchdog import TurnDeadlineExceededError, TurnStopper
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .sandbox import Sandbox
+
+# Turns are played one at a time, so one thread is enough to hand them off to
+DEFAULT_TURN_THREADS = 1
+# Seconds a stopped turn gets to unwind before its thread is abandoned
+STOP_GRACE_PERIOD = 0.1
+
+
+@dataclass
+class _Job:
+    turn: Callable[[], None]
+    started: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+    thread_id: int = 0
+    finished: bool = False
+    abandoned: bool = False
+    error: BaseException | None = None
+
+
+class TurnScheduler:
+    """
+    Plays agent turns on a small fixed pool of threads shared by every agent.
+
+    A turn is handed off through a queue, so the number of threads and the cost of
+    starting a turn don't grow with the number of agents, and dropping an agent
+    doesn't have to join a thread of its own.
+
+    Turns that run past the deadline are stopped by a `TurnStopper` the next time
+    they execute agent code. A turn stuck outside agent code, in a C extension for
+    example, gets a short grace period and then its thread is abandoned and replaced,
+    so the game never waits on a turn for longer than the deadline. An abandoned
+    turn stays watched until its thread unwinds, if it ever gets back to agent code
+    it is stopped there. Time the turn spends importing lazily imported modules
+    doesn't count towards the deadline.
+    """
+
+    def __init__(
+        self, threads: int = DEFAULT_TURN_THREADS, deadline: float | None = None
+    ) -> None:
+        """
+        Start the pool.
+
+        Args:
+            threads: Number of threads turns are played on.
+            deadline: Seconds a turn may run before it is stopped. If None, turns
+                are waited for however long they take.
+
+        """
+        self.deadline: float | None = deadline
+        self._jobs: SimpleQueue[_Job | None] = SimpleQueue()
+        self._lock: threading.Lock = threading.Lock()
+        self._names: itertools.count[int] = itertools.count()
+        self._threads: int = 0
+        # claimed on the first overrun, most games never need one
+        self._stopper: TurnStopper | None = None
+        for _ in range(threads):
+            self._start_thread()
+
+    def run(self, turn: Callable[[], None], code: Sandbox | None = None) -> bool:
+        """
+        Play a turn on the pool and wait for it to finish or run out of time.
+
+        Args:
+            turn: The turn to play.
+            code: The agent code the turn runs, where an overrunning turn is
+                stopped. If None, an overrunning turn is only abandoned.
+
+        Returns:
+            False if the turn was stopped or abandoned at the deadline, else True.
+
+        """
+        job = _Job(turn)
+        self._jobs.put(job)
+        _ = job.started.wait()
+        if not self._wait(job):
+            with self._lock:
+                if not job.finished and code is not None:
+                    if self._stopper is None:
+                        self._stopper = TurnStopper()
+                    self._stopper.stop(code, job.thread_id)
+            if not job.done.wait(STOP_GRACE_PERIOD):
+                with self._lock:
+                    if not job.finished:
+                        job.abandoned = True
+                        self._threads -= 1
+                        self._start_thread()
+                        return False
+
+        if isinstance(job.error, TurnDeadlineExceededError):
+            return False
+        if job.error is not None:
+            raise job.error
+        return True
+
+    def _wait(self, job: _Job) -> bool:
+        # time spent importing lazily imported modules is setup, the deadline is
+        # pushed back by it
+        if self.deadline is None:
+            return job.done.wait()
+        setup_start = SETUP_CLOCK.seconds()
+        end = time.perf_counter() + self.deadline
+        while True:
+            left = end + SETUP_CLOCK.seconds() - setup_start - time.perf_counter()
+            if left <= 0:
+                return job.done.is_set()
+            if job.done.wait(left):
+                return True
+
+    def shutdown(self) -> None:
+        """Let the threads exit once they're idle, without waiting for them."""
+        with self._lock:
+            for _ in range(self._threads):
+                self._jobs.put(None)
+            self._threads = 0
+            if self._stopper is not None:
+                self._stopper.close()
+                self._stopper = None
+
+    def _start_thread(self) -> None:
+        # daemon threads, an abandoned turn must not keep the process alive
+        thread = threading.Thread(
+            target=self._work, name=f"lumen_{next(self._names)}", daemon=True
+        )
+        self._threads += 1
+        thread.start()
+
+    def _work(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            job.thread_id = threading.get_ident()
+            job.started.set()
+            try:
+                job.turn()
+            except BaseException as e:  # noqa: BLE001
+                job.error = e
+            with self._lock:
+                job.finished = True
+                if self._stopper is not None:
+                    self._stopper.release(job.thread_id)
+                abandoned = job.abandoned
+            job.done.set()
+            if abandoned:
+                return
@@ -3,23 +3,41 @@
 from ast import (
     AST,
     AnnAssign,
+    Attribute,
+    Call,
     ClassDef,
     Constant,
     Expr,
+    Load,
     Name,
     ParamSpec,
+    Slice,
+    Subscript,
+    Tuple,
     TypeAlias,
     TypeVar,
     TypeVarTuple,
+    UnaryOp,
+    copy_location,
+    expr,
     stmt,
 )
 from typing import override
 
 from RestrictedPython import RestrictingNodeTransformer
 
+# Bump whenever the transformer changes how code compiles, so cached code is redone
+POLICY_VERSION = 2
+
 
 class NodeTransformer(RestrictingNodeTransformer):
-    """Allow type annoation in RestrictedPython."""
+    """
+    Allow type annoation in RestrictedPython.
+
+    Attribute and item reads that can be proven safe at compile time are left as
+    plain operations instead of calls to `LumenCore.deny_private_attr` and
+    `LumenCore.deny_private_items`, only the dynamic ones keep the runtime guard.
+    """
 
     def doc_str(self, node: stmt) -> str | None:
         if (
@@ -62,9 +80,50 @@ class NodeTransformer(RestrictingNodeTransformer):
     def visit_ParamSpec(self, node: ParamSpec) -> AST:
         return self.node_contents_visit(node)
 
+    @override
+    def visit_Attribute(self, node: Attribute) -> AST:
+        # the base class rejects private names, so a public constant name has
+        # nothing left for the runtime guard to deny
+        guarded = super().visit_Attribute(node)
+        if not _is_guard_call(guarded, "_getattr_") or node.attr.startswith("_"):
+            return guarded
+        value, _ = guarded.args  # pyright: ignore[reportAttributeAccessIssue]
+        return copy_location(Attribute(value, node.attr, Load()), guarded)
+
+    @override
+    def visit_Subscript(self, node: Subscript) -> AST:
+        guarded = super().visit_Subscript(node)
+        if not _is_guard_call(guarded, "_getitem_"):
+            return guarded
+        value, key = guarded.args  # pyright: ignore[reportAttributeAccessIssue]
+        if not _is_public_key(key):
+            return guarded
+        return copy_location(Subscript(value, key, Load()), guarded)
+
     @override
     def visit_ClassDef(self, node: ClassDef) -> stmt:
         # find attribute docs in this class definition
         doc_strings = self.get_descriptions(node.body)
         self.used_names[node.name + ":doc_strings"] = doc_strings
         return super().visit_ClassDef(node)
+
+
+def _is_guard_call(node: AST, guard: str) -> bool:
+    return (
+        isinstance(node, Call)
+        and isinstance(node.func, Name)
+        and node.func.id == guard
+        and len(node.args) == 2  # noqa: PLR2004
+    )
+
+
+def _is_public_key(key: expr) -> bool:
+    """Whether a subscript key can never evaluate to a private string key."""
+    if isinstance(key, Constant):
+        return not (isinstance(key.value, str) and key.value.startswith("_"))
+    # slices, tuples and signed numbers are never strings
+    return isinstance(key, (Slice, Tuple)) or (
+        isinstance(key, UnaryOp)
+        and isinstance(key.operand, Constant)
+        and isinstance(key.operand.value, (int, float, complex))
+    )
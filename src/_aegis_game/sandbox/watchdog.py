@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+from .meter import claim_tool_id, code_objects
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+    from .sandbox import Sandbox
+
+_monitoring = sys.monitoring
+_INSTRUCTION = _monitoring.events.INSTRUCTION
+
+
+class TurnDeadlineExceededError(BaseException):
+    """
+    Raised in agent code once its turn has run past the deadline.
+
+    Derives from `BaseException` so `except Exception` in agent code can't catch it.
+    """
+
+
+class TurnStopper:
+    """
+    Stops a turn that overran its deadline from inside the agent's own code.
+
+    Stopping a thread from the outside could interrupt it halfway through a game
+    method. Instead, instruction events are turned on for the overrunning agent's
+    code only, and the next instruction it executes on the stopped thread raises
+    `TurnDeadlineExceededError`. Engine code is never interrupted, and agents
+    sharing the same code on other threads keep running.
+    """
+
+    def __init__(self) -> None:
+        """Claim a `sys.monitoring` tool id, no events are enabled until a stop."""
+        self._tool: int = claim_tool_id("aegis watchdog")
+        # thread id -> code objects watched for that thread
+        self._stopping: dict[int, list[CodeType]] = {}
+        _ = _monitoring.register_callback(
+            self._tool, _INSTRUCTION, self._on_instruction
+        )
+
+    def stop(self, code: Sandbox, thread_id: int) -> None:
+        """Stop the turn running `code` on `thread_id` at its next instruction."""
+        watched = list(code_objects(code))
+        self._stopping[thread_id] = watched
+        for code_object in watched:
+            _monitoring.set_local_events(self._tool, code_object, _INSTRUCTION)
+
+    def release(self, thread_id: int) -> None:
+        """Stop watching for a thread whose stopped turn has ended."""
+        watched = self._stopping.pop(thread_id, None)
+        if watched is None:
+            return
+        still_watched = {id(c) for codes in self._stopping.values() for c in codes}
+        for code_object in watched:
+            if id(code_object) not in still_watched:
+                _monitoring.set_local_events(self._tool, code_object, 0)
+
+    def _on_instruction(self, _code: CodeType, _offset: int) -> None:
+        if threading.get_ident() in self._stopping:
+            raise TurnDeadlineExceededError
+
+    def close(self) -> None:
+        """Stop watching every thread and give the tool id back."""
+        for thread_id in list(self._stopping):
+            self.release(thread_id)
+        _ = _monitoring.register_callback(self._tool, _INSTRUCTION, None)
+        _monitoring.free_tool_id(self._tool)
@@ -40,6 +40,18 @@ class SurvivorHealthUpdate(_message.Message):
     new_state: _world_object_pb2.SurvivorState
     def __init__(self, location: _Optional[_Union[_location_pb2.Location, _Mapping]] = ..., survivor_id: _Optional[int] = ..., new_health: _Optional[int] = ..., new_state: _Optional[_Union[_world_object_pb2.SurvivorState, str]] = ...) -> None: ...
 
+class SurvivorHealthBatch(_message.Message):
+    __slots__ = ("survivor_ids", "xs", "ys", "new_health")
+    SURVIVOR_IDS_FIELD_NUMBER: _ClassVar[int]
+    XS_FIELD_NUMBER: _ClassVar[int]
+    YS_FIELD_NUMBER: _ClassVar[int]
+    NEW_HEALTH_FIELD_NUMBER: _ClassVar[int]
+    survivor_ids: _containers.RepeatedScalarFieldContainer[int]
+    xs: _containers.RepeatedScalarFieldContainer[int]
+    ys: _containers.RepeatedScalarFieldContainer[int]
+    new_health: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, survivor_ids: _Optional[_Iterable[int]] = ..., xs: _Optional[_Iterable[int]] = ..., ys: _Optional[_Iterable[int]] = ..., new_health: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class GamesHeader(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
@@ -55,7 +67,7 @@ class GameHeader(_message.Message):
     def __init__(self, world: _Optional[_Union[_world_pb2.World, _Mapping]] = ..., rounds: _Optional[int] = ..., spawns: _Optional[_Iterable[_Union[_spawn_pb2.Spawn, _Mapping]]] = ...) -> None: ...
 
 class Round(_message.Message):
-    __slots__ = ("round", "layers_removed", "dead_ids", "turns", "team_info", "drone_scans", "survivor_health_updates")
+    __slots__ = ("round", "layers_removed", "dead_ids", "turns", "team_info", "drone_scans", "survivor_health_updates", "survivor_health")
     ROUND_FIELD_NUMBER: _ClassVar[int]
     LAYERS_REMOVED_FIELD_NUMBER: _ClassVar[int]
     DEAD_IDS_FIELD_NUMBER: _ClassVar[int]
@@ -63,6 +75,7 @@ class Round(_message.Message):
     TEAM_INFO_FIELD_NUMBER: _ClassVar[int]
     DRONE_SCANS_FIELD_NUMBER: _ClassVar[int]
     SURVIVOR_HEALTH_UPDATES_FIELD_NUMBER: _ClassVar[int]
+    SURVIVOR_HEALTH_FIELD_NUMBER: _ClassVar[int]
     round: int
     layers_removed: _containers.RepeatedCompositeFieldContainer[_location_pb2.Location]
     dead_ids: _containers.RepeatedScalarFieldContainer[int]
@@ -70,7 +83,8 @@ class Round(_message.Message):
     team_info: _containers.RepeatedCompositeFieldContainer[_team_pb2.TeamInfo]
     drone_scans: _containers.RepeatedCompositeFieldContainer[DroneScan]
     survivor_health_updates: _containers.RepeatedCompositeFieldContainer[SurvivorHealthUpdate]
-    def __init__(self, round: _Optional[int] = ..., layers_removed: _Optional[_Iterable[_Union[_location_pb2.Location, _Mapping]]] = ..., dead_ids: _Optional[_Iterable[int]] = ..., turns: _Optional[_Iterable[_Union[_turn_pb2.Turn, _Mapping]]] = ..., team_info: _Optional[_Iterable[_Union[_team_pb2.TeamInfo, _Mapping]]] = ..., drone_scans: _Optional[_Iterable[_Union[DroneScan, _Mapping]]] = ..., survivor_health_updates: _Optional[_Iterable[_Union[SurvivorHealthUpdate, _Mapping]]] = ...) -> None: ...
+    survivor_health: SurvivorHealthBatch
+    def __init__(self, round: _Optional[int] = ..., layers_removed: _Optional[_Iterable[_Union[_location_pb2.Location, _Mapping]]] = ..., dead_ids: _Optional[_Iterable[int]] = ..., turns: _Optional[_Iterable[_Union[_turn_pb2.Turn, _Mapping]]] = ..., team_info: _Optional[_Iterable[_Union[_team_pb2.TeamInfo, _Mapping]]] = ..., drone_scans: _Optional[_Iterable[_Union[DroneScan, _Mapping]]] = ..., survivor_health_updates: _Optional[_Iterable[_Union[SurvivorHealthUpdate, _Mapping]]] = ..., survivor_health: _Optional[_Union[SurvivorHealthBatch, _Mapping]] = ...) -> None: ...
 
 class GameFooter(_message.Message):
     __slots__ = ()
@@ -0,0 +1,67 @@
+import numpy as np
+from numpy.typing import NDArray
+
+from .common import Cell
+from .common.objects import Survivor
+
+
+class SurvivorRegistry:
+    """Keeps every survivor still in the world in flat arrays for whole-world updates."""
+
+    def __init__(self, cells: list[Cell]) -> None:
+        """
+        Register every survivor found in the given cells.
+
+        Args:
+            cells: The world cells, indexed by `x + y * width`.
+
+        """
+        self.survivors: list[Survivor] = []
+        cell_indices: list[int] = []
+        for index, cell in enumerate(cells):
+            for layer in cell.layers:
+                if isinstance(layer, Survivor):
+                    self.survivors.append(layer)
+                    cell_indices.append(index)
+
+        count = len(self.survivors)
+        self.ids: NDArray[np.int32] = np.array(
+            [survivor.id for survivor in self.survivors], dtype=np.int32
+        )
+        self.cell_indices: NDArray[np.int32] = np.array(cell_indices, dtype=np.int32)
+        self.health: NDArray[np.int32] = np.array(
+            [survivor.health for survivor in self.survivors], dtype=np.int32
+        )
+        # False once the survivor has been removed from the world
+        self.active: NDArray[np.bool_] = np.ones(count, dtype=np.bool_)
+        self._slots: dict[int, int] = {
+            id(survivor): slot for slot, survivor in enumerate(self.survivors)
+        }
+
+    def remove(self, survivor: Survivor) -> None:
+        """Stop tracking a survivor that left the world."""
+        slot = self._slots.pop(id(survivor), None)
+        if slot is not None:
+            self.active[slot] = False
+
+    def decay(self, amount: int) -> NDArray[np.intp]:
+        """
+        Lower the health of every living survivor, clamping at zero.
+
+        Args:
+            amount: The health each living survivor loses.
+
+        Returns:
+            The slots of the survivors whose health changed.
+
+        """
+        living = self.active & (self.health > 0)
+        decayed = np.maximum(self.health - amount, 0)
+        changed = np.flatnonzero(living & (decayed != self.health))
+        self.health[changed] = decayed[changed]
+
+        # Keep the objects handed to agents in sync
+        for slot in changed.tolist():
+            self.survivors[slot].health = int(self.health[slot])
+
+        return changed
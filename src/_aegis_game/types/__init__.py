@@ -1,3 +1,17 @@
-__all__ = ["AegisConfig", "CellType", "FeatureKey", "GameOverReason", "MethodDict"]
+__all__ = [
+    "AegisConfig",
+    "CellType",
+    "FeatureKey",
+    "GameOverReason",
+    "LayerKind",
+    "MethodDict",
+]
 
-from .others import AegisConfig, CellType, FeatureKey, GameOverReason, MethodDict
+from .others import (
+    AegisConfig,
+    CellType,
+    FeatureKey,
+    GameOverReason,
+    LayerKind,
+    MethodDict,
+)
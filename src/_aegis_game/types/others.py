@@ -21,6 +21,14 @@ class CellType(Enum):
         return self.__str__()
 
 
+class LayerKind(Enum):
+    """Enum representing the kind of world object on top of a cell."""
+
+    NONE = 0
+    SURVIVOR = 1
+    RUBBLE = 2
+
+
 class GameOverReason(Enum):
     ALL_AGENTS_DEAD = "All team agents are dead"
     ALL_SURVIVORS_SAVED = "All survivors have been rescued"
@@ -33,13 +41,18 @@ FeatureKey = Literal[
     "ALLOW_DRONE_SCAN",
     "ALLOW_AGENT_TYPES",
     "HIDDEN_MOVE_COSTS",
+    "SHARE_VISITED_CELLS",
     "ALLOW_CUSTOM_AGENT_COUNT",
     "DEFAULT_AGENT_AMOUNT",
     "SURV_HEALTH_DECAY_RATE",
     "ADVANCED_SCORING_SYSTEM",
+    "ALLOW_PATHFINDING",
+    "ALLOW_TEAM_KNOWLEDGE",
 ]
 
-CompetitionSettingKey = Literal["VERSUS_MODE",]
+CompetitionSettingKey = Literal[
+    "VERSUS_MODE", "TURN_INSTRUCTION_BUDGET", "AGENT_MEMORY_QUOTA_MB"
+]
 
 ConfigType = Literal["assignment", "competition"]
 
@@ -50,14 +63,19 @@ class FeaturesConfig(TypedDict):
     ALLOW_DRONE_SCAN: bool
     ALLOW_AGENT_TYPES: bool
     HIDDEN_MOVE_COSTS: bool
+    SHARE_VISITED_CELLS: bool
     ALLOW_CUSTOM_AGENT_COUNT: bool
     DEFAULT_AGENT_AMOUNT: int
     SURV_HEALTH_DECAY_RATE: int
     ADVANCED_SCORING_SYSTEM: bool
+    ALLOW_PATHFINDING: bool
+    ALLOW_TEAM_KNOWLEDGE: bool
 
 
 class CompetitionConfig(TypedDict):
     VERSUS_MODE: bool
+    TURN_INSTRUCTION_BUDGET: int
+    AGENT_MEMORY_QUOTA_MB: int
 
 
 class ClientConfig(TypedDict):
@@ -1,5 +1,13 @@
+from collections.abc import Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+
 from .common import Cell, Location
+from .common.objects import Rubble, Survivor
 from .constants import Constants
+from .survivor_registry import SurvivorRegistry
+from .types import CellType, LayerKind
 
 
 class World:
@@ -18,8 +26,42 @@ class World:
         self.seed: int = seed
         self.start_energy: int = start_energy
         self.cells: list[Cell] = cells
-        self.total_survivors: int = sum(cell.number_of_survivors() for cell in cells)
         self.init_spawns: dict[Location, int] = init_spawns
+        # key is cell index, value is the copy-on-write version of that cell for next round
+        self._staged_cells: dict[int, Cell] = {}
+
+        # Structure-of-arrays view of the committed cells, indexed by `x + y * width`
+        size = len(cells)
+        self.cell_types: NDArray[np.int8] = np.zeros(size, dtype=np.int8)
+        self.move_costs: NDArray[np.int32] = np.zeros(size, dtype=np.int32)
+        self.top_layer_kinds: NDArray[np.int8] = np.zeros(size, dtype=np.int8)
+        self.layer_counts: NDArray[np.int32] = np.zeros(size, dtype=np.int32)
+        self.survivor_counts: NDArray[np.int32] = np.zeros(size, dtype=np.int32)
+        self.top_survivor_health: NDArray[np.int32] = np.zeros(size, dtype=np.int32)
+        self.top_rubble_energy: NDArray[np.int32] = np.zeros(size, dtype=np.int32)
+        self.top_rubble_agents: NDArray[np.int32] = np.zeros(size, dtype=np.int32)
+
+        # Location indexes, kept up to date as layers are removed
+        self._survivor_cells: set[int] = set()
+        self._survivor_locations: tuple[Location, ...] | None = None
+        Location.intern(width, height)
+        for index, cell in enumerate(cells):
+            cell.location = Location(cell.location.x, cell.location.y)
+            self.cell_types[index] = cell.type.value
+            self.move_costs[index] = cell.move_cost
+            self.update_cell(index)
+
+        # Cell types never change, so these are computed once
+        self._charging_locations: tuple[Location, ...] = self._locations_at(
+            self.indices_of_type(CellType.CHARGING_CELL)
+        )
+        self._spawn_locations: tuple[Location, ...] = self._locations_at(
+            self.indices_of_type(CellType.SPAWN_CELL)
+        )
+        self._spawn_location_set: frozenset[Location] = frozenset(self._spawn_locations)
+
+        self.survivors: SurvivorRegistry = SurvivorRegistry(cells)
+        self.total_survivors: int = int(self.survivor_counts.sum())
 
         self._validate_map()
 
@@ -43,10 +85,104 @@ class World:
             error = f"World height must not exceed {max_size}"
             raise ValueError(error)
 
-    def _copy(self):
-        world = World(self.width, self.height, self.seed, self.start_energy, [], self.init_spawns)
-        world.rounds = self.rounds
-        for cell in self.cells:
-            world.cells.append(cell._copy())
-        world.total_survivors = self.total_survivors
-        return world
\ No newline at end of file
+    def update_cell(self, index: int) -> None:
+        """
+        Refresh the array entries of the cell at `index` from its layers.
+
+        Must be called whenever the layers of a committed cell change.
+
+        Args:
+            index: The cell index (`x + y * width`).
+
+        """
+        layers = self.cells[index].layers
+        top = layers.top
+        self.layer_counts[index] = len(layers)
+        survivors = layers.survivor_count
+        self.survivor_counts[index] = survivors
+        if (index in self._survivor_cells) != (survivors > 0):
+            if survivors > 0:
+                self._survivor_cells.add(index)
+            else:
+                self._survivor_cells.discard(index)
+            self._survivor_locations = None
+        self.top_survivor_health[index] = 0
+        self.top_rubble_energy[index] = 0
+        self.top_rubble_agents[index] = 0
+        if isinstance(top, Survivor):
+            self.top_layer_kinds[index] = LayerKind.SURVIVOR.value
+            self.top_survivor_health[index] = top.health
+        elif isinstance(top, Rubble):
+            self.top_layer_kinds[index] = LayerKind.RUBBLE.value
+            self.top_rubble_energy[index] = top.energy_required
+            self.top_rubble_agents[index] = top.agents_required
+        else:
+            self.top_layer_kinds[index] = LayerKind.NONE.value
+
+    def remove_top_layer(self, index: int) -> None:
+        """
+        Remove the top layer of the committed cell at `index`.
+
+        Args:
+            index: The cell index (`x + y * width`).
+
+        """
+        layer = self.cells[index].remove_top_layer()
+        if isinstance(layer, Survivor):
+            self.survivors.remove(layer)
+        self.update_cell(index)
+
+    def indices_of_type(self, cell_type: CellType) -> NDArray[np.intp]:
+        """Return the indices of every cell of the given type."""
+        return np.flatnonzero(self.cell_types == cell_type.value)
+
+    def survivor_locations(self) -> tuple[Location, ...]:
+        """Return the locations of every cell holding at least one survivor."""
+        if self._survivor_locations is None:
+            self._survivor_locations = self._locations_at(sorted(self._survivor_cells))
+        return self._survivor_locations
+
+    def charging_locations(self) -> tuple[Location, ...]:
+        """Return the locations of every charging cell."""
+        return self._charging_locations
+
+    def spawn_locations(self) -> tuple[Location, ...]:
+        """Return the locations of every spawn cell."""
+        return self._spawn_locations
+
+    def is_spawn_location(self, loc: Location) -> bool:
+        """Check whether `loc` is a spawn cell."""
+        return loc in self._spawn_location_set
+
+    def _locations_at(self, indices: Iterable[int]) -> tuple[Location, ...]:
+        return tuple(self.cells[index].location for index in indices)
+
+    def get_cell(self, index: int) -> Cell:
+        """Return the committed cell at `index`, as seen during the current round."""
+        return self.cells[index]
+
+    def get_staged_cell(self, index: int) -> Cell:
+        """
+        Return the next-round version of the cell at `index`.
+
+        The cell is materialized on first access and reused until `commit` is called,
+        so only cells that are actually written to during a round are copied.
+
+        Args:
+            index: The cell index (`x + y * width`).
+
+        Returns:
+            The writable next-round cell.
+
+        """
+        cell = self._staged_cells.get(index)
+        if cell is None:
+            cell = self.cells[index].staged_copy()
+            self._staged_cells[index] = cell
+        return cell
+
+    def commit(self) -> None:
+        """Swap every staged cell into the committed world."""
+        for index, cell in self._staged_cells.items():
+            self.cells[index] = cell
+        self._staged_cells.clear()
@@ -2,7 +2,13 @@
 
 from _aegis_game.agent_type import AgentType
 from _aegis_game.cli import main
-from _aegis_game.common import CellInfo, Direction, Location
+from _aegis_game.common import (
+    CellInfo,
+    Direction,
+    Location,
+    RegionInfo,
+    TeamKnowledge,
+)
 from _aegis_game.common.objects import Rubble, Survivor
 from _aegis_game.message import Message
 from _aegis_game.team import Team
@@ -13,8 +19,10 @@ __all__ = [
     "Direction",
     "Location",
     "Message",
+    "RegionInfo",
     "Rubble",
     "Survivor",
     "Team",
+    "TeamKnowledge",
     "main",
 ]
@@ -13,9 +13,11 @@ from . import (
     CellInfo,
     Direction,
     Location,
+    RegionInfo,
     Rubble,
     Survivor,
     Team,
+    TeamKnowledge,
 )
 
 
@@ -36,7 +38,12 @@ def get_team() -> Team:
 
 
 def get_location() -> Location:
-    """Return the current location of the agent."""
+    """
+    Return the current location of the agent.
+
+    Locations are immutable, use `loc.add(direction)` or `Location(x, y)`
+    instead of assigning to `loc.x` or `loc.y`.
+    """
 
 
 def get_energy_level() -> int:
@@ -122,6 +129,83 @@ def get_cell_info_at(loc: Location) -> CellInfo:
     """
 
 
+def get_region_info(
+    min_loc: Location | None = None, max_loc: Location | None = None
+) -> RegionInfo:
+    """
+    Return the cell info of a rectangle of cells at once, as arrays.
+
+    The same visibility rules as `get_cell_info_at` apply to every cell, so one
+    call tells what calling it on each cell would. Without corners, the region
+    is the agent's location and the cells around it.
+
+    Args:
+        min_loc: The corner of the region with the lowest x and y.
+        max_loc: The corner of the region with the highest x and y.
+
+    Returns:
+        A RegionInfo object following visibility rules.
+
+    Raises:
+        AgentError: If a corner isn't on the map, or `min_loc` has a higher x
+            or y than `max_loc`.
+
+    """
+
+
+def get_team_knowledge() -> TeamKnowledge:
+    """
+    Return what the agent's team has learned about the world so far.
+
+    The arrays are read-only and updated by the game at the start of every
+    round, so the same object can be kept instead of calling this every turn.
+
+    Returns:
+        A TeamKnowledge object shared by the agent's team.
+
+    Raises:
+        AgentError: If team knowledge is not enabled.
+
+    """
+
+
+def get_path_to(loc: Location) -> list[Direction] | None:
+    """
+    Return a cheapest path from the agent's location to a given location.
+
+    The path costs the least energy according to the move costs the agent
+    knows of, the ones `get_cell_info_at` returns, and avoids killer cells.
+
+    Args:
+        loc: The location to go to.
+
+    Returns:
+        The directions to move in, in order, empty if the agent is already
+        at `loc`, or None if `loc` can't be reached.
+
+    Raises:
+        AgentError: If pathfinding is not enabled or the location is invalid.
+
+    """
+
+
+def get_direction_to(loc: Location) -> Direction:
+    """
+    Return the first direction of a cheapest path to a given location.
+
+    Args:
+        loc: The location to go to.
+
+    Returns:
+        The direction to move in, `Direction.CENTER` if the agent is already
+        at `loc` or `loc` can't be reached.
+
+    Raises:
+        AgentError: If pathfinding is not enabled or the location is invalid.
+
+    """
+
+
 def log(*args: object) -> None:
     """
     Log a message.
@@ -145,9 +229,9 @@ def on_map(loc: Location) -> bool:
     """
 
 
-def get_survs() -> list[Location]:
-    """Return a list of survivor locations."""
+def get_survs() -> tuple[Location, ...]:
+    """Return a tuple of survivor locations."""
 
 
-def get_charging_cells() -> list[Location]:
-    """Return a list of charging locations."""
+def get_charging_cells() -> tuple[Location, ...]:
+    """Return a tuple of charging locations."""
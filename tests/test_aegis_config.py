@@ -0,0 +1,90 @@
+"""Tests for resolving per-game features."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from _aegis_game import aegis_config
+from _aegis_game.aegis_config import Features, load_features
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _aegis_game.types import AegisConfig
+
+
+class TestFeatures:
+    """Tests for the Features class."""
+
+    def test_from_config_reads_both_sections(self) -> None:
+        """Test that features are read from features and competition_specific."""
+        config = cast(
+            "AegisConfig",
+            {
+                "features": {
+                    "ALLOW_DRONE_SCAN": True,
+                    "SURV_HEALTH_DECAY_RATE": 2,
+                    "DEFAULT_AGENT_AMOUNT": 7,
+                },
+                "competition_specific": {
+                    "VERSUS_MODE": True,
+                    "TURN_INSTRUCTION_BUDGET": 1000,
+                    "AGENT_MEMORY_QUOTA_MB": 256,
+                },
+            },
+        )
+        features = Features.from_config(config)
+        assert features.allow_drone_scan
+        assert not features.allow_agent_messages
+        assert features.surv_health_decay_rate == 2  # noqa: PLR2004
+        assert features.default_agent_amount == 7  # noqa: PLR2004
+        assert features.versus_mode
+        assert features.turn_instruction_budget == 1000  # noqa: PLR2004
+        assert features.agent_memory_quota_mb == 256  # noqa: PLR2004
+
+    def test_falsy_feature_does_not_fall_through(self) -> None:
+        """Test that a feature turned off in features isn't read elsewhere."""
+        config = cast(
+            "AegisConfig",
+            {
+                "features": {"ALLOW_DRONE_SCAN": False, "DEFAULT_AGENT_AMOUNT": 0},
+                "competition_specific": {
+                    "ALLOW_DRONE_SCAN": True,
+                    "DEFAULT_AGENT_AMOUNT": 5,
+                },
+            },
+        )
+        features = Features.from_config(config)
+        assert not features.allow_drone_scan
+        assert features.default_agent_amount == 0
+
+    def test_agent_amount_follows_the_count_rules(self) -> None:
+        """Test that a custom agent count is only used if the config allows it."""
+        assert Features().agent_amount(None) == 1
+        assert Features().agent_amount(4) == 4  # noqa: PLR2004
+        fixed = Features(default_agent_amount=3)
+        assert fixed.agent_amount(None) == 3  # noqa: PLR2004
+        assert fixed.agent_amount(5) == 3  # noqa: PLR2004
+        custom = Features(default_agent_amount=3, allow_custom_agent_count=True)
+        assert custom.agent_amount(None) == 3  # noqa: PLR2004
+        assert custom.agent_amount(5) == 5  # noqa: PLR2004
+
+    def test_features_are_frozen(self) -> None:
+        """Test that a game's features cannot be changed once resolved."""
+        features = Features()
+        with pytest.raises(AttributeError):
+            features.allow_drone_scan = True  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_load_preset(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a preset is loaded from the presets folder."""
+        _ = (tmp_path / "fast.yaml").write_text(
+            "features:\n  HIDDEN_MOVE_COSTS: true\n"
+        )
+        monkeypatch.setattr(aegis_config, "PRESETS_PATH", tmp_path)
+        load_features.cache_clear()
+
+        assert load_features("fast").hidden_move_costs
+        with pytest.raises(FileNotFoundError):
+            _ = load_features("missing")
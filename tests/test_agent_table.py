@@ -0,0 +1,36 @@
+"""Tests for the AgentTable class."""
+
+from __future__ import annotations
+
+from _aegis_game.agent_table import AgentTable
+from _aegis_game.common.location import Location
+
+
+class TestAgentTable:
+    """Tests for slot allocation and the vectorized per-round passes."""
+
+    def test_slots_follow_spawn_order_and_grow(self) -> None:
+        """Test that slots are handed out in order past the initial capacity."""
+        table = AgentTable(capacity=1)
+        slots = [table.add(i, Location(i, 0), 100, 10) for i in range(5)]
+        assert slots == [0, 1, 2, 3, 4]
+        assert table.ids[:5].tolist() == [0, 1, 2, 3, 4]
+        assert table.x[:5].tolist() == [0, 1, 2, 3, 4]
+
+    def test_removed_agents_are_skipped(self) -> None:
+        """Test that dead agents are left out of the living slots."""
+        table = AgentTable()
+        for i in range(3):
+            _ = table.add(i, Location(0, 0), 100, 10)
+        table.remove(1)
+        assert table.alive_slots().tolist() == [0, 2]
+
+    def test_tick_cooldowns_clamps_at_zero(self) -> None:
+        """Test that cooldowns of living agents drop and never go negative."""
+        table = AgentTable()
+        _ = table.add(1, Location(0, 0), 100, 15)
+        _ = table.add(2, Location(0, 0), 100, 5)
+        _ = table.add(3, Location(0, 0), 100, 15)
+        table.remove(2)
+        table.tick_cooldowns(10)
+        assert table.cooldown[:3].tolist() == [5, 0, 15]
@@ -0,0 +1,70 @@
+"""Tests for the on-disk cache of compiled agent code."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from _aegis_game.sandbox import sandbox as sandbox_module
+from _aegis_game.sandbox.compile_cache import CompileCache
+from _aegis_game.sandbox.sandbox import Sandbox
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+AGENT = """
+from aegis_game.stub import *
+
+
+def think() -> None:
+    record(sum(range(10)))
+"""
+
+
+def run(code: Sandbox) -> list[int]:
+    """Run the agent's main module and think once, returning what it recorded."""
+    seen: list[int] = []
+    namespace: dict[str, object] = {"record": seen.append}
+    exec(code["main"], namespace)  # noqa: S102
+    namespace["think"]()  # pyright: ignore[reportOperatorIssue]
+    return seen
+
+
+def test_unchanged_agent_skips_compile(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a second launch loads the compiled code instead of compiling."""
+    cache = CompileCache(tmp_path)
+    first = Sandbox.from_directory_dict({"main.py": AGENT}, cache)
+
+    def fail(*_: object, **__: object) -> None:
+        pytest.fail("cached code was compiled again")
+
+    monkeypatch.setattr(sandbox_module, "compile_restricted", fail)
+    second = Sandbox.from_directory_dict({"main.py": AGENT}, cache)
+
+    assert run(second) == run(first) == [45]
+
+
+def test_changed_source_misses_cache(tmp_path: Path) -> None:
+    """Test that editing an agent compiles it again."""
+    cache = CompileCache(tmp_path)
+    _ = Sandbox.from_directory_dict({"main.py": AGENT}, cache)
+    changed = Sandbox.from_directory_dict({"main.py": AGENT.replace("10", "5")}, cache)
+
+    assert run(changed) == [10]
+    assert len(list(tmp_path.iterdir())) == 2  # noqa: PLR2004
+
+
+def test_corrupt_entry_is_compiled_again(tmp_path: Path) -> None:
+    """Test that an unreadable entry is ignored and replaced."""
+    cache = CompileCache(tmp_path)
+    _ = Sandbox.from_directory_dict({"main.py": AGENT}, cache)
+    (entry,) = tmp_path.iterdir()
+    _ = entry.write_bytes(b"not marshal data")
+
+    code = Sandbox.from_directory_dict({"main.py": AGENT}, cache)
+
+    assert run(code) == [45]
+    assert cache.load(entry.name) is not None
@@ -5,6 +5,11 @@ from __future__ import annotations
 import pytest
 
 from src._aegis_game.common import Direction
+from src._aegis_game.common.direction import (
+    DIRECTION_OFFSETS,
+    OFFSET_TO_DIRECTION,
+    dir_order,
+)
 
 
 class TestBasics:
@@ -170,3 +175,9 @@ class TestEdgeCases:
         assert len(directions) == dir_expected_length
         assert Direction.NORTH in directions
         assert Direction.CENTER in directions
+
+    def test_offset_tables(self) -> None:
+        """Test that the offset tables match each direction's dx and dy."""
+        for direction, offset in zip(dir_order, DIRECTION_OFFSETS, strict=True):
+            assert offset == (direction.dx, direction.dy)
+            assert OFFSET_TO_DIRECTION[offset] is direction
@@ -0,0 +1,36 @@
+"""Tests for building the events sent to the client."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from _aegis_game.game_pb import GamePb
+from _aegis_game.schemas.game_pb2 import Round
+
+
+def test_survivor_health_is_one_packed_batch() -> None:
+    """Test that a round's health updates are sent as packed columns."""
+    game_pb = GamePb()
+    game_pb.add_survivor_health_updates(
+        np.array([1, 2], dtype=np.int32),
+        np.array([0, 3], dtype=np.int32),
+        np.array([7, 9], dtype=np.int32),
+        np.array([4, 0], dtype=np.int32),
+    )
+    game_pb.add_survivor_health_updates(
+        np.array([5], dtype=np.int32),
+        np.array([5], dtype=np.int32),
+        np.array([11], dtype=np.int32),
+        np.array([2], dtype=np.int32),
+    )
+
+    pb_round = Round()
+    pb_round.survivor_health.CopyFrom(game_pb.survivor_health)
+    batch = Round.FromString(pb_round.SerializeToString()).survivor_health
+    assert list(batch.survivor_ids) == [7, 9, 11]
+    assert list(batch.xs) == [1, 2, 5]
+    assert list(batch.ys) == [0, 3, 5]
+    assert list(batch.new_health) == [4, 0, 2]
+
+    game_pb.clear_round()
+    assert not game_pb.survivor_health.survivor_ids
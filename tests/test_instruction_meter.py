@@ -0,0 +1,77 @@
+"""Tests for metering agent turns by instruction count."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from _aegis_game.sandbox.core import LumenCore
+from _aegis_game.sandbox.meter import InstructionMeter
+from _aegis_game.sandbox.sandbox import Sandbox
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+BUDGET = 5_000
+
+COUNTING_AGENT = """
+def think() -> None:
+    total = 0
+    for i in range(100):
+        total += i
+"""
+
+RUNAWAY_AGENT = """
+def think() -> None:
+    while True:
+        try:
+            while True:
+                pass
+        except:
+            pass
+"""
+
+
+@pytest.fixture
+def meter() -> Iterator[InstructionMeter]:
+    """Provide a meter that is closed after the test."""
+    meter = InstructionMeter(BUDGET)
+    yield meter
+    meter.close()
+
+
+def make_core(source: str, meter: InstructionMeter, errors: list[str]) -> LumenCore:
+    """Compile an agent and watch its code with the meter."""
+    code = Sandbox.from_directory_dict({"main.py": source})
+    meter.watch(code)
+    return LumenCore(code, {}, errors.append, meter=meter)
+
+
+def test_count_is_deterministic(meter: InstructionMeter) -> None:
+    """Test that the same turn always executes the same number of instructions."""
+    errors: list[str] = []
+    core = make_core(COUNTING_AGENT, meter, errors)
+    core.run()
+    core.run()
+    first = core.instructions
+    core.run()
+    assert errors == []
+    assert 0 < first < BUDGET
+    assert core.instructions == first
+
+
+def test_runaway_turn_is_stopped_at_budget(meter: InstructionMeter) -> None:
+    """Test that a turn that never returns is stopped, even through a bare except."""
+    errors: list[str] = []
+    core = make_core(RUNAWAY_AGENT, meter, errors)
+    core.run()
+    assert core.instructions == BUDGET
+    assert len(errors) == 1
+    assert "instructions" in errors[0]
+
+
+def test_close_frees_tool_id() -> None:
+    """Test that meters can be created again after being closed."""
+    for _ in range(3):
+        InstructionMeter(BUDGET).close()
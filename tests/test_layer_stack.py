@@ -0,0 +1,53 @@
+"""Tests for the LayerStack class."""
+
+from __future__ import annotations
+
+from _aegis_game.common import CellInfo, LayerStack, Location
+from _aegis_game.common.objects import Rubble, Survivor
+from _aegis_game.types import CellType
+
+
+class TestLayerStack:
+    """Tests for top-of-stack operations and cached counts."""
+
+    def test_layers_are_top_first(self) -> None:
+        """Test that the stack is built and iterated top first."""
+        survivor = Survivor(1, 10)
+        rubble = Rubble(2, 5, 1)
+        stack = LayerStack([survivor, rubble])
+        assert stack.top is survivor
+        assert list(stack) == [survivor, rubble]
+        assert stack.top_first() == [survivor, rubble]
+
+    def test_push_pop_and_counts(self) -> None:
+        """Test that pushing and popping the top keeps the counts in sync."""
+        stack = LayerStack([Rubble(1, 5, 1)])
+        stack.add_bottom(Survivor(2, 10))
+        top = Survivor(3, 10)
+        stack.push(top)
+        assert stack.survivor_count == 2  # noqa: PLR2004
+        assert stack.rubble_count == 1
+
+        assert stack.pop() is top
+        assert stack.survivor_count == 1
+        assert len(stack) == 2  # noqa: PLR2004
+
+
+class TestCellInfoLayers:
+    """Tests for the layers view handed to agents."""
+
+    def test_top_layer_without_copying(self) -> None:
+        """Test that the top layer is read straight from the stack."""
+        survivor = Survivor(1, 10)
+        stack = LayerStack([survivor, Rubble(2, 5, 1)])
+        info = CellInfo(stack, CellType.NORMAL_CELL, Location(0, 0), 1, [])
+        assert info.top_layer is survivor
+        assert info.layers == [survivor, stack.top_first()[1]]
+
+    def test_layers_list_does_not_change_the_cell(self) -> None:
+        """Test that editing the agent's list leaves the cell's stack alone."""
+        stack = LayerStack([Survivor(1, 10)])
+        info = CellInfo(stack, CellType.NORMAL_CELL, Location(0, 0), 1, [])
+        info.layers.clear()
+        assert info.top_layer is None
+        assert len(stack) == 1
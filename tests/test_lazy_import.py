@@ -0,0 +1,75 @@
+"""Tests for lazily imported modules in the sandbox."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from _aegis_game.sandbox import core as core_module
+from _aegis_game.sandbox.core import LumenCore
+from _aegis_game.sandbox.lazy_import import LazyModule
+from _aegis_game.sandbox.sandbox import Sandbox
+from _aegis_game.sandbox.scheduler import TurnScheduler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+HEAVY = """
+import time
+
+time.sleep(0.3)
+ANSWER = 42
+"""
+
+AGENT = """
+import heavy_module
+
+
+def think() -> None:
+    record(heavy_module.ANSWER)
+"""
+
+
+def _install_heavy_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _ = (tmp_path / "heavy_module.py").write_text(HEAVY)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "heavy_module", raising=False)
+    monkeypatch.setattr(
+        core_module, "ALLOWED_MODULES", core_module.ALLOWED_MODULES | {"heavy_module"}
+    )
+    monkeypatch.setattr(core_module, "LAZY_MODULES", frozenset({"heavy_module"}))
+
+
+def test_module_is_imported_on_first_use(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a lazy module is only imported once an attribute is used."""
+    _install_heavy_module(tmp_path, monkeypatch)
+    module = LazyModule("heavy_module")
+    assert "heavy_module" not in sys.modules
+
+    assert module.ANSWER == 42  # noqa: PLR2004
+    assert "heavy_module" in sys.modules
+    assert "ANSWER" in vars(module)
+
+
+def test_import_time_is_charged_to_setup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that importing a lazy module doesn't count against the turn deadline."""
+    _install_heavy_module(tmp_path, monkeypatch)
+    scheduler = TurnScheduler(deadline=0.2)
+    code = Sandbox.from_directory_dict({"main.py": AGENT})
+    records: list[int] = []
+    errors: list[str] = []
+    core = LumenCore(code, {"record": records.append}, errors.append, scheduler)
+
+    core.run()
+    scheduler.shutdown()
+
+    assert errors == []
+    assert records == [42]
+    assert not core.timed_out
+    assert core.setup_time >= 0.3  # noqa: PLR2004
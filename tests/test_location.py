@@ -139,3 +139,36 @@ class TestOrderingComparisons:
         assert c >= b
         assert a <= Location(0, 0)
         assert b >= Location(1, 0)
+
+
+class TestInterning:
+    """Tests for interned, immutable locations."""
+
+    def test_locations_on_interned_world_are_shared(self) -> None:
+        """Test that locations inside an interned world are reused."""
+        Location.intern(4, 4)
+        assert Location(2, 3) is Location(2, 3)
+        assert Location(1, 1).add(Direction.NORTH) is Location(1, 2)
+
+    def test_locations_outside_interned_world_are_new(self) -> None:
+        """Test that locations off the interned world are still created."""
+        Location.intern(4, 4)
+        loc = Location(-1, 2)
+        assert loc == Location(-1, 2)
+        assert loc is not Location(-1, 2)
+
+    def test_table_follows_the_world_size(self) -> None:
+        """Test that interning a smaller world drops the previous world's cells."""
+        Location.intern(6, 6)
+        kept = Location(1, 1)
+        Location.intern(3, 3)
+        assert Location(1, 1) is kept
+        assert Location(4, 4) is not Location(4, 4)
+        Location.intern(4, 4)
+
+    def test_location_is_immutable(self) -> None:
+        """Test that a location's coordinates cannot be changed."""
+        loc = Location(1, 1)
+        with pytest.raises(AttributeError):
+            loc.x = 2  # pyright: ignore[reportAttributeAccessIssue]
+        assert loc == Location(1, 1)
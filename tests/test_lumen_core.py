@@ -0,0 +1,184 @@
+"""Tests for the LumenCore class."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+from _aegis_game.sandbox.core import LumenCore, MainTemplate
+from _aegis_game.sandbox.sandbox import Sandbox
+
+AGENT = """
+seen = []
+
+
+def think() -> None:
+    seen.append(get_id())
+    record(list(seen))
+"""
+
+
+def test_agents_spawned_from_template_are_isolated() -> None:
+    """Test that agents sharing the namespace template keep their own state."""
+    code = Sandbox.from_directory_dict({"main.py": AGENT})
+    records: list[list[int]] = []
+    cores = [
+        LumenCore(
+            code,
+            {"get_id": lambda agent_id=agent_id: agent_id, "record": records.append},
+            records.append,
+        )
+        for agent_id in (1, 2)
+    ]
+    for core in cores * 2:
+        core.run()
+
+    assert records == [[1], [2], [1, 1], [2, 2]]
+    builtins = [core.namespace["__builtins__"] for core in cores]
+    assert builtins[0] is not builtins[1]
+
+
+CLONED = """
+import math
+
+setup(math.pi)
+seen = []
+limits = {"most": 2}
+
+
+def remember(agent_id, into=seen):
+    into.append(agent_id)
+    return into[-limits["most"]:]
+
+
+def think() -> None:
+    record(remember(get_id()))
+"""
+
+
+class Controller:
+    """Stands in for an agent controller, its methods are bound per agent."""
+
+    def __init__(self, agent_id: int) -> None:
+        """Initialize the controller of an agent."""
+        self.agent_id: int = agent_id
+
+    def get_id(self) -> int:
+        """Return the agent's id."""
+        return self.agent_id
+
+
+def test_main_module_is_executed_once_per_template() -> None:
+    """Test that agents cloned from a main template keep their own state."""
+    code = Sandbox.from_directory_dict({"main.py": CLONED})
+    main = MainTemplate()
+    setups: list[float] = []
+    records: list[list[int]] = []
+    cores = [
+        LumenCore(
+            code,
+            {
+                "get_id": Controller(agent_id).get_id,
+                "record": records.append,
+                "setup": setups.append,
+            },
+            records.append,
+            main=main,
+        )
+        for agent_id in (1, 2, 3)
+    ]
+    for core in cores * 2:
+        core.run()
+
+    assert len(setups) == 1
+    assert records == [[1], [2], [3], [1, 1], [2, 2], [3, 3]]
+    remember = [core.namespace["remember"] for core in cores]
+    assert remember[0] is not remember[1]
+    assert remember[1].__globals__ is cores[1].namespace  # pyright: ignore[reportFunctionMemberAccess]
+
+
+AGENT_SPECIFIC = """
+setup("main")
+me = get_id()
+
+
+def think() -> None:
+    record(me)
+"""
+
+
+def test_agent_specific_main_module_is_executed_per_agent() -> None:
+    """Test that a main module calling the agent API isn't cloned or run twice."""
+    code = Sandbox.from_directory_dict({"main.py": AGENT_SPECIFIC})
+    main = MainTemplate()
+    setups: list[str] = []
+    records: list[int] = []
+    errors: list[str] = []
+    cores = [
+        LumenCore(
+            code,
+            {
+                "get_id": Controller(agent_id).get_id,
+                "record": records.append,
+                "setup": setups.append,
+            },
+            errors.append,
+            main=main,
+        )
+        for agent_id in (1, 2)
+    ]
+    for core in cores:
+        core.run()
+
+    assert errors == []
+    assert setups == ["main", "main"]
+    assert records == [1, 2]
+
+
+def test_extensions_can_import_their_helpers() -> None:
+    """Test that C extensions get their loaded helpers, but agent imports don't."""
+    loaded = importlib.import_module("numpy._core._methods")
+    methods = LumenCore.custom_import("numpy._core._methods", None, None, [])
+    assert methods is loaded
+    with pytest.raises(ImportError):
+        _ = LumenCore.custom_import("numpy._core._methods")
+    with pytest.raises(ImportError):
+        _ = LumenCore.custom_import("ctypes", None, None, [])
+
+
+REDUCTION = """
+from _aegis_game.sandbox.core import LumenCore
+from _aegis_game.sandbox.sandbox import Sandbox
+
+AGENT = '''
+import numpy as np
+
+
+def think() -> None:
+    record(int(np.ones(3).sum()))
+'''
+
+records = []
+core = LumenCore(
+    Sandbox.from_directory_dict({"main.py": AGENT}), {"record": records.append}, print
+)
+core.run()
+print(records)
+"""
+
+
+def test_agents_can_reduce_arrays() -> None:
+    """Test that an agent's first array reduction isn't refused by the import hook."""
+    # numpy only imports the helper the first time a process reduces an array
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", REDUCTION],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    assert result.stdout.strip() == "[3]"
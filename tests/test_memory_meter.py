@@ -0,0 +1,70 @@
+"""Tests for accounting the memory agents allocate."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from _aegis_game.sandbox.core import LumenCore
+from _aegis_game.sandbox.memory import BYTES_PER_MB, MemoryMeter
+from _aegis_game.sandbox.sandbox import Sandbox
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+HOARDING_AGENT = """
+kept = []
+
+
+def think() -> None:
+    kept.append([0] * 200_000)
+"""
+
+LEAN_AGENT = """
+def think() -> None:
+    total = sum([0] * 200_000)
+"""
+
+
+@pytest.fixture
+def memory() -> Iterator[MemoryMeter]:
+    """Provide a meter with a 16 MB quota that is closed after the test."""
+    memory = MemoryMeter(16)
+    yield memory
+    memory.close()
+
+
+def make_core(source: str, memory: MemoryMeter, errors: list[str]) -> LumenCore:
+    """Build a core that accounts its memory with the given meter."""
+    code = Sandbox.from_directory_dict({"main.py": source})
+    return LumenCore(code, {}, errors.append, memory=memory)
+
+
+def test_memory_is_charged_to_the_agent_that_keeps_it(memory: MemoryMeter) -> None:
+    """Test that memory an agent keeps adds up over its turns, and freed memory doesn't."""
+    errors: list[str] = []
+    hoarder = make_core(HOARDING_AGENT, memory, errors)
+    lean = make_core(LEAN_AGENT, memory, errors)
+
+    for _ in range(3):
+        hoarder.run_inline()
+        lean.run_inline()
+
+    assert hoarder.memory_held > 3 * BYTES_PER_MB
+    assert lean.memory_held < BYTES_PER_MB
+    # the lean agent's list only lived during its turn, it still shows in its peak
+    assert lean.memory_peak > BYTES_PER_MB
+    assert errors == []
+
+
+def test_agent_over_quota_is_reported(memory: MemoryMeter) -> None:
+    """Test that an agent whose memory peaks over the quota reports an error."""
+    errors: list[str] = []
+    hoarder = make_core(HOARDING_AGENT, memory, errors)
+
+    while not errors:
+        hoarder.run_inline()
+
+    assert hoarder.memory_peak > memory.quota
+    assert errors[0].endswith("over its 16 MB memory quota")
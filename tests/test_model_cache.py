@@ -0,0 +1,81 @@
+"""Tests for the cache of models agents load."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from _aegis_game.agent_predictions.model_cache import ModelCache, resolve_agent_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CountingLoader:
+    """Stands in for Keras and counts the files it loads."""
+
+    def __init__(self) -> None:
+        """Initialize with no loads."""
+        self.loads: list[str] = []
+
+    def __call__(self, path: Path) -> object:
+        """Load a fake model."""
+        self.loads.append(path.name)
+        return object()
+
+
+def write_model(path: Path, mtime: int) -> Path:
+    """Write a model file with a known modification time."""
+    _ = path.write_bytes(b"weights")
+    os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+def test_model_is_loaded_once_until_it_changes(tmp_path: Path) -> None:
+    """Test that every caller shares one load of an unchanged model file."""
+    loader = CountingLoader()
+    cache = ModelCache(loader=loader)
+    path = write_model(tmp_path / "net.keras", 1_000_000_000)
+
+    first = cache.get(path)
+    assert cache.get(tmp_path / "." / "net.keras") is first
+    assert loader.loads == ["net.keras"]
+
+    _ = write_model(path, 2_000_000_000)
+    assert cache.get(path) is not first
+    assert loader.loads == ["net.keras", "net.keras"]
+
+
+def test_least_recently_used_model_is_evicted(tmp_path: Path) -> None:
+    """Test that the cache holds at most its capacity of models."""
+    loader = CountingLoader()
+    cache = ModelCache(capacity=2, loader=loader)
+    a, b, c = (write_model(tmp_path / name, 1) for name in ("a", "b", "c"))
+
+    _ = cache.get(a), cache.get(b), cache.get(a), cache.get(c)
+    _ = cache.get(a), cache.get(b)
+
+    assert loader.loads == ["a", "b", "c", "b"]
+
+
+def test_unloadable_model_raises_value_error(tmp_path: Path) -> None:
+    """Test that a file the loader can't load is reported as a ValueError."""
+    cache = ModelCache()
+    # looks like a zip archive to NumPy, which raises BadZipFile for it
+    path = tmp_path / "net.npz"
+    _ = path.write_bytes(b"PK\x03\x04weights")
+
+    with pytest.raises(ValueError, match=r"Unable to load model net\.npz"):
+        _ = cache.get(path)
+
+
+def test_paths_outside_agent_directory_are_refused(tmp_path: Path) -> None:
+    """Test that an agent can't load files from outside its own directory."""
+    agent = tmp_path / "agents" / "agent_prediction"
+    agent.mkdir(parents=True)
+
+    assert resolve_agent_file(agent, "net.keras") == (agent / "net.keras").resolve()
+    with pytest.raises(ValueError, match="outside the agent's directory"):
+        _ = resolve_agent_file(agent, "../other/net.keras")
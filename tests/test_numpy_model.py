@@ -0,0 +1,86 @@
+"""Tests for running exported prediction models with NumPy."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from _aegis_game.agent_predictions.model_cache import ModelCache
+from _aegis_game.agent_predictions.numpy_model import Dense, NumpyModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+
+class Flatten:
+    """Stands in for a Keras Flatten layer."""
+
+
+class FakeDense:
+    """Stands in for a Keras Dense layer."""
+
+    def __init__(self, kernel: NDArray[np.float32], activation: str) -> None:
+        """Keep the layer's weights."""
+        self.kernel: NDArray[np.float32] = kernel
+        self.bias: NDArray[np.float32] = np.linspace(-1, 1, kernel.shape[1]).astype(
+            np.float32
+        )
+        self.activation: str = activation
+
+    def get_weights(self) -> list[NDArray[np.float32]]:
+        """Return the kernel and bias, like Keras."""
+        return [self.kernel, self.bias]
+
+    def get_config(self) -> dict[str, str]:
+        """Return the layer config, like Keras."""
+        return {"activation": self.activation}
+
+
+FakeDense.__name__ = "Dense"
+
+
+class FakeKerasModel:
+    """Stands in for a Keras `Flatten -> Dense -> Dense` model."""
+
+    def __init__(self) -> None:
+        """Build the layers with random weights."""
+        rng = np.random.default_rng(0)
+        self.layers: list[object] = [
+            Flatten(),
+            FakeDense(rng.normal(size=(16, 8)).astype(np.float32), "relu"),
+            FakeDense(rng.normal(size=(8, 3)).astype(np.float32), "softmax"),
+        ]
+
+
+def reference(model: FakeKerasModel, x: NDArray[np.uint8]) -> NDArray[np.float32]:
+    """Run the fake Keras model the slow, obvious way."""
+    _, hidden, output = model.layers
+    assert isinstance(hidden, FakeDense)
+    assert isinstance(output, FakeDense)
+    h = np.maximum(x.reshape(len(x), -1) @ hidden.kernel + hidden.bias, 0)
+    logits = h @ output.kernel + output.bias
+    return np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+
+
+def test_exported_model_matches_keras_model(tmp_path: Path) -> None:
+    """Test that an exported model predicts the same as the model it came from."""
+    keras_model = FakeKerasModel()
+    images = np.random.default_rng(1).integers(0, 4, (5, 4, 4), dtype=np.uint8)
+    path = tmp_path / "net.npz"
+
+    NumpyModel.from_keras(keras_model).save(path)
+    model = ModelCache().get(path)
+
+    assert isinstance(model, NumpyModel)
+    np.testing.assert_allclose(model(images), reference(keras_model, images), rtol=1e-5)
+
+
+def test_unsupported_model_is_rejected() -> None:
+    """Test that layers the runtime can't run are refused instead of skipped."""
+    kernel = np.zeros((2, 2), dtype=np.float32)
+    with pytest.raises(ValueError, match="Unsupported activation"):
+        _ = NumpyModel([Dense(kernel, kernel[0], "gelu")])
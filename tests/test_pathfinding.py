@@ -0,0 +1,170 @@
+"""Tests for the PathFinder class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from _aegis_game import pathfinding
+from _aegis_game.aegis_config import Features
+from _aegis_game.agent import Agent
+from _aegis_game.agent_controller import AgentController
+from _aegis_game.agent_type import AgentType
+from _aegis_game.args_parser import LaunchArgs
+from _aegis_game.common import Cell, Direction, Location
+from _aegis_game.game import Game
+from _aegis_game.game_pb import GamePb
+from _aegis_game.pathfinding import BLOCKED, PathFinder, known_move_costs
+from _aegis_game.team import Team
+from _aegis_game.types import CellType
+from _aegis_game.world import World
+
+if TYPE_CHECKING:
+    import pytest
+
+WIDTH = 5
+HEIGHT = 3
+
+
+def path_cost(
+    costs: list[int], width: int, start: Location, path: list[Direction]
+) -> int:
+    """Add up the energy a path costs, moving into a cell costs its move cost."""
+    total = 0
+    loc = start
+    for direction in path:
+        loc = loc.add(direction)
+        total += costs[loc.x + loc.y * width]
+    return total
+
+
+def test_path_avoids_expensive_cells() -> None:
+    """Test that the path goes around a wall of expensive cells."""
+    # 3x3 world, the middle column costs 10 except at the top
+    costs = [1, 10, 1, 1, 10, 1, 1, 1, 1]
+    path = PathFinder(3).path(
+        Team.GOOBS,
+        0,
+        lambda: np.array(costs, dtype=np.int32),
+        Location(0, 0),
+        Location(2, 0),
+    )
+    assert path is not None
+    assert path_cost(costs, 3, Location(0, 0), path) == 4  # noqa: PLR2004
+
+
+def test_path_to_own_location_is_empty() -> None:
+    """Test that an agent already at the goal gets an empty path."""
+    costs = np.ones(9, dtype=np.int32)
+    finder = PathFinder(3)
+    assert (
+        finder.path(Team.GOOBS, 0, lambda: costs, Location(1, 1), Location(1, 1)) == []
+    )
+
+
+def test_unreachable_goal() -> None:
+    """Test that a goal walled off by killer cells can't be reached."""
+    costs = np.array([1, BLOCKED, 1, 1, BLOCKED, 1, 1, BLOCKED, 1], dtype=np.int32)
+    finder = PathFinder(3)
+    assert (
+        finder.path(Team.GOOBS, 0, lambda: costs, Location(0, 0), Location(2, 2))
+        is None
+    )
+
+
+def test_search_is_reused_until_revision_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that searches are cached per owner and revision of known costs."""
+    searches: list[int] = []
+    search = pathfinding._next_cells  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def counted(costs: list[int], width: int, goal: int) -> list[int]:
+        searches.append(goal)
+        return search(costs, width, goal)
+
+    monkeypatch.setattr(pathfinding, "_next_cells", counted)
+    finder = PathFinder(3)
+    costs = np.ones(9, dtype=np.int32)
+    for start in (Location(0, 0), Location(1, 0)):
+        _ = finder.path(Team.GOOBS, 0, lambda: costs, start, Location(2, 2))
+    assert len(searches) == 1
+
+    _ = finder.path(Team.VOIDSEERS, 0, lambda: costs, Location(0, 0), Location(2, 2))
+    costs[4] = 5
+    # the costs aren't looked at until the revision changes
+    _ = finder.path(Team.GOOBS, 0, lambda: costs, Location(0, 0), Location(2, 2))
+    assert len(searches) == 2  # noqa: PLR2004
+    _ = finder.path(Team.GOOBS, 1, lambda: costs, Location(0, 0), Location(2, 2))
+    assert len(searches) == 3  # noqa: PLR2004
+
+
+def make_game() -> tuple[Game, AgentController]:
+    """Build a game with hidden move costs and an agent at (0, 0)."""
+    cells = [Cell(x, y) for y in range(HEIGHT) for x in range(WIDTH)]
+    cells[0].type = CellType.SPAWN_CELL
+    # the middle column is expensive except at the bottom
+    cells[2].move_cost = 9
+    cells[2 + WIDTH].move_cost = 9
+    world = World(WIDTH, HEIGHT, 0, 100, cells, {Location(0, 0): 1})
+    args = LaunchArgs(
+        amount=1,
+        world=["test"],
+        rounds=1,
+        agent=None,
+        agent2=None,
+        client=False,
+        debug=False,
+        log=False,
+    )
+    features = Features(hidden_move_costs=True, allow_pathfinding=True)
+    game = Game([None, None], args, world, GamePb(), features)
+    agent = Agent(game, 1, Location(0, 0), Team.GOOBS, 100, AgentType.COMMANDER)
+    game.add_agent(agent, agent.location)
+    game.mark_surrounding_cells_visited(agent, agent.location)
+    world.commit()
+    return game, AgentController(game, agent, features)
+
+
+def test_search_is_redone_once_cells_are_revealed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that visiting new cells bumps the revision the agent's searches use."""
+    searches: list[int] = []
+    search = pathfinding._next_cells  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def counted(costs: list[int], width: int, goal: int) -> list[int]:
+        searches.append(goal)
+        return search(costs, width, goal)
+
+    monkeypatch.setattr(pathfinding, "_next_cells", counted)
+    game, controller = make_game()
+    agent = game.get_agent(1)
+    goal = Location(WIDTH - 1, 0)
+    revision = game.visited_revision(agent)
+
+    _ = controller.get_path_to(goal)
+    game.mark_surrounding_cells_visited(agent, Location(1, 0))
+    assert game.visited_revision(agent) == revision + 1
+    # every cell around the agent's start is visited already
+    game.mark_surrounding_cells_visited(agent, Location(0, 0))
+    assert game.visited_revision(agent) == revision + 1
+    path = controller.get_path_to(goal)
+    _ = controller.get_path_to(goal)
+
+    assert len(searches) == 2  # noqa: PLR2004
+    assert path is not None
+    costs = game.current_world.move_costs.tolist()
+    assert path_cost(costs, WIDTH, agent.location, path) == 4  # noqa: PLR2004
+
+
+def test_known_move_costs_hide_unvisited_cells() -> None:
+    """Test that unvisited cells cost 1 and killer cells are blocked."""
+    move_costs = np.array([3, 4, 5, 6], dtype=np.int32)
+    cell_types = np.array(
+        [CellType.NORMAL_CELL.value, CellType.KILLER_CELL.value, 0, 0], dtype=np.int8
+    )
+    visited = np.array([[True, True], [False, False]])
+    costs = known_move_costs(move_costs, cell_types, visited)
+    assert costs.tolist() == [3, BLOCKED, 1, 1]
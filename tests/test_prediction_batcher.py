@@ -0,0 +1,68 @@
+"""Tests for batching a team's pending predictions through its model."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from _aegis_game.agent_predictions.batcher import PredictionBatcher
+from _aegis_game.agent_predictions.model_cache import ModelCache
+from _aegis_game.team import Team
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+LABELS = np.arange(3, dtype=np.int32)
+
+
+class SumModel:
+    """Stands in for a model, scores an image by its sum and records each batch."""
+
+    def __init__(self) -> None:
+        """Initialize with no batches run."""
+        self.batches: list[int] = []
+
+    def __call__(self, batch: NDArray[np.uint8]) -> NDArray[np.float32]:
+        """Score every image in the batch."""
+        self.batches.append(len(batch))
+        return batch.sum(axis=(1, 2)).reshape(-1, 1).astype(np.float32)
+
+
+def image(value: int) -> NDArray[np.uint8]:
+    """Make a 2x2 image filled with a value."""
+    return np.full((2, 2), value, dtype=np.uint8)
+
+
+def test_pending_predictions_run_in_one_batch(tmp_path: Path) -> None:
+    """Test that a team's images are run together and shared by its agents."""
+    model = SumModel()
+    path = tmp_path / "net.keras"
+    _ = path.write_bytes(b"weights")
+    batcher = PredictionBatcher(ModelCache(loader=lambda _: model))
+    pending = [(1, image(1), LABELS), (2, image(2), LABELS)]
+
+    first = batcher.run(Team.GOOBS, path, pending)
+    second = batcher.run(Team.GOOBS, path, pending)
+
+    assert [(surv_id, float(output[0])) for surv_id, output in first] == [
+        (1, 4.0),
+        (2, 8.0),
+    ]
+    assert [surv_id for surv_id, _ in second] == [1, 2]
+    assert model.batches == [2]
+
+    # only the newly pending image runs, the predicted one is forgotten
+    third = batcher.run(
+        Team.GOOBS, path, [(2, image(2), LABELS), (3, image(3), LABELS)]
+    )
+    assert [(surv_id, float(output[0])) for surv_id, output in third] == [
+        (2, 8.0),
+        (3, 12.0),
+    ]
+    assert model.batches == [2, 1]
+
+    _ = batcher.run(Team.VOIDSEERS, path, pending)
+    assert model.batches == [2, 1, 2]
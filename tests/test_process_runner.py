@@ -0,0 +1,191 @@
+"""Tests for playing agent turns in worker processes."""
+
+from __future__ import annotations
+
+import inspect
+import multiprocessing
+
+import pytest
+
+from _aegis_game.aegis_config import Features
+from _aegis_game.agent import Agent
+from _aegis_game.agent_controller import AgentController, AgentError
+from _aegis_game.agent_type import AgentType
+from _aegis_game.args_parser import LaunchArgs
+from _aegis_game.common.cell import Cell
+from _aegis_game.common.direction import Direction
+from _aegis_game.common.location import Location
+from _aegis_game.common.objects import Rubble, Survivor
+from _aegis_game.game import Game
+from _aegis_game.game_pb import GamePb
+from _aegis_game.process_runner.controller import (
+    RemoteAgentController,
+    SnapshotReader,
+    TurnInput,
+)
+from _aegis_game.process_runner.snapshot import WorldSnapshot
+from _aegis_game.sandbox.sandbox import Sandbox
+from _aegis_game.team import Team
+from _aegis_game.types import CellType
+from _aegis_game.world import World
+
+AGENT = """
+from aegis_game.stub import *
+
+
+def think() -> None:
+    loc = get_location()
+    top = get_cell_info_at(loc).top_layer
+    if isinstance(top, Survivor):
+        save()
+    elif isinstance(top, Rubble):
+        dig()
+    elif get_cell_info_at(loc.add(Direction.EAST)).is_killer_cell():
+        move(Direction.NORTH)
+    else:
+        move(Direction.EAST)
+    log(get_round_number(), get_energy_level(), len(get_survs()))
+"""
+
+RANDOM_AGENT = """
+import random
+
+from aegis_game.stub import *
+
+
+def think() -> None:
+    move(random.choice([Direction.NORTH, Direction.EAST, Direction.CENTER]))
+    log(random.random())
+"""
+
+
+class EventRecorder:
+    """Stands in for the websocket server and keeps every event."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.events: list[bytes] = []
+
+    def add_event(self, event: bytes) -> None:
+        """Keep the event."""
+        self.events.append(event)
+
+
+def make_world() -> World:
+    """Build a small world with rubble and survivors along the agents' path."""
+    cells = [Cell(x, y) for y in range(4) for x in range(6)]
+    cells[0].type = CellType.SPAWN_CELL
+    cells[2].add_layer(Rubble(1, 5, 1))
+    cells[2].add_layer(Survivor(2, 10))
+    cells[4].type = CellType.KILLER_CELL
+    cells[9].add_layer(Survivor(3, 10))
+    world = World(6, 4, 0, 100, cells, {Location(0, 0): 2})
+    world.rounds = 20
+    return world
+
+
+def make_args(
+    workers: int = 0, amount: int = 2, agent: str | None = "test"
+) -> LaunchArgs:
+    """Build the launch arguments of a test game."""
+    return LaunchArgs(
+        amount=amount,
+        world=["test"],
+        rounds=20,
+        agent=agent,
+        agent2=None,
+        client=False,
+        debug=False,
+        log=False,
+        workers=workers,
+    )
+
+
+def play(workers: int, agent: str = AGENT) -> list[bytes]:
+    """Play a game and return the events it emitted."""
+    recorder = EventRecorder()
+    game_pb = GamePb()
+    game_pb.ws_server = recorder  # pyright: ignore[reportAttributeAccessIssue]
+    code = Sandbox.from_directory_dict({"main.py": agent})
+    game = Game([code, None], make_args(workers), make_world(), game_pb, Features())
+    try:
+        while game.running:
+            game.run_round()
+    finally:
+        game.stop()
+    return recorder.events
+
+
+def test_workers_replay_matches_in_process_game() -> None:
+    """Test that a game played in worker processes emits the same events."""
+    assert play(workers=1) == play(workers=0)
+
+
+def test_random_agents_replay_the_same_with_workers() -> None:
+    """Test that agents in workers draw the same random numbers whatever the count."""
+    assert play(workers=2, agent=RANDOM_AGENT) == play(workers=1, agent=RANDOM_AGENT)
+
+
+def test_failed_game_setup_stops_the_workers() -> None:
+    """Test that a game whose agents can't spawn doesn't leave workers running."""
+    code = Sandbox.from_directory_dict({"main.py": AGENT})
+    with pytest.raises(ValueError, match="Not enough agents"):
+        _ = Game([code, None], make_args(workers=1, amount=1), make_world(), GamePb())
+    assert not multiprocessing.active_children()
+
+
+def test_failed_actions_are_not_replayed() -> None:
+    """Test that only actions that succeeded in the worker become intents."""
+    game = Game([None, None], make_args(agent=None), make_world(), GamePb(), Features())
+    agent = Agent(game, 1, Location(0, 0), Team.GOOBS, 100, AgentType.COMMANDER)
+    game.add_agent(agent, agent.location)
+    agent.action_cooldown = 0
+    snapshot = WorldSnapshot.create(game, 1)
+    try:
+        snapshot.publish(game)
+        remote = RemoteAgentController(
+            SnapshotReader(snapshot, game.features),
+            agent.id,
+            agent.slot,
+            agent.team,
+            agent.type,
+            1,
+        )
+        remote.begin_turn(TurnInput(agent.id))
+        with pytest.raises(AgentError, match="off the map"):
+            remote.move(Direction.WEST)
+        remote.move(Direction.EAST)
+    finally:
+        snapshot.unlink()
+    assert remote.result.intents == [("move", (Direction.EAST,))]
+
+
+def test_remote_api_matches_game_methods() -> None:
+    """Test that agents in workers get the same API as agents in the game process."""
+    game = Game([None, None], make_args(agent=None), make_world(), GamePb(), Features())
+    agent = Agent(game, 1, Location(0, 0), Team.GOOBS, 100, AgentType.COMMANDER)
+    local = game.methods(AgentController(game, agent, game.features))
+
+    snapshot = WorldSnapshot.create(game, 1)
+    try:
+        reader = SnapshotReader(snapshot, game.features)
+        remote = RemoteAgentController(
+            reader, agent.id, agent.slot, agent.team, agent.type, 1
+        ).methods()
+    finally:
+        snapshot.unlink()
+    assert list(remote) == list(local)
+    for name, value in local.items():
+        if isinstance(value, type):
+            assert remote[name] is value
+            continue
+        # annotations aren't compared, they are strings in one of the modules
+        local_parameters = [
+            (p.name, p.kind, p.default)
+            for p in inspect.signature(value).parameters.values()
+        ]
+        remote_parameters = [
+            (p.name, p.kind, p.default)
+            for p in inspect.signature(remote[name]).parameters.values()
+        ]
+        assert remote_parameters == local_parameters, name
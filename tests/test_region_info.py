@@ -0,0 +1,127 @@
+"""Tests for observing a region of the world in one call."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from _aegis_game.aegis_config import Features
+from _aegis_game.agent import Agent
+from _aegis_game.agent_controller import AgentController, AgentError
+from _aegis_game.agent_type import AgentType
+from _aegis_game.args_parser import LaunchArgs
+from _aegis_game.common.cell import Cell
+from _aegis_game.common.location import Location
+from _aegis_game.common.objects import Rubble, Survivor
+from _aegis_game.common.region_info import RegionInfo
+from _aegis_game.game import Game
+from _aegis_game.game_pb import GamePb
+from _aegis_game.process_runner.controller import (
+    RemoteAgentController,
+    SnapshotReader,
+    TurnInput,
+)
+from _aegis_game.process_runner.snapshot import WorldSnapshot
+from _aegis_game.team import Team
+from _aegis_game.types import CellType
+from _aegis_game.world import World
+
+WIDTH = 6
+HEIGHT = 4
+
+
+def make_game() -> tuple[Game, Agent]:
+    """Build a game with hidden move costs, a drone scan and three agents."""
+    cells = [Cell(x, y) for y in range(HEIGHT) for x in range(WIDTH)]
+    cells[0].type = CellType.SPAWN_CELL
+    cells[2].add_layer(Rubble(1, 5, 1))
+    cells[4].type = CellType.KILLER_CELL
+    cells[8].move_cost = 5
+    cells[9].add_layer(Survivor(2, 10))
+    cells[23].move_cost = 7
+    world = World(WIDTH, HEIGHT, 0, 100, cells, {Location(0, 0): 2})
+    args = LaunchArgs(
+        amount=2,
+        world=["test"],
+        rounds=1,
+        agent=None,
+        agent2=None,
+        client=False,
+        debug=False,
+        log=False,
+    )
+    game = Game([None, None], args, world, GamePb(), Features(hidden_move_costs=True))
+    agent = Agent(game, 1, Location(1, 1), Team.GOOBS, 100, AgentType.COMMANDER)
+    game.add_agent(agent, agent.location)
+    game.mark_surrounding_cells_visited(agent, agent.location)
+    far = Agent(game, 2, Location(4, 3), Team.GOOBS, 100, AgentType.COMMANDER)
+    game.add_agent(far, far.location)
+    hidden = Agent(game, 3, Location(3, 2), Team.GOOBS, 100, AgentType.COMMANDER)
+    game.add_agent(hidden, hidden.location)
+    game.start_drone_scan(Location(4, 3), Team.GOOBS)
+    game.activate_pending_drone_scans()
+    world.commit()
+    return game, agent
+
+
+def test_region_matches_cell_info() -> None:
+    """Test that a region tells what `get_cell_info_at` tells of each cell."""
+    game, agent = make_game()
+    controller = AgentController(game, agent, game.features)
+    region = controller.get_region_info(Location(0, 0), Location(WIDTH - 1, HEIGHT - 1))
+
+    for y in range(HEIGHT):
+        for x in range(WIDTH):
+            cell = controller.get_cell_info_at(Location(x, y))
+            assert region.move_costs[y, x] == cell.move_cost
+            assert region.cell_types[y, x] == cell.type.value
+            assert region.agent_counts[y, x] == len(cell.agents)
+            top = cell.top_layer
+            assert region.survivor_cells()[y, x] == isinstance(top, Survivor)
+            assert region.rubble_cells()[y, x] == isinstance(top, Rubble)
+    assert region.agent_counts.sum() == 2  # noqa: PLR2004
+
+
+def test_workers_see_the_same_region() -> None:
+    """Test that agents in worker processes get the same region."""
+    game, agent = make_game()
+    local = AgentController(game, agent, game.features).get_region_info(
+        Location(1, 0), Location(WIDTH - 1, HEIGHT - 1)
+    )
+
+    snapshot = WorldSnapshot.create(game, 3)
+    try:
+        snapshot.publish(game)
+        remote = RemoteAgentController(
+            SnapshotReader(snapshot, game.features),
+            agent.id,
+            agent.slot,
+            agent.team,
+            agent.type,
+            3,
+        )
+        remote.begin_turn(TurnInput(agent.id))
+        region = remote.get_region_info(Location(1, 0), Location(WIDTH - 1, HEIGHT - 1))
+    finally:
+        snapshot.unlink()
+
+    for name in RegionInfo.__slots__:
+        if name != "location":
+            assert np.array_equal(getattr(region, name), getattr(local, name))
+
+
+def test_default_region_is_the_neighborhood() -> None:
+    """Test that without corners the region is the agent's surroundings."""
+    game, agent = make_game()
+    agent.location = Location(0, 0)
+    region = AgentController(game, agent, game.features).get_region_info()
+    assert region.location == Location(0, 0)
+    assert (region.width, region.height) == (2, 2)
+
+
+def test_swapped_corners_are_rejected() -> None:
+    """Test that the first corner must have the lowest x and y."""
+    game, agent = make_game()
+    controller = AgentController(game, agent, game.features)
+    with pytest.raises(AgentError):
+        _ = controller.get_region_info(Location(2, 2), Location(1, 1))
@@ -0,0 +1,124 @@
+"""Tests for the knowledge a team's agents pool together."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from _aegis_game.aegis_config import Features
+from _aegis_game.agent import Agent
+from _aegis_game.agent_controller import AgentController, AgentError
+from _aegis_game.agent_type import AgentType
+from _aegis_game.args_parser import LaunchArgs
+from _aegis_game.common.cell import Cell
+from _aegis_game.common.location import Location
+from _aegis_game.common.objects import Rubble, Survivor
+from _aegis_game.common.team_knowledge import TeamKnowledge
+from _aegis_game.game import Game
+from _aegis_game.game_pb import GamePb
+from _aegis_game.process_runner.controller import (
+    RemoteAgentController,
+    SnapshotReader,
+    TurnInput,
+)
+from _aegis_game.process_runner.snapshot import WorldSnapshot
+from _aegis_game.team import Team
+from _aegis_game.types import CellType
+from _aegis_game.world import World
+
+WIDTH = 6
+HEIGHT = 4
+
+
+def make_game(features: Features | None = None) -> tuple[Game, Agent]:
+    """Build a game with hidden move costs, a drone scan and an agent."""
+    cells = [Cell(x, y) for y in range(HEIGHT) for x in range(WIDTH)]
+    cells[0].type = CellType.SPAWN_CELL
+    cells[2].add_layer(Rubble(1, 5, 1))
+    cells[8].move_cost = 5
+    cells[9].add_layer(Survivor(2, 10))
+    cells[23].move_cost = 7
+    world = World(WIDTH, HEIGHT, 0, 100, cells, {Location(0, 0): 2})
+    args = LaunchArgs(
+        amount=2,
+        world=["test"],
+        rounds=1,
+        agent=None,
+        agent2=None,
+        client=False,
+        debug=False,
+        log=False,
+    )
+    if features is None:
+        features = Features(hidden_move_costs=True, allow_team_knowledge=True)
+    game = Game([None, None], args, world, GamePb(), features)
+    agent = Agent(game, 1, Location(1, 1), Team.GOOBS, 100, AgentType.COMMANDER)
+    game.add_agent(agent, agent.location)
+    game.mark_surrounding_cells_visited(agent, agent.location)
+    game.start_drone_scan(Location(4, 3), Team.GOOBS)
+    game.activate_pending_drone_scans()
+    world.commit()
+    return game, agent
+
+
+def test_knowledge_is_read_only() -> None:
+    """Test that agents can't write to their team's knowledge."""
+    game, agent = make_game()
+    knowledge = AgentController(game, agent, game.features).get_team_knowledge()
+
+    for name in TeamKnowledge.__slots__:
+        array = getattr(knowledge, name)
+        with pytest.raises(ValueError, match="read-only"):
+            array[0, 0] = 0
+        with pytest.raises(ValueError, match="WRITEABLE"):
+            array.flags.writeable = True
+
+
+def test_knowledge_updates_in_place() -> None:
+    """Test that knowledge handed out earlier shows what the team learns later."""
+    game, agent = make_game()
+    knowledge = AgentController(game, agent, game.features).get_team_knowledge()
+    assert not knowledge.visited.any()
+    assert knowledge.move_costs[1, 2] == 1
+
+    game.update_team_knowledge()
+
+    assert knowledge.visited[:3, :3].all()
+    assert np.count_nonzero(knowledge.visited) == 9  # noqa: PLR2004
+    assert knowledge.scanned[3, 4]
+    assert np.count_nonzero(knowledge.scanned) == 1
+    # the cost of a visited cell is revealed, unvisited ones stay hidden
+    assert knowledge.move_costs[1, 2] == 5  # noqa: PLR2004
+    assert knowledge.move_costs[3, 5] == 1
+    assert knowledge.top_layer_kinds[0, 2] == 2  # noqa: PLR2004
+    assert knowledge.top_layer_kinds[1, 3] == 1
+
+
+def test_workers_see_the_same_knowledge() -> None:
+    """Test that agents in worker processes get the same knowledge."""
+    game, agent = make_game()
+    game.update_team_knowledge()
+    local = AgentController(game, agent, game.features).get_team_knowledge()
+
+    snapshot = WorldSnapshot.create(game, 1)
+    try:
+        snapshot.publish(game)
+        reader = SnapshotReader(snapshot, game.features)
+        remote = RemoteAgentController(
+            reader, agent.id, agent.slot, agent.team, agent.type, 1
+        )
+        remote.begin_turn(TurnInput(agent.id))
+        knowledge = remote.get_team_knowledge()
+        for name in TeamKnowledge.__slots__:
+            assert np.array_equal(getattr(knowledge, name), getattr(local, name))
+        with pytest.raises(ValueError, match="read-only"):
+            knowledge.visited[0, 0] = False
+    finally:
+        snapshot.unlink()
+
+
+def test_knowledge_requires_the_feature() -> None:
+    """Test that the command is only available with ALLOW_TEAM_KNOWLEDGE."""
+    game, agent = make_game(Features(hidden_move_costs=True))
+    with pytest.raises(AgentError):
+        _ = AgentController(game, agent, game.features).get_team_knowledge()
@@ -0,0 +1,230 @@
+"""Tests for the TurnScheduler class."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+from _aegis_game.aegis_config import Features
+from _aegis_game.agent import Agent
+from _aegis_game.agent_controller import AgentController
+from _aegis_game.agent_type import AgentType
+from _aegis_game.args_parser import LaunchArgs
+from _aegis_game.common import Cell, Location
+from _aegis_game.game import Game
+from _aegis_game.game_pb import GamePb
+from _aegis_game.sandbox.core import AgentStoppedError, LumenCore
+from _aegis_game.sandbox.meter import code_objects
+from _aegis_game.sandbox.sandbox import Sandbox
+from _aegis_game.sandbox.scheduler import TurnScheduler
+from _aegis_game.team import Team
+from _aegis_game.types import CellType
+from _aegis_game.world import World
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def make_game() -> tuple[Game, AgentController]:
+    """Build a game with an agent at (0, 0) that is off cooldown."""
+    cells = [Cell(x, y) for y in range(3) for x in range(3)]
+    cells[0].type = CellType.SPAWN_CELL
+    world = World(3, 3, 0, 100, cells, {Location(0, 0): 1})
+    args = LaunchArgs(
+        amount=1,
+        world=["test"],
+        rounds=1,
+        agent=None,
+        agent2=None,
+        client=False,
+        debug=False,
+        log=False,
+    )
+    game = Game([None, None], args, world, GamePb(), Features())
+    agent = Agent(game, 1, Location(0, 0), Team.GOOBS, 100, AgentType.COMMANDER)
+    game.add_agent(agent, agent.location)
+    agent.action_cooldown = 0
+    return game, AgentController(game, agent, game.features)
+
+
+AGENT = """
+turns = 0
+
+
+def think() -> None:
+    global turns
+    turns += 1
+    record(turns)
+"""
+
+
+def test_turns_run_on_pool_threads() -> None:
+    """Test that a turn is played on a pool thread and waited for."""
+    scheduler = TurnScheduler()
+    seen: list[str] = []
+    scheduler.run(lambda: seen.append(threading.current_thread().name))
+    scheduler.shutdown()
+    assert len(seen) == 1
+    assert seen[0].startswith("lumen")
+
+
+def test_thread_count_does_not_grow_with_agents() -> None:
+    """Test that many agents share the scheduler's threads."""
+    scheduler = TurnScheduler()
+    code = Sandbox.from_directory_dict({"main.py": AGENT})
+    counts: list[int] = []
+    errors: list[str] = []
+    cores = [
+        LumenCore(code, {"record": counts.append}, errors.append, scheduler)
+        for _ in range(50)
+    ]
+    before = threading.active_count()
+    for _ in range(3):
+        for core in cores:
+            core.run()
+    after = threading.active_count()
+    for core in cores:
+        core.kill()
+    scheduler.shutdown()
+
+    assert errors == []
+    assert counts == [1] * 50 + [2] * 50 + [3] * 50
+    assert after - before <= 1
+
+
+RUNAWAY = """
+def think() -> None:
+    try:
+        while True:
+            pass
+    except:
+        while True:
+            pass
+"""
+
+
+def test_runaway_turn_is_stopped_at_deadline() -> None:
+    """Test that an endless turn is stopped and the scheduler keeps playing turns."""
+    scheduler = TurnScheduler(deadline=0.2)
+    errors: list[str] = []
+    runaway = LumenCore(
+        Sandbox.from_directory_dict({"main.py": RUNAWAY}), {}, errors.append, scheduler
+    )
+    counts: list[int] = []
+    agent = LumenCore(
+        Sandbox.from_directory_dict({"main.py": AGENT}),
+        {"record": counts.append},
+        errors.append,
+        scheduler,
+    )
+
+    runaway.run()
+    agent.run()
+    scheduler.shutdown()
+
+    assert runaway.timed_out
+    assert not agent.timed_out
+    assert errors == ["Turn stopped after exceeding the 0.2s deadline"]
+    assert counts == [1]
+
+
+def test_stalled_turn_is_abandoned() -> None:
+    """Test that a turn stuck outside agent code is abandoned at the deadline."""
+    scheduler = TurnScheduler(deadline=0.1)
+    release = threading.Event()
+    seen: list[str] = []
+
+    assert not scheduler.run(release.wait)
+    assert scheduler.run(lambda: seen.append(threading.current_thread().name))
+    release.set()
+    scheduler.shutdown()
+    assert seen == ["lumen_1"]
+
+
+STALLED = """
+def think() -> None:
+    block()
+"""
+
+
+def test_abandoned_turn_is_watched_until_it_unwinds() -> None:
+    """Test that an abandoned turn keeps its instruction events until it ends."""
+    scheduler = TurnScheduler(deadline=0.1)
+    release = threading.Event()
+    code = Sandbox.from_directory_dict({"main.py": STALLED})
+    threads: list[threading.Thread] = []
+
+    def block() -> None:
+        threads.append(threading.current_thread())
+        _ = release.wait()
+
+    errors: list[str] = []
+    stalled = LumenCore(code, {"block": block}, errors.append, scheduler)
+
+    stalled.run()
+    tool = next(
+        tool for tool in range(6) if sys.monitoring.get_tool(tool) == "aegis watchdog"
+    )
+    watched = [
+        sys.monitoring.get_local_events(tool, code_object)
+        for code_object in code_objects(code)
+    ]
+    release.set()
+    threads[0].join()
+    unwound = [
+        sys.monitoring.get_local_events(tool, code_object)
+        for code_object in code_objects(code)
+    ]
+    scheduler.shutdown()
+
+    assert stalled.timed_out
+    assert errors == ["Turn stopped after exceeding the 0.1s deadline"]
+    assert all(watched)
+    assert unwound == [0] * len(unwound)
+
+
+KEEPS_MOVING = """
+def think() -> None:
+    keep_calling(move, Direction.EAST)
+"""
+
+
+def test_abandoned_turn_cannot_act() -> None:
+    """Test that a turn calling the API after it was abandoned changes nothing."""
+    game, controller = make_game()
+    agent = game.get_agent(1)
+    scheduler = TurnScheduler(deadline=0.1)
+    release = threading.Event()
+    threads: list[threading.Thread] = []
+    refused: list[Exception] = []
+
+    def keep_calling(method: Callable[..., object], *args: object) -> None:
+        # runs no agent code, only the API can refuse the calls
+        threads.append(threading.current_thread())
+        _ = release.wait()
+        for _ in range(10):
+            try:
+                _ = method(*args)
+            except AgentStoppedError as e:
+                refused.append(e)
+
+    errors: list[str] = []
+    core = LumenCore(
+        Sandbox.from_directory_dict({"main.py": KEEPS_MOVING}),
+        {**game.methods(controller), "keep_calling": keep_calling},
+        errors.append,
+        scheduler,
+    )
+    core.run()
+    release.set()
+    threads[0].join()
+    scheduler.shutdown()
+
+    assert core.timed_out
+    assert len(refused) == 10  # noqa: PLR2004
+    assert agent.location == Location(0, 0)
+    assert agent.energy_level == 100  # noqa: PLR2004
+    assert agent.action_cooldown == 0
+    assert game.get_cell_at_next(Location(0, 0)).agents == [1]
+    assert game.get_cell_at_next(Location(1, 0)).agents == []
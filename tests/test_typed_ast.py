@@ -0,0 +1,47 @@
+"""Tests for the RestrictedPython policy agent code is compiled with."""
+
+from __future__ import annotations
+
+from types import CodeType
+
+from _aegis_game.sandbox.core import LumenCore
+from _aegis_game.sandbox.sandbox import Sandbox
+
+
+def names(source: str) -> tuple[str, ...]:
+    """Compile a `think` function and return the names its body uses."""
+    code = Sandbox.from_directory_dict({"main.py": source})["main"]
+    (think,) = (const for const in code.co_consts if isinstance(const, CodeType))
+    return think.co_names
+
+
+def test_static_accesses_skip_guards() -> None:
+    """Test that public constant attributes and keys compile to plain operations."""
+    used = names(
+        """
+def think(grid, loc) -> None:
+    return grid[3][-1], grid[0][1:], grid[0, 1], grid["cost"], loc.x
+"""
+    )
+
+    assert "_getattr_" not in used
+    assert "_getitem_" not in used
+
+
+def test_dynamic_keys_keep_guard() -> None:
+    """Test that keys only known at runtime are still checked."""
+    used = names(
+        """
+def think(grid, key) -> None:
+    return grid[key], grid["_private"]
+"""
+    )
+
+    assert "_getitem_" in used
+
+    errors: list[str] = []
+    code = Sandbox.from_directory_dict(
+        {"main.py": 'def think() -> None:\n    key = "_x"\n    _ = {"_x": 1}[key]\n'}
+    )
+    LumenCore(code, {}, errors.append).run_inline()
+    assert "Access to private key '_x' is denied." in errors[0]
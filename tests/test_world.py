@@ -0,0 +1,119 @@
+"""Tests for the World class."""
+
+from __future__ import annotations
+
+from _aegis_game.common.cell import Cell
+from _aegis_game.common.location import Location
+from _aegis_game.common.objects import Rubble, Survivor
+from _aegis_game.types import CellType, LayerKind
+from _aegis_game.world import World
+
+
+def make_world(width: int = 3, height: int = 3) -> World:
+    """Build an empty world with one cell per location."""
+    cells = [Cell(x, y) for y in range(height) for x in range(width)]
+    return World(width, height, 0, 100, cells, {})
+
+
+class TestCopyOnWrite:
+    """Tests for staging next-round cells and committing them."""
+
+    def test_staged_cell_is_materialized_once(self) -> None:
+        """Test that repeated writes to the same index reuse one staged cell."""
+        world = make_world()
+        staged = world.get_staged_cell(4)
+        assert staged is not world.get_cell(4)
+        assert world.get_staged_cell(4) is staged
+
+    def test_writes_are_hidden_until_commit(self) -> None:
+        """Test that agent changes only become visible after commit."""
+        world = make_world()
+        world.get_staged_cell(4).agents.append(7)
+        assert world.get_cell(4).agents == []
+
+        world.commit()
+        assert world.get_cell(4).agents == [7]
+
+    def test_commit_only_replaces_touched_cells(self) -> None:
+        """Test that untouched cells keep their identity across a commit."""
+        world = make_world()
+        before = list(world.cells)
+        world.get_staged_cell(0).agents.append(1)
+        world.commit()
+        assert world.get_cell(0) is not before[0]
+        assert all(a is b for a, b in zip(world.cells[1:], before[1:], strict=True))
+
+    def test_staged_cell_shares_layers(self) -> None:
+        """Test that layer changes on the committed cell are seen by the staged cell."""
+        world = make_world()
+        world.get_cell(2).add_layer(Survivor(1, 10))
+        staged = world.get_staged_cell(2)
+        _ = world.get_cell(2).remove_top_layer()
+        assert len(staged.layers) == 0
+
+
+class TestArrays:
+    """Tests for the structure-of-arrays view of the cells."""
+
+    def test_arrays_mirror_cells(self) -> None:
+        """Test that the arrays are built from the cells at construction time."""
+        cells = [Cell(x, y) for y in range(3) for x in range(3)]
+        cells[1].set_charging_cell()
+        cells[4].move_cost = 5
+        cells[4].add_layer(Rubble(1, 3, 2))
+        cells[4].add_layer(Survivor(2, 40))
+        world = World(3, 3, 0, 100, cells, {})
+
+        assert world.cell_types[1] == CellType.CHARGING_CELL.value
+        assert world.move_costs[4] == 5  # noqa: PLR2004
+        assert world.layer_counts[4] == 2  # noqa: PLR2004
+        assert world.top_layer_kinds[4] == LayerKind.RUBBLE.value
+        assert world.top_rubble_agents[4] == 2  # noqa: PLR2004
+        assert world.total_survivors == 1
+        assert list(world.indices_of_type(CellType.CHARGING_CELL)) == [1]
+
+    def test_remove_top_layer_updates_arrays(self) -> None:
+        """Test that removing a layer refreshes the arrays of that cell."""
+        world = make_world()
+        world.get_cell(4).add_layer(Rubble(1, 3, 2))
+        world.get_cell(4).add_layer(Survivor(2, 40))
+        world.update_cell(4)
+        assert world.survivor_counts[4] == 1
+
+        world.remove_top_layer(4)
+        assert world.top_layer_kinds[4] == LayerKind.SURVIVOR.value
+        assert world.top_survivor_health[4] == 40  # noqa: PLR2004
+
+        world.remove_top_layer(4)
+        assert world.top_layer_kinds[4] == LayerKind.NONE.value
+        assert world.survivor_counts[4] == 0
+
+
+class TestLocationIndexes:
+    """Tests for the cached survivor, charging and spawn location indexes."""
+
+    def test_static_indexes(self) -> None:
+        """Test that charging and spawn locations are collected once."""
+        cells = [Cell(x, y) for y in range(3) for x in range(3)]
+        cells[2].set_charging_cell()
+        cells[6].set_spawn_cell()
+        world = World(3, 3, 0, 100, cells, {})
+
+        assert world.charging_locations() == (Location(2, 0),)
+        assert world.spawn_locations() == (Location(0, 2),)
+        assert world.is_spawn_location(Location(0, 2))
+        assert not world.is_spawn_location(Location(2, 0))
+
+    def test_survivor_index_follows_layer_removal(self) -> None:
+        """Test that the survivor locations are cached and refreshed on change."""
+        cells = [Cell(x, y) for y in range(3) for x in range(3)]
+        cells[5].add_layer(Survivor(1, 10))
+        cells[1].add_layer(Survivor(2, 10))
+        world = World(3, 3, 0, 100, cells, {})
+
+        survs = world.survivor_locations()
+        assert survs == (Location(1, 0), Location(2, 1))
+        assert world.survivor_locations() is survs
+
+        world.remove_top_layer(1)
+        assert world.survivor_locations() == (Location(2, 1),)